@@ -5,9 +5,11 @@ and registers blueprints, error handlers, and context processors.
 """
 
 import os
+import stat
 import datetime
 import logging
 from flask import Flask, render_template
+from jinja2 import FileSystemBytecodeCache
 
 # Import config dictionary from the config module
 from .config import config
@@ -90,6 +92,10 @@ def create_app(config_name=None):
         if hasattr(config[config_name], 'init_app'):
             config[config_name].init_app(app)
 
+    # Serialize JSON responses with orjson when it is installed
+    from .utils.json_provider import init_json_provider
+    init_json_provider(app)
+
     # Initialize extensions (Database, Services, Plugins)
     # This needs the app context to be available for extensions that require it.
     with app.app_context():
@@ -104,6 +110,9 @@ def create_app(config_name=None):
     # Register context processors for templates
     register_context_processors(app)
 
+    # Cache compiled templates across processes and restarts
+    configure_template_cache(app)
+
     # Register shell context for `flask shell`
     register_shell_context(app)
 
@@ -249,6 +258,58 @@ def register_context_processors(app):
     app.logger.info("Context processors registered.")
 
 
+def configure_template_cache(app):
+    """
+    Enable Jinja2's on-disk bytecode cache for compiled templates.
+
+    Templates are compiled once and reused by later processes and restarts
+    instead of being parsed again on first render. Jinja2 recompiles a
+    template automatically when its source changes. Disabled when
+    JINJA_BYTECODE_CACHE is false.
+
+    Cached bytecode is executed when templates load, so the directory must
+    not be writable by other users. Without JINJA_BYTECODE_CACHE_DIR, Jinja2
+    creates and checks its own private (0700) per-user temporary directory.
+    A configured directory is created with mode 0700 and refused unless it is
+    owned by the current user and not writable by group or others.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if not app.config.get('JINJA_BYTECODE_CACHE'):
+        app.logger.info("Jinja bytecode cache disabled.")
+        return
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            _check_private_dir(cache_dir)
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        else:
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+            cache_dir = app.jinja_env.bytecode_cache.directory
+        app.logger.info(f"Jinja bytecode cache enabled at: {cache_dir}")
+    except (OSError, RuntimeError) as e:
+        app.logger.warning(f"Could not enable Jinja bytecode cache at {cache_dir}: {e}")
+
+
+def _check_private_dir(path):
+    """
+    Ensure a cache directory cannot be written by other users.
+
+    Args:
+        path (str): The directory to check.
+
+    Raises:
+        OSError: If the directory is owned by another user or is writable by group or others.
+    """
+    st = os.stat(path)
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        raise OSError(f"{path} is not owned by the current user")
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise OSError(f"{path} is writable by group or others")
+
+
 def register_shell_context(app):
     """
     Register a shell context processor for the Flask CLI shell (`flask shell`).
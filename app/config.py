@@ -42,6 +42,14 @@ class Config:
         'token_lifetime': timedelta(hours=int(os.environ.get('TOKEN_LIFETIME_HOURS', '12')))  # For user session tokens
     }
 
+    # On-disk cache for compiled Jinja2 template bytecode. Without a directory,
+    # Jinja2's private per-user temporary directory is used.
+    JINJA_BYTECODE_CACHE = os.environ.get('JINJA_BYTECODE_CACHE', 'true').lower() in ('true', '1', 'yes')
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR') or None
+
+    # How long generated PDF/HTML reports are reused for identical report content
+    REPORT_CACHE_TTL = timedelta(days=int(os.environ.get('REPORT_CACHE_TTL_DAYS', '7')))
+
     # Logging Configuration (basic, can be expanded)
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
 
@@ -90,6 +98,7 @@ class TestingConfig(Config):
     SERVER_NAME = 'localhost.test'  # Helps url_for generate URLs correctly in tests
     TEMPLATES_AUTO_RELOAD = True
     LOG_LEVEL = 'DEBUG'  # Or 'ERROR' if too much test noise
+    JINJA_BYTECODE_CACHE = False  # Keep test runs from sharing compiled templates
 
     # Override OAuth credentials for testing (can be dummy values if OAuth flow is mocked)
     AUTH = {
@@ -401,9 +401,10 @@ def properties():
         # Get all properties from database
         properties = Property.find_all(current_app.database, order_by="property_name ASC")
         
-        # Add website information to each property
+        # Add website information to each property (single query for all websites)
+        websites_by_property = Website.find_all_grouped_by_property(current_app.database)
         for prop in properties:
-            prop.websites = prop.get_websites()
+            prop.websites = websites_by_property.get(prop.id, [])
         
         # Get sync service for summary
         sync_service = get_service('property_sync')
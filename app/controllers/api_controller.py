@@ -73,7 +73,7 @@ def get_properties():
         formatted_properties = []
         for prop in properties:
             # Extract relevant fields
-            property_id = prop.get('name', '').split('/')[-1]
+            property_id = prop.get('name', '').rsplit('/', 1)[-1]
             formatted_properties.append({
                 'id': property_id,
                 'displayName': prop.get('displayName', ''),
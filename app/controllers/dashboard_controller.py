@@ -43,7 +43,7 @@ def index():
         # Get active users count for each property
         active_users = {}
         for prop in properties:
-            property_id = prop.get('name', '').split('/')[-1]  # Extract ID from "properties/123456"
+            property_id = prop.get('name', '').rsplit('/', 1)[-1]  # Extract ID from "properties/123456"
             if property_id:
                 active_users[property_id] = ga4_service.get_realtime_users(property_id)
         
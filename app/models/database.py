@@ -18,6 +18,11 @@ class Database:
     execute queries, and handle transactions.
     """
 
+    # Number of prepared statements sqlite3 keeps per connection (the module default is 128).
+    # Model queries are built from fixed templates, so each distinct SQL string is compiled
+    # once per connection and reused afterwards instead of being re-prepared on every call.
+    STATEMENT_CACHE_SIZE = 512
+
     def __init__(self, db_path):
         """
         Initialize the Database manager.
@@ -43,7 +48,11 @@ class Database:
         """
         if not hasattr(self._local, 'connection') or self._local.connection is None:
             try:
-                self._local.connection = sqlite3.connect(self.db_path, check_same_thread=False)  # check_same_thread=False for Flask
+                self._local.connection = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,  # check_same_thread=False for Flask
+                    cached_statements=self.STATEMENT_CACHE_SIZE
+                )
                 self._local.connection.row_factory = sqlite3.Row  # Access columns by name
                 self._local.connection.execute("PRAGMA foreign_keys = ON;")  # Enable foreign key constraints
                 logger.debug(f"New SQLite connection established for thread {threading.get_ident()} to {self.db_path}")
@@ -106,6 +115,20 @@ class Database:
             """)
             logger.debug("Table 'websites' ensured.")
 
+            # Property and Website lookup indexes
+            # Websites are always fetched per parent property; this also keeps the
+            # ON DELETE CASCADE from properties from scanning the whole table.
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_websites_property_db_id
+            ON websites (property_db_id);
+            """)
+            # Partial index: account lookups never match NULL, so those rows are left out
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_properties_account_id
+            ON properties (account_id) WHERE account_id IS NOT NULL;
+            """)
+            logger.debug("Indexes on 'properties' and 'websites' ensured.")
+
             # Reports Table (metadata for generated reports)
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS reports (
@@ -134,12 +157,31 @@ class Database:
                 dimension_name TEXT,
                 dimension_value TEXT,
                 data_date TEXT,                     -- Date for which this data point is relevant (YYYY-MM-DD)
-                timestamp TEXT NOT NULL,            -- When this record was saved (ISO 8601)
+                timestamp TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')), -- When this record was saved (ISO 8601)
                 FOREIGN KEY (report_db_id) REFERENCES reports (id) ON DELETE CASCADE
             );
             """)
             logger.debug("Table 'report_data' ensured.")
 
+            # Report Data Indexes
+            # Lookups by property and date read the metric name/value pairs straight from
+            # the index (SQLite has no INCLUDE, so metric_value is a trailing key column).
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_report_data_property_date
+            ON report_data (property_ga4_id, data_date, metric_name, metric_value);
+            """)
+            # Per-report reads and deletes, in the order they are returned
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_report_data_report
+            ON report_data (report_db_id, timestamp, id);
+            """)
+            # Per-report metric time series, aggregated from the index alone
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_report_data_report_metric
+            ON report_data (report_db_id, metric_name, data_date, metric_value);
+            """)
+            logger.debug("Indexes on 'report_data' ensured.")
+
             # Users Table
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS users (
@@ -202,9 +244,8 @@ class Database:
                 # sqlite3.Row can be converted to dict: dict(row) if row else None
                 return dict(row) if row else None
             if fetchall:
-                rows = cursor.fetchall()
-                # Convert list of sqlite3.Row to list of dicts
-                return [dict(row) for row in rows]
+                # Convert rows to dicts straight off the cursor, without an intermediate list of sqlite3.Row
+                return [dict(row) for row in cursor]
 
             return cursor  # Return cursor for more complex operations if needed (e.g., lastrowid)
         except sqlite3.Error as e:
@@ -213,6 +254,75 @@ class Database:
                 conn.rollback()
             raise  # Re-raise the exception to be handled by the caller
 
+    def iterate(self, query, params=None, batch_size=500):
+        """
+        Executes a query and yields its rows one at a time as dictionaries.
+        Rows are pulled from SQLite in batches of `batch_size`, so memory use is bounded
+        by the batch rather than the full result set as with fetchall=True.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (tuple, optional): A tuple of parameters to substitute into the query. Defaults to None.
+            batch_size (int, optional): Number of rows fetched from SQLite at a time. Defaults to 500.
+
+        Yields:
+            dict: One row of the result set.
+
+        Raises:
+            sqlite3.Error: If an error occurs during query execution.
+        """
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            logger.debug(f"Executing streamed query: {query} with params: {params}")
+            cursor.execute(query, params or ())
+        except sqlite3.Error as e:
+            logger.error(f"Database query execution failed: {query} - {params} - {e}", exc_info=True)
+            raise
+
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cursor.close()
+
+    def executemany(self, query, seq_of_params, commit=False):
+        """
+        Executes a parameterized SQL statement once for each parameter tuple.
+        Much cheaper than calling execute() in a loop for bulk inserts, since the
+        statement is prepared once and, with commit=True, committed once.
+
+        Args:
+            query (str): The SQL statement to execute.
+            seq_of_params (iterable): An iterable of parameter tuples.
+            commit (bool, optional): Whether to commit after all rows are executed. Defaults to False.
+
+        Returns:
+            int: The total number of rows affected.
+
+        Raises:
+            sqlite3.Error: If an error occurs during execution.
+        """
+        conn = self._get_connection()
+        try:
+            logger.debug(f"Executing batched query: {query}")
+            cursor = conn.executemany(query, seq_of_params)
+
+            if commit:
+                conn.commit()
+                logger.debug("Batched query committed.")
+
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Database batched execution failed: {query} - {e}", exc_info=True)
+            if commit:  # Only rollback if we intended to commit but failed
+                conn.rollback()
+            raise  # Re-raise the exception to be handled by the caller
+
     def transaction(self):
         """
         Provides a context manager for database transactions.
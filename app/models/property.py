@@ -175,6 +175,108 @@ class Property(BaseModel):
         results = cls.find_all(database_instance, filters={'property_id': ga4_property_id}, limit=1)
         return results[0] if results else None
 
+    @classmethod
+    def get_id_map(cls, database_instance) -> dict:
+        """
+        Loads the mapping of GA4 Property IDs to internal database IDs in a single query.
+
+        Args:
+            database_instance (Database): The database instance.
+
+        Returns:
+            dict: GA4 Property ID (e.g., 'properties/12345') -> internal database ID.
+        """
+        rows = database_instance.execute("SELECT id, property_id FROM properties", fetchall=True)
+        return {row['property_id']: row['id'] for row in rows}
+
+    @classmethod
+    def find_by_ids(cls, database_instance, record_ids) -> dict:
+        """
+        Loads several properties by internal database ID in a single query.
+        Use this instead of calling `find_by_id()` for each ID in a list.
+
+        Args:
+            database_instance (Database): The database instance.
+            record_ids (Iterable[int]): Internal database IDs to load.
+
+        Returns:
+            dict: Internal database ID -> Property instance. IDs that do not exist have no entry.
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return {}
+        placeholders = ', '.join('?' * len(record_ids))
+        logger.debug(f"Finding {len(record_ids)} properties by ID")
+        rows = database_instance.execute(
+            f"SELECT * FROM properties WHERE id IN ({placeholders})", tuple(record_ids), fetchall=True
+        )
+        return {row['id']: cls._from_db_row(row, database_instance) for row in rows}
+
+    @classmethod
+    def delete_many(cls, database_instance, record_ids) -> int:
+        """
+        Deletes several properties by internal database ID with one statement and a single commit.
+        Their websites are removed by the `ON DELETE CASCADE` foreign key.
+
+        Args:
+            database_instance (Database): The database instance.
+            record_ids (Iterable[int]): Internal database IDs to delete.
+
+        Returns:
+            int: Number of properties deleted.
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        if not record_ids:
+            return 0
+        placeholders = ', '.join('?' * len(record_ids))
+        logger.debug(f"Deleting {len(record_ids)} properties by ID")
+        cursor = database_instance.execute(
+            f"DELETE FROM properties WHERE id IN ({placeholders})", tuple(record_ids), commit=True
+        )
+        return cursor.rowcount
+
+    @classmethod
+    def upsert_many(cls, database_instance, properties, update_existing: bool = True) -> int:
+        """
+        Inserts or updates many properties with one batched statement and a single commit.
+
+        Uses SQLite's `INSERT ... ON CONFLICT(property_id)` so each property is written
+        without first being looked up. On conflict the name and account are refreshed and
+        the update time is replaced when a new one is given (the create time is kept),
+        matching what `save()` does for an existing record.
+
+        Args:
+            database_instance (Database): The database instance.
+            properties (Iterable[Property]): Property instances to write. Their `id` is not populated.
+            update_existing (bool): Whether existing properties are updated or left untouched.
+
+        Returns:
+            int: Number of rows inserted or updated.
+        """
+        params = [
+            (prop.property_id, prop.property_name, prop.account_id,
+             prop._datetime_to_iso(prop.create_time), prop._datetime_to_iso(prop.update_time))
+            for prop in properties
+        ]
+        if not params:
+            return 0
+
+        if update_existing:
+            conflict_action = (
+                "DO UPDATE SET property_name = excluded.property_name, "
+                "account_id = excluded.account_id, "
+                "update_time = COALESCE(excluded.update_time, properties.update_time)"
+            )
+        else:
+            conflict_action = "DO NOTHING"
+
+        logger.debug(f"Upserting {len(params)} properties (update_existing={update_existing})")
+        query = (
+            "INSERT INTO properties (property_id, property_name, account_id, create_time, update_time) "
+            f"VALUES (?, ?, ?, ?, ?) ON CONFLICT(property_id) {conflict_action}"
+        )
+        return database_instance.executemany(query, params, commit=True)
+
     def __repr__(self):
         """
         Provides a developer-friendly string representation of the Property instance.
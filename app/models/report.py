@@ -9,6 +9,13 @@ import json  # For serializing/deserializing parameters
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from .base_model import BaseModel
 
+# Use orjson for parsing parameters when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from .database import Database
 
@@ -34,7 +41,7 @@ class Report(BaseModel):
                      (e.g., 'pending', 'generating', 'completed', 'failed').
         file_path (str): The filesystem path to the generated report file (e.g., a PDF).
     """
-    table_name = 'reports'
+    TABLE_NAME = 'reports'
 
     def __init__(self, 
                  id: Optional[int] = None,
@@ -62,6 +69,44 @@ class Report(BaseModel):
         self.parameters = parameters
         self.status = status
         self.file_path = file_path
+        # (raw JSON string, parsed dict) for the last parameters value parsed
+        self._parameters_cache = None
+
+    def get_parameters(self) -> Dict[str, Any]:
+        """
+        Returns the report parameters as a dictionary.
+
+        The JSON string is parsed once and cached; the cache is reused for as long
+        as `parameters` holds the same string, so repeated calls during report
+        generation do not re-parse it. The returned dict is shared and should be
+        treated as read-only; use `set_parameters` to change it.
+
+        Returns:
+            Dictionary of report parameters (empty if none are set)
+
+        Raises:
+            ValueError: If the stored parameters are not valid JSON
+        """
+        if not self.parameters:
+            return {}
+        cache = self._parameters_cache
+        if cache is None or cache[0] is not self.parameters:
+            parsed = orjson.loads(self.parameters) if ORJSON_AVAILABLE else json.loads(self.parameters)
+            cache = self._parameters_cache = (self.parameters, parsed)
+        return cache[1]
+
+    def set_parameters(self, parameters: Dict[str, Any]) -> None:
+        """
+        Serializes and stores the report parameters, keeping the parsed cache in sync.
+
+        Args:
+            parameters: Dictionary of parameters used for report generation
+        """
+        if ORJSON_AVAILABLE:
+            self.parameters = orjson.dumps(parameters).decode('utf-8')
+        else:
+            self.parameters = json.dumps(parameters)
+        self._parameters_cache = (self.parameters, parameters)
 
     def to_dict(self, exclude_params: bool = False) -> dict:
         """
@@ -149,6 +194,39 @@ class Report(BaseModel):
 
         return self.save() > 0  # save() returns ID > 0 if successful
 
+    @classmethod
+    def set_status(cls, database_instance: 'Database', report_id: int, status: str,
+                   message: Optional[str] = None,
+                   file_path: Optional[str] = None) -> int:
+        """
+        Updates the status, file path and status message of a report in one statement.
+
+        The status message is merged into the JSON ``parameters`` column with
+        SQLite's JSON1 functions, so the parameters never round-trip through Python.
+        Parameters that are not valid JSON are replaced by ``{"status_message": ...}``.
+
+        Args:
+            database_instance: The database instance for the update
+            report_id: The ID of the report to update
+            status: The new status for the report
+            message: Optional status message to store under ``status_message``
+            file_path: Optional new file path; the current one is kept when None
+
+        Returns:
+            Number of rows updated (0 if the report does not exist)
+        """
+        query = (
+            f"UPDATE {cls.TABLE_NAME} SET status = ?, "
+            "file_path = COALESCE(?, file_path), "
+            "parameters = CASE "
+            "WHEN ? IS NULL THEN parameters "
+            "WHEN json_valid(parameters) THEN json_set(parameters, '$.status_message', ?) "
+            "ELSE json_object('status_message', ?) END "
+            "WHERE id = ?"
+        )
+        params = (status, file_path, message, message, message, report_id)
+        return database_instance.execute(query, params, commit=True).rowcount
+
     @classmethod
     def find_by_type(cls, report_type: str, limit: int = 50, offset: int = 0) -> List['Report']:
         """
@@ -163,7 +241,7 @@ class Report(BaseModel):
             List of Report instances of the specified type
         """
         logger.debug(f"Finding reports by type: '{report_type}'")
-        query = f"SELECT * FROM {cls.table_name} WHERE report_type = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        query = f"SELECT * FROM {cls.TABLE_NAME} WHERE report_type = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"
         results = cls.execute_query(query, (report_type, limit, offset))
         return [cls.from_dict(row) for row in results]
 
@@ -181,7 +259,7 @@ class Report(BaseModel):
             List of Report instances with the specified status
         """
         logger.debug(f"Finding reports by status: '{status}'")
-        query = f"SELECT * FROM {cls.table_name} WHERE status = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        query = f"SELECT * FROM {cls.TABLE_NAME} WHERE status = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"
         results = cls.execute_query(query, (status, limit, offset))
         return [cls.from_dict(row) for row in results]
 
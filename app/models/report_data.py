@@ -5,8 +5,9 @@ Stores individual data points or metrics associated with a generated Report.
 
 import logging
 import datetime
-from typing import Optional, List, Any, Dict, TYPE_CHECKING
+from typing import Optional, List, Any, Dict, Iterable, Iterator, TYPE_CHECKING
 from .base_model import BaseModel
+from app.utils.formatters import is_average_metric
 
 if TYPE_CHECKING:
     from .report import Report       # pylint: disable=cyclic-import
@@ -35,6 +36,8 @@ class ReportData(BaseModel):
         timestamp (datetime): When this data point was recorded
     """
     table_name = 'report_data'
+    # SQL expression for the current UTC time as an ISO 8601 string
+    TIMESTAMP_DEFAULT_SQL = "strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')"
     
     def __init__(self,
                  id: Optional[int] = None,
@@ -60,7 +63,7 @@ class ReportData(BaseModel):
             dimension_name: The name of the dimension
             dimension_value: The value of the dimension
             data_date: The date this data refers to
-            timestamp: When this data point was recorded
+            timestamp: When this data point was recorded (assigned by the database on insert if None)
             created_at: When this record was created
             updated_at: When this record was last updated
         """
@@ -72,7 +75,8 @@ class ReportData(BaseModel):
         self.dimension_name = dimension_name
         self.dimension_value = dimension_value
         self.data_date = data_date
-        self.timestamp = timestamp if timestamp else datetime.datetime.now(datetime.timezone.utc)
+        # Left unset for new records; the database stamps the row when it is inserted
+        self.timestamp = timestamp
 
     def to_dict(self) -> dict:
         """
@@ -167,6 +171,126 @@ class ReportData(BaseModel):
         results = cls.execute_query(query, (report_id,))
         return [cls.from_dict(row) for row in results]
 
+    @classmethod
+    def iter_by_report_id(cls, database_instance: 'Database', report_id: int) -> Iterator['ReportData']:
+        """
+        Lazily yields the ReportData instances associated with a given Report ID.
+        Unlike `find_by_report_id`, the result set is never materialized as a whole,
+        which keeps memory flat for reports with many data points.
+        
+        Args:
+            database_instance: The Database instance to read from
+            report_id: The ID of the parent Report
+            
+        Yields:
+            ReportData instances in the same order as `find_by_report_id`
+        """
+        if report_id is None:
+            logger.warning("Attempted to iterate report data with a None report_id.")
+            return
+        logger.debug(f"Streaming report data for report_id: {report_id}")
+        query = f"SELECT * FROM {cls.table_name} WHERE report_db_id = ? ORDER BY timestamp ASC, id ASC"
+        for row in database_instance.iterate(query, (report_id,)):
+            yield cls.from_dict(row)
+
+    @classmethod
+    def get_time_series(cls, database_instance: 'Database', report_id: int,
+                        metric_name: str) -> Dict[str, float]:
+        """
+        Aggregates one metric of a report into a per-date series inside SQLite.
+        
+        Args:
+            database_instance: The Database instance to read from
+            report_id: The ID of the parent Report
+            metric_name: The metric to aggregate (e.g., 'sessions')
+            
+        Returns:
+            Dictionary mapping data_date (YYYY-MM-DD) to the aggregated metric value, in date order
+        """
+        if report_id is None or not metric_name:
+            logger.warning("Missing required parameters for get_time_series.")
+            return {}
+        
+        return cls.get_time_series_for_metrics(database_instance, report_id, [metric_name]).get(metric_name, {})
+
+    @classmethod
+    def get_time_series_for_metrics(cls, database_instance: 'Database', report_id: int,
+                                    metric_names: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregates several metrics of a report into per-date series with one grouped query.
+
+        Values sharing a date (e.g. one row per dimension value) are combined by the
+        database, backed by the (report_db_id, metric_name, data_date, metric_value)
+        index, so no rows are materialized or parsed in Python. Rates, percentages,
+        durations and other averages (see `is_average_metric`) are averaged; all
+        other metrics are summed.
+        
+        Args:
+            database_instance: The Database instance to read from
+            report_id: The ID of the parent Report
+            metric_names: The metrics to aggregate (e.g., ['sessions', 'bounceRate'])
+            
+        Returns:
+            Dictionary mapping each metric name to a {data_date: value} series in date order.
+            Metrics without stored values are omitted.
+        """
+        if report_id is None or not metric_names:
+            logger.warning("Missing required parameters for get_time_series_for_metrics.")
+            return {}
+        
+        metric_names = list(dict.fromkeys(metric_names))
+        logger.debug(f"Building time series of {metric_names} for report_id: {report_id}")
+        placeholders = ', '.join('?' for _ in metric_names)
+        query = (
+            "SELECT metric_name, data_date, SUM(CAST(metric_value AS REAL)) AS total, "
+            f"AVG(CAST(metric_value AS REAL)) AS average FROM {cls.table_name} "
+            f"WHERE report_db_id = ? AND metric_name IN ({placeholders}) AND data_date IS NOT NULL "
+            "GROUP BY metric_name, data_date ORDER BY metric_name, data_date ASC"
+        )
+        series: Dict[str, Dict[str, float]] = {}
+        for row in database_instance.iterate(query, (report_id, *metric_names)):
+            metric_name = row['metric_name']
+            column = 'average' if is_average_metric(metric_name) else 'total'
+            series.setdefault(metric_name, {})[row['data_date']] = row[column]
+        return series
+
+    @classmethod
+    def bulk_insert(cls, database_instance: 'Database', records: Iterable['ReportData']) -> int:
+        """
+        Inserts many ReportData records with a single batched statement and one commit.
+
+        Args:
+            database_instance: The Database instance to write to
+            records: ReportData instances to insert (their IDs are not populated)
+            
+        Returns:
+            Number of records inserted
+        """
+        params = [
+            (
+                record.report_db_id,
+                record.property_ga4_id,
+                record.metric_name,
+                record.metric_value,
+                record.dimension_name,
+                record.dimension_value,
+                record.data_date,
+                record._datetime_to_iso(record.timestamp)
+            )
+            for record in records
+        ]
+        if not params:
+            return 0
+        
+        logger.debug(f"Bulk inserting {len(params)} report data records")
+        # Records without a timestamp are stamped by SQLite rather than in Python
+        query = (
+            f"INSERT INTO {cls.table_name} (report_db_id, property_ga4_id, metric_name, metric_value, "
+            "dimension_name, dimension_value, data_date, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, "
+            f"COALESCE(?, {cls.TIMESTAMP_DEFAULT_SQL}))"
+        )
+        return database_instance.executemany(query, params, commit=True)
+
     @classmethod
     def delete_by_report_id(cls, report_id: int) -> int:
         """
@@ -206,6 +330,35 @@ class ReportData(BaseModel):
         results = cls.execute_query(query, (property_id, data_date))
         return [cls.from_dict(row) for row in results]
 
+    @classmethod
+    def find_by_property_and_date_range(cls, property_id: str, start_date: str,
+                                        end_date: str) -> List['ReportData']:
+        """
+        Finds all ReportData instances for a GA4 property ID within an inclusive date range.
+
+        The range is a prefix scan on the (property_ga4_id, data_date, ...) index, so
+        only rows inside the window are visited regardless of how much history is stored.
+        
+        Args:
+            property_id: The GA4 Property ID to filter by
+            start_date: First date to include (YYYY-MM-DD)
+            end_date: Last date to include (YYYY-MM-DD)
+            
+        Returns:
+            List of ReportData instances ordered by date and metric name
+        """
+        if not property_id or not start_date or not end_date:
+            logger.warning("Missing required parameters for find_by_property_and_date_range.")
+            return []
+        
+        logger.debug(f"Finding report data for property_id: '{property_id}' from {start_date} to {end_date}")
+        query = (
+            f"SELECT * FROM {cls.table_name} WHERE property_ga4_id = ? AND data_date BETWEEN ? AND ? "
+            "ORDER BY data_date ASC, metric_name ASC"
+        )
+        results = cls.execute_query(query, (property_id, start_date, end_date))
+        return [cls.from_dict(row) for row in results]
+
     def __repr__(self) -> str:
         """
         Provides a developer-friendly string representation of the ReportData instance.
@@ -5,7 +5,7 @@ Represents a website (often a web data stream in GA4) linked to a GA4 Property.
 
 import logging
 import datetime
-from typing import Optional, List, TYPE_CHECKING  # For type hinting
+from typing import Optional, List, Dict, TYPE_CHECKING  # For type hinting
 from .base_model import BaseModel
 
 # For type hinting related models to avoid circular imports at runtime
@@ -153,6 +153,25 @@ class Website(BaseModel):
         logger.debug(f"Finding websites by parent property_db_id: {property_db_id}")
         return cls.find_all(database_instance, filters={'property_db_id': property_db_id}, order_by="website_url ASC")
 
+    @classmethod
+    def find_all_grouped_by_property(cls, database_instance: 'Database') -> Dict[int, List['Website']]:
+        """
+        Loads every Website in a single query and groups them by parent Property DB ID.
+        Use this instead of calling `Property.get_websites()` for each property in a list,
+        which issues one query per property.
+
+        Args:
+            database_instance (Database): The database instance for the query.
+
+        Returns:
+            Dict[int, List[Website]]: Websites keyed by `property_db_id`, each list ordered by URL.
+                                      Properties without websites have no entry.
+        """
+        grouped: Dict[int, List['Website']] = {}
+        for website in cls.find_all(database_instance, order_by="website_url ASC"):
+            grouped.setdefault(website.property_db_id, []).append(website)
+        return grouped
+
     @classmethod
     def find_by_ga4_website_id(cls, database_instance: 'Database', ga4_website_id: str) -> Optional['Website']:
         """
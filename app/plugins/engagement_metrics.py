@@ -1,11 +1,28 @@
 import logging
+import math
 from typing import Dict, Any, List, Optional
 
 from app.plugins.base_plugin import BasePlugin
 from app.services import get_service
 
+# NumPy is optional; summary statistics fall back to pure Python without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _to_float(value: Any) -> float:
+    """Convert a report value to float, using NaN for missing or non-numeric values."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float('nan')
+
+
 class EngagementMetricsPlugin(BasePlugin):
     """
     Plugin for analyzing and visualizing engagement metrics from GA4.
@@ -185,29 +202,32 @@ class EngagementMetricsPlugin(BasePlugin):
             'trends': {}
         }
         
-        # Calculate averages for summary
-        numeric_fields = {}
-        for row in data:
-            for key, value in row.items():
-                if key != 'date' and key != 'dateRange':
-                    try:
-                        numeric_value = float(value)
-                        if key not in numeric_fields:
-                            numeric_fields[key] = []
-                        numeric_fields[key].append(numeric_value)
-                    except (ValueError, TypeError):
-                        pass
-        
-        # Calculate averages
-        for key, values in numeric_fields.items():
-            if values:
-                result['summary'][f'avg_{key}'] = sum(values) / len(values)
+        if NUMPY_AVAILABLE:
+            numeric_keys = self._summarize_with_numpy(data, result['summary'])
+        else:
+            # Calculate averages for summary
+            numeric_fields = {}
+            for row in data:
+                for key, value in row.items():
+                    if key != 'date' and key != 'dateRange':
+                        try:
+                            numeric_value = float(value)
+                            if key not in numeric_fields:
+                                numeric_fields[key] = []
+                            numeric_fields[key].append(numeric_value)
+                        except (ValueError, TypeError):
+                            pass
+            
+            # Calculate averages; fsum avoids rounding error accumulating over long columns
+            for key, values in numeric_fields.items():
+                result['summary'][f'avg_{key}'] = math.fsum(values) / len(values)
                 result['summary'][f'min_{key}'] = min(values)
                 result['summary'][f'max_{key}'] = max(values)
+            numeric_keys = list(numeric_fields)
         
         # Calculate simple trends (compare first and last values)
         if len(data) >= 2:
-            for key in numeric_fields:
+            for key in numeric_keys:
                 first_value = float(data[0].get(key, 0))
                 last_value = float(data[-1].get(key, 0))
                 
@@ -223,6 +243,42 @@ class EngagementMetricsPlugin(BasePlugin):
         
         return result
     
+    def _summarize_with_numpy(self, data: List[Dict[str, Any]], summary: Dict[str, Any]) -> List[str]:
+        """
+        Add avg/min/max summary values for every numeric field using NumPy.
+        
+        The rows are laid out as one (rows x fields) float matrix and reduced
+        per column in a single call each. Missing or non-numeric cells become
+        NaN and are ignored, matching the pure Python path.
+        
+        Args:
+            data: List of data points from GA4
+            summary: Summary dictionary to populate
+            
+        Returns:
+            Names of the fields that hold at least one numeric value
+        """
+        keys = list(dict.fromkeys(
+            key for row in data for key in row if key != 'date' and key != 'dateRange'
+        ))
+        matrix = np.array([[_to_float(row.get(key)) for key in keys] for row in data],
+                          dtype=np.float64).reshape(len(data), len(keys))
+        
+        has_values = ~np.isnan(matrix).all(axis=0)
+        numeric_keys = [key for key, numeric in zip(keys, has_values.tolist()) if numeric]
+        if not numeric_keys:
+            return []
+        
+        matrix = matrix[:, has_values]
+        averages = np.nanmean(matrix, axis=0).tolist()
+        minimums = np.nanmin(matrix, axis=0).tolist()
+        maximums = np.nanmax(matrix, axis=0).tolist()
+        for key, avg, low, high in zip(numeric_keys, averages, minimums, maximums):
+            summary[f'avg_{key}'] = avg
+            summary[f'min_{key}'] = low
+            summary[f'max_{key}'] = high
+        return numeric_keys
+    
     def _generate_visualizations(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate visualization configurations for the processed data.
@@ -251,15 +307,16 @@ class EngagementMetricsPlugin(BasePlugin):
         if data and len(data) > 0:
             metrics = [key for key in data[0].keys() if key != 'date' and key != 'dateRange']
             
-            for metric in metrics:
-                series = {
-                    'name': metric,
-                    'data': [
-                        {'x': row.get('date', ''), 'y': float(row.get(metric, 0))} 
-                        for row in data
-                    ]
-                }
-                visualizations['primary_chart']['series'].append(series)
+            # Fill every metric's series in a single pass over the rows
+            series_points = {metric: [] for metric in metrics}
+            for row in data:
+                date = row.get('date', '')
+                for metric, points in series_points.items():
+                    points.append({'x': date, 'y': float(row.get(metric, 0))})
+            
+            visualizations['primary_chart']['series'].extend(
+                {'name': metric, 'data': points} for metric, points in series_points.items()
+            )
                 
             # Add table visualization
             if self.config.get('display_tables', True):
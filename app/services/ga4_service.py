@@ -1,6 +1,8 @@
 import logging
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple, Union
 
@@ -36,6 +38,15 @@ class GA4Service:
     - Run various analytics reports
     - Extract and format metrics and dimensions
     """
+    # Upper bound on concurrent API calls fanned out across properties
+    MAX_CONCURRENT_REQUESTS = 8
+    # Largest page the Admin API allows for account summaries
+    ACCOUNT_SUMMARY_PAGE_SIZE = 200
+    # Partial-response masks so the Admin API only returns the fields we read
+    ACCOUNT_SUMMARY_FIELDS = 'accountSummaries(account,displayName,propertySummaries(property,displayName)),nextPageToken'
+    DATA_STREAM_FIELDS = 'dataStreams(type,webStreamData/defaultUri)'
+    PROPERTY_DETAIL_FIELDS = 'createTime,updateTime,displayName'
+    
     def __init__(self, credentials_path: Optional[str] = None, auth_method: Optional[str] = None):
         """
         Initialize the GA4 Service.
@@ -61,6 +72,8 @@ class GA4Service:
         self._admin_service = None
         self._data = None
         self._credentials = None
+        # Per-thread API services for concurrent requests
+        self._thread_local = threading.local()
         
         # Determine authentication method
         if auth_method is None:
@@ -219,9 +232,14 @@ class GA4Service:
             
             # Use the v1alpha admin service to list account summaries
             while True:
-                request = self._admin_service.accountSummaries().list()
+                request = self._admin_service.accountSummaries().list(
+                    pageSize=self.ACCOUNT_SUMMARY_PAGE_SIZE, fields=self.ACCOUNT_SUMMARY_FIELDS
+                )
                 if page_token:
-                    request = self._admin_service.accountSummaries().list(pageToken=page_token)
+                    request = self._admin_service.accountSummaries().list(
+                        pageSize=self.ACCOUNT_SUMMARY_PAGE_SIZE, fields=self.ACCOUNT_SUMMARY_FIELDS,
+                        pageToken=page_token
+                    )
                     
                 response = request.execute()
                 account_summaries = response.get('accountSummaries', [])
@@ -235,7 +253,7 @@ class GA4Service:
                     
                     for property_summary in property_summaries:
                         property_resource = property_summary.get('property', '')
-                        property_id = property_resource.split('/')[-1] if property_resource else ''
+                        property_id = property_resource.rsplit('/', 1)[-1] if property_resource else ''
                         
                         # Initialize property data
                         property_data = {
@@ -249,44 +267,19 @@ class GA4Service:
                             'updateTime': None
                         }
                         
-                        # Get website URL from data streams
-                        try:
-                            # List data streams using v1alpha API
-                            streams_request = self._admin_service.properties().dataStreams().list(
-                                parent=property_resource
-                            )
-                            streams_response = streams_request.execute()
-                            
-                            streams = streams_response.get('dataStreams', [])
-                            for stream in streams:
-                                # Check if this is a web stream
-                                if stream.get('type') == 'WEB_DATA_STREAM':
-                                    web_data = stream.get('webStreamData', {})
-                                    property_data['website_url'] = web_data.get('defaultUri')
-                                    break
-                                    
-                        except Exception as e:
-                            logger.warning(f"Error getting data streams for property {property_resource}: {e}")
-                        
-                        # Try to get additional property details
-                        try:
-                            property_details = self._admin_service.properties().get(
-                                name=property_resource
-                            ).execute()
-                            
-                            if property_details:
-                                property_data['createTime'] = property_details.get('createTime')
-                                property_data['updateTime'] = property_details.get('updateTime')
-                                property_data['display_name'] = property_details.get('displayName', property_data['display_name'])
-                        except Exception as e:
-                            logger.warning(f"Could not get property details for {property_resource}: {e}")
-                        
                         properties.append(property_data)
                 
                 # Check for next page
                 page_token = response.get('nextPageToken')
                 if not page_token:
                     break
+            
+            # Fetch streams and details for all properties concurrently; the
+            # calls are independent and dominated by network latency
+            if properties:
+                max_workers = min(self.MAX_CONCURRENT_REQUESTS, len(properties))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(self._fill_property_details, properties))
                     
             logger.info(f"Found {len(properties)} GA4 properties with details")
             return properties
@@ -295,6 +288,71 @@ class GA4Service:
             logger.error(f"Error listing GA4 properties: {str(e)}", exc_info=True)
             return []
     
+    def _get_thread_service(self, api_name: str, api_version: str) -> Resource:
+        """
+        Get a Google API service for the calling thread.
+        
+        The underlying HTTP client is not thread-safe, so worker threads each
+        build their own services from the shared credentials.
+        
+        Args:
+            api_name: API name (e.g., 'analyticsadmin')
+            api_version: API version (e.g., 'v1alpha')
+            
+        Returns:
+            API service owned by the current thread
+        """
+        services = getattr(self._thread_local, 'services', None)
+        if services is None:
+            services = self._thread_local.services = {}
+        service = services.get((api_name, api_version))
+        if service is None:
+            service = build(api_name, api_version, credentials=self._credentials,
+                            cache_discovery=False)
+            services[(api_name, api_version)] = service
+        return service
+    
+    def _fill_property_details(self, property_data: Dict[str, Any]) -> None:
+        """
+        Add website URL and timestamps to a property dictionary in place.
+        
+        Args:
+            property_data: Property dictionary built from an account summary
+        """
+        admin_service = self._get_thread_service('analyticsadmin', 'v1alpha')
+        property_resource = property_data['property']
+        
+        # Get website URL from data streams
+        try:
+            # List data streams using v1alpha API
+            streams_response = admin_service.properties().dataStreams().list(
+                parent=property_resource, fields=self.DATA_STREAM_FIELDS
+            ).execute()
+            
+            streams = streams_response.get('dataStreams', [])
+            for stream in streams:
+                # Check if this is a web stream
+                if stream.get('type') == 'WEB_DATA_STREAM':
+                    web_data = stream.get('webStreamData', {})
+                    property_data['website_url'] = web_data.get('defaultUri')
+                    break
+                    
+        except Exception as e:
+            logger.warning(f"Error getting data streams for property {property_resource}: {e}")
+        
+        # Try to get additional property details
+        try:
+            property_details = admin_service.properties().get(
+                name=property_resource, fields=self.PROPERTY_DETAIL_FIELDS
+            ).execute()
+            
+            if property_details:
+                property_data['createTime'] = property_details.get('createTime')
+                property_data['updateTime'] = property_details.get('updateTime')
+                property_data['display_name'] = property_details.get('displayName', property_data['display_name'])
+        except Exception as e:
+            logger.warning(f"Could not get property details for {property_resource}: {e}")
+    
     def list_account_summaries(self) -> List[Dict[str, Any]]:
         """
         List all available GA4 account summaries.
@@ -363,7 +421,7 @@ class GA4Service:
                     property_obj = property_summary.copy()
                     
                     # Try to get additional information from data streams
-                    property_id = property_summary.get('property', '').split('/')[-1]
+                    property_id = property_summary.get('property', '').rsplit('/', 1)[-1]
                     if property_id:
                         try:
                             # Get data streams to find website URL
@@ -469,27 +527,7 @@ class GA4Service:
             return {}
             
         try:
-            # Convert date range to API format
-            start_date, end_date = parse_date_range(date_range)
-            date_ranges = [date_range_to_ga4_api_format(start_date, end_date)]
-            
-            # Build metrics list
-            metrics_list = [{'name': metric} for metric in metrics]
-            
-            # Build dimensions list if provided
-            dimensions_list = []
-            if dimensions:
-                dimensions_list = [{'name': dimension} for dimension in dimensions]
-            
-            # Create the report request
-            request_body = {
-                'dateRanges': date_ranges,
-                'metrics': metrics_list,
-                'limit': limit
-            }
-            
-            if dimensions_list:
-                request_body['dimensions'] = dimensions_list
+            request_body = self._build_report_request(metrics, dimensions, date_range, limit)
             
             # Run the report
             response = self._data.properties().runReport(
@@ -504,6 +542,89 @@ class GA4Service:
             logger.error(f"Error running report for property {property_id}: {str(e)}", exc_info=True)
             return {}
     
+    def _build_report_request(self, metrics: List[str], dimensions: Optional[List[str]],
+                              date_range: str, limit: int) -> Dict[str, Any]:
+        """
+        Build the runReport request body.
+        
+        Args:
+            metrics: List of metric names
+            dimensions: List of dimension names, or None
+            date_range: Date range string or custom range
+            limit: Maximum number of rows to return
+            
+        Returns:
+            Request body for the Data API runReport method
+        """
+        # Convert date range to API format
+        start_date, end_date = parse_date_range(date_range)
+        date_ranges = [date_range_to_ga4_api_format(start_date, end_date)]
+        
+        # Create the report request
+        request_body = {
+            'dateRanges': date_ranges,
+            'metrics': [{'name': metric} for metric in metrics],
+            'limit': limit
+        }
+        
+        # Add dimensions if provided
+        if dimensions:
+            request_body['dimensions'] = [{'name': dimension} for dimension in dimensions]
+        
+        return request_body
+    
+    def run_reports_for_properties(self, property_ids: List[str], metrics: List[str],
+                                   dimensions: List[str] = None, date_range: str = "last_30_days",
+                                   limit: int = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the same report for several GA4 properties concurrently.
+        
+        The requests are independent and network-bound, so they are issued from
+        a bounded thread pool rather than one after another.
+        
+        Args:
+            property_ids: The GA4 property IDs
+            metrics: List of metric names (e.g., ['activeUsers', 'screenPageViews'])
+            dimensions: List of dimension names (e.g., ['pagePath', 'country'])
+            date_range: Date range string or custom range
+            limit: Maximum number of rows to return per property
+            
+        Returns:
+            Dictionary mapping each property ID to its report response, in input order.
+            Properties whose request failed map to an empty dictionary.
+        """
+        if not self.is_available():
+            logger.warning("Cannot run reports: GA4 service not available")
+            return {}
+        
+        property_ids = list(dict.fromkeys(property_ids))
+        if not property_ids:
+            return {}
+        
+        request_body = self._build_report_request(metrics, dimensions, date_range, limit)
+        
+        def run_one(property_id: str) -> Dict[str, Any]:
+            data_service = self._get_thread_service('analyticsdata', 'v1beta')
+            return data_service.properties().runReport(
+                property=f"properties/{property_id}",
+                body=request_body
+            ).execute()
+        
+        results = {}
+        max_workers = min(self.MAX_CONCURRENT_REQUESTS, len(property_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run_one, property_id): property_id for property_id in property_ids}
+            for future in as_completed(futures):
+                property_id = futures[future]
+                try:
+                    results[property_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Error running report for property {property_id}: {str(e)}", exc_info=True)
+                    results[property_id] = {}
+        
+        logger.debug(f"Reports executed for {len(property_ids)} properties")
+        return {property_id: results[property_id] for property_id in property_ids}
+    
     def get_realtime_report(self, property_id: str, metrics: List[str], dimensions: List[str] = None,
                            limit: int = 100) -> Dict[str, Any]:
         """
@@ -15,6 +15,13 @@ from app.models.property import Property
 from app.models.website import Website
 from app.models.database import Database
 
+# ciso8601 is optional; timestamps are parsed with the stdlib without it
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,7 +87,7 @@ class PropertySyncService:
                     
                     for prop_summary in property_summaries:
                         property_resource = prop_summary.get('property', '')
-                        property_id = property_resource.split('/')[-1] if property_resource else ''
+                        property_id = property_resource.rsplit('/', 1)[-1] if property_resource else ''
                         
                         property_data = {
                             'property_id': property_id,
@@ -103,65 +110,101 @@ class PropertySyncService:
             
             logger.info(f"Fetched {len(properties_data)} properties from GA4")
             
+            # Build all property records first so they can be written in one batch
+            properties_to_save = []
+            website_candidates = []
+            seen_property_ids = set()
             for prop_data in properties_data:
                 try:
                     property_id = prop_data.get('property_id', '')
-                    property_resource = prop_data.get('property', '')
-                    account_id = prop_data.get('account', '').split('/')[-1]
+                    account_id = prop_data.get('account', '').rsplit('/', 1)[-1]
                     
                     if not property_id:
                         logger.warning(f"Property without ID found: {prop_data}")
                         continue
                     
-                    # Sync property to database
-                    created, updated = self._sync_property(
+                    # A property listed more than once is only saved and synced once
+                    if property_id in seen_property_ids:
+                        logger.debug(f"Skipping duplicate property {property_id}")
+                        continue
+                    seen_property_ids.add(property_id)
+                    
+                    properties_to_save.append(self._build_property(
                         property_id=property_id,
                         property_details=prop_data,
-                        account_id=account_id,
-                        update_existing=update_existing
-                    )
-                    
-                    if created:
-                        results['properties_created'] += 1
-                    elif updated:
-                        results['properties_updated'] += 1
+                        account_id=account_id
+                    ))
                     
                     # If website URL is already in the property data, create/update website record
                     if fetch_websites and prop_data.get('website_url'):
-                        try:
-                            # Get the property from database to get its ID
-                            property_obj = Property.find_by_ga4_property_id(
-                                self.database,
-                                property_resource
-                            )
-                            
-                            if property_obj:
-                                # Create a mock stream ID for the website
-                                stream_id = f"{property_resource}/dataStreams/web"
-                                
-                                created_web, updated_web = self._sync_website(
-                                    stream_id=stream_id,
-                                    property_db_id=property_obj.id,
-                                    website_url=prop_data['website_url'],
-                                    stream_details={'createTime': prop_data.get('createTime'),
-                                                   'updateTime': prop_data.get('updateTime')},
-                                    update_existing=update_existing
-                                )
-                                
-                                results['websites_fetched'] += 1
-                                if created_web:
-                                    results['websites_created'] += 1
-                                elif updated_web:
-                                    results['websites_updated'] += 1
-                        except Exception as e:
-                            error_msg = f"Error syncing website for property {property_id}: {str(e)}"
-                            logger.error(error_msg, exc_info=True)
-                            results['errors'].append(error_msg)
+                        website_candidates.append((property_id, properties_to_save[-1].property_id, prop_data))
                                     
                 except Exception as e:
                     error_msg = f"Error processing property data: {str(e)}"
                     logger.error(error_msg, exc_info=True)
                     results['errors'].append(error_msg)
+            
+            # Upsert every property in a single statement; the existing IDs are loaded once
+            # up front to report created/updated counts
+            saved_ids = {prop.property_id for prop in properties_to_save}
+            new_ids = saved_ids - Property.get_id_map(self.database).keys()
+            try:
+                Property.upsert_many(self.database, properties_to_save, update_existing=update_existing)
+            except Exception as e:
+                # One bad property fails the whole batch; retry each property on its own so the
+                # rest are still saved and the failures are reported individually
+                logger.warning(f"Batch property upsert failed, saving properties one by one: {str(e)}")
+                for prop in properties_to_save:
+                    try:
+                        Property.upsert_many(self.database, [prop], update_existing=update_existing)
+                    except Exception as prop_error:
+                        error_msg = f"Error saving property {prop.property_id}: {str(prop_error)}"
+                        logger.error(error_msg, exc_info=True)
+                        results['errors'].append(error_msg)
+                        saved_ids.discard(prop.property_id)
+                new_ids &= saved_ids
+            
+            results['properties_created'] = len(new_ids)
+            if update_existing:
+                results['properties_updated'] = len(saved_ids - new_ids)
+            logger.info(
+                f"Saved {len(saved_ids)} properties "
+                f"({results['properties_created']} new, {results['properties_updated']} updated)"
+            )
+            
+            property_ids = Property.get_id_map(self.database) if website_candidates else {}
+            known_websites = {
+                website.website_id: website
+                for websites in Website.find_all_grouped_by_property(self.database).values()
+                for website in websites
+            } if website_candidates else {}
+            for property_id, property_resource, prop_data in website_candidates:
+                try:
+                    property_db_id = property_ids.get(property_resource)
+                    
+                    if property_db_id:
+                        # Create a mock stream ID for the website
+                        stream_id = f"{property_resource}/dataStreams/web"
+                        
+                        created_web, updated_web = self._sync_website(
+                            stream_id=stream_id,
+                            property_db_id=property_db_id,
+                            website_url=prop_data['website_url'],
+                            stream_details={'createTime': prop_data.get('createTime'),
+                                           'updateTime': prop_data.get('updateTime')},
+                            update_existing=update_existing,
+                            known_websites=known_websites
+                        )
+                        
+                        results['websites_fetched'] += 1
+                        if created_web:
+                            results['websites_created'] += 1
+                        elif updated_web:
+                            results['websites_updated'] += 1
+                except Exception as e:
+                    error_msg = f"Error syncing website for property {property_id}: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    results['errors'].append(error_msg)
                         
         except Exception as e:
             error_msg = f"Error fetching properties: {str(e)}"
@@ -206,7 +249,7 @@ class PropertySyncService:
                 results['properties_fetched'] = 1
                 
                 # Extract account ID from property details
-                account_id = property_details.get('parent', '').split('/')[-1]
+                account_id = property_details.get('parent', '').rsplit('/', 1)[-1]
                 
                 # Sync property to database
                 created, updated = self._sync_property(
@@ -246,6 +289,35 @@ class PropertySyncService:
         
         return results
     
+    def _build_property(self,
+                        property_id: str,
+                        property_details: Dict[str, Any],
+                        account_id: str) -> Property:
+        """
+        Build an unsaved Property model from GA4 property details.
+        
+        Args:
+            property_id: The GA4 property ID (numeric part only)
+            property_details: Property details from GA4 API
+            account_id: The account ID this property belongs to
+            
+        Returns:
+            Property instance ready to be passed to Property.upsert_many()
+        """
+        # Get the full property resource name - it might already be in the details
+        property_resource = property_details.get('property') or f"properties/{property_id}"
+        create_time_str = property_details.get('createTime')
+        update_time_str = property_details.get('updateTime')
+        
+        return Property(
+            database=self.database,
+            property_id=property_resource,
+            property_name=property_details.get('display_name') or property_details.get('displayName'),
+            account_id=account_id,
+            create_time=self._parse_iso_datetime(create_time_str) if create_time_str else None,
+            update_time=self._parse_iso_datetime(update_time_str) if update_time_str else None
+        )
+    
     def _sync_property(self, 
                       property_id: str,
                       property_details: Dict[str, Any],
@@ -322,12 +394,15 @@ class PropertySyncService:
         if not datetime_str:
             return None
         try:
-            from dateutil import parser
-            return parser.isoparse(datetime_str)
-        except Exception:
+            # C parsers first; GA4 timestamps are standard ISO 8601 (e.g. '2023-01-15T10:20:30.123Z')
+            if CISO8601_AVAILABLE:
+                return ciso8601.parse_datetime(datetime_str)
+            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+        except ValueError:
             try:
-                # Fallback for standard ISO format
-                return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+                # Fallback for less common ISO forms (e.g. nanosecond precision)
+                from dateutil import parser
+                return parser.isoparse(datetime_str)
             except Exception as e:
                 logger.warning(f"Could not parse datetime string: {datetime_str}, error: {e}")
                 return None
@@ -369,12 +444,19 @@ class PropertySyncService:
             streams = self.ga4_service.list_streams(property_id)
             results['fetched'] = len(streams)
             
+            # Load this property's existing websites once instead of querying per stream
+            known_websites = {
+                website.website_id: website
+                for website in Website.find_by_property_db_id(self.database, property_obj.id)
+            }
+            
             for stream in streams:
                 try:
-                    stream_id = stream.get('name', '').split('/')[-1]
+                    stream_id = stream.get('name', '').rsplit('/', 1)[-1]
                     
-                    # Get full stream details
-                    stream_details = self.ga4_service.get_stream(property_id, stream_id)
+                    # Listed streams already carry their full details; only fetch
+                    # a stream individually if the listing omitted them
+                    stream_details = stream if stream.get('type') else self.ga4_service.get_stream(property_id, stream_id)
                     
                     if stream_details:
                         # Only process web streams
@@ -386,7 +468,8 @@ class PropertySyncService:
                                 property_db_id=property_obj.id,
                                 website_url=web_stream_data.get('defaultUri'),
                                 stream_details=stream_details,
-                                update_existing=update_existing
+                                update_existing=update_existing,
+                                known_websites=known_websites
                             )
                             
                             if created:
@@ -411,7 +494,8 @@ class PropertySyncService:
                      property_db_id: int,
                      website_url: str,
                      stream_details: Dict[str, Any],
-                     update_existing: bool = True) -> Tuple[bool, bool]:
+                     update_existing: bool = True,
+                     known_websites: Optional[Dict[str, Website]] = None) -> Tuple[bool, bool]:
         """
         Sync a single website/data stream to the database.
         
@@ -421,6 +505,8 @@ class PropertySyncService:
             website_url: The website URL
             stream_details: Stream details from GA4 API
             update_existing: Whether to update existing records
+            known_websites: Preloaded websites keyed by stream ID; when given, the
+                            existing website is looked up here instead of queried
             
         Returns:
             Tuple of (created, updated) booleans
@@ -430,7 +516,10 @@ class PropertySyncService:
         
         try:
             # Check if website already exists
-            existing_website = Website.find_by_ga4_website_id(self.database, stream_id)
+            if known_websites is not None:
+                existing_website = known_websites.get(stream_id)
+            else:
+                existing_website = Website.find_by_ga4_website_id(self.database, stream_id)
             
             if existing_website:
                 if update_existing:
@@ -453,6 +542,8 @@ class PropertySyncService:
                     update_time=stream_details.get('updateTime')
                 )
                 new_website.save()
+                if known_websites is not None:
+                    known_websites[stream_id] = new_website
                 created = True
                 logger.info(f"Created website: {website_url}")
                 
@@ -470,15 +561,16 @@ class PropertySyncService:
             Dictionary with counts of properties and websites in the database
         """
         try:
-            properties_count = len(Property.find_all(self.database))
-            websites_count = len(Website.find_all(self.database))
+            properties = Property.find_all(self.database, order_by="property_name ASC")
+            websites_by_property = Website.find_all_grouped_by_property(self.database)
+            
+            properties_count = len(properties)
+            websites_count = sum(len(websites) for websites in websites_by_property.values())
             
             # Get properties with their website counts
             properties_with_sites = []
-            properties = Property.find_all(self.database, order_by="property_name ASC")
-            
             for prop in properties:
-                websites = prop.get_websites()
+                websites = websites_by_property.get(prop.id, [])
                 properties_with_sites.append({
                     'property_id': prop.property_id,
                     'property_name': prop.property_name,
@@ -1,9 +1,13 @@
+import hashlib
 import logging
 import os
 import json
+import shutil
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Union
 
 from flask import current_app
 
@@ -23,8 +27,49 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
     logging.warning("ReportLab not available. PDF report generation will be disabled.")
 
+# Use orjson for writing JSON report payloads when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Write buffer for streamed HTML reports (1 MiB)
+HTML_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Report formats whose rendered files are cached by content
+REPORT_CACHE_FORMATS = ('pdf', 'html')
+
+# Metadata that changes on every run without changing the report content; left out of
+# the cache key so identical reports still hit the cache
+REPORT_CACHE_VOLATILE_METADATA = frozenset({'generated_at'})
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_styles():
+    """
+    Build the ReportLab stylesheet and table style shared by every PDF report.
+
+    Both are only read when a document is built, so one instance is reused
+    across reports instead of being rebuilt for each one.
+
+    Returns:
+        Tuple of (stylesheet, table style for tables with a header row)
+    """
+    styles = getSampleStyleSheet()
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    return styles, table_style
+
+
 class ReportService:
     """
     Service for generating and managing analytics reports.
@@ -48,6 +93,11 @@ class ReportService:
         os.makedirs(os.path.join(self.reports_dir, 'html'), exist_ok=True)
         os.makedirs(os.path.join(self.reports_dir, 'json'), exist_ok=True)
         
+        # Rendered reports keyed by a hash of their content
+        self.cache_dir = os.path.join(self.reports_dir, 'cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache_ttl = current_app.config.get('REPORT_CACHE_TTL', timedelta(days=7))
+        
         logger.info("Report Service initialized")
     
     def create_report(self, report_name: str, report_type: str, parameters: Dict[str, Any]) -> int:
@@ -66,9 +116,9 @@ class ReportService:
         report = Report(
             report_name=report_name,
             report_type=report_type,
-            parameters=json.dumps(parameters),
             status='pending'
         )
+        report.set_parameters(parameters)
         
         # Save the report to get an ID
         report_id = report.save()
@@ -84,6 +134,61 @@ class ReportService:
             report_id: ID of the report to generate
             format_type: Format of the report ('pdf', 'html', or 'json')
             
+        Returns:
+            Path to the generated report file, or None if generation failed
+        """
+        return self.generate_reports([report_id], format_type)[report_id]
+    
+    def generate_reports(self, report_ids: List[int], format_type: str = 'pdf') -> Dict[int, Optional[str]]:
+        """
+        Generate several reports in one batch.
+        
+        The plugin and GA4 services are looked up once for the whole batch, and
+        reports with the same plugin and parameters share a single data fetch.
+        
+        Args:
+            report_ids: IDs of the reports to generate
+            format_type: Format of the reports ('pdf', 'html', or 'json')
+            
+        Returns:
+            Dictionary mapping each report ID to its generated file path, or None if generation failed
+        """
+        from app.services import get_service
+        plugin_service = get_service('plugin')
+        ga4_service = get_service('ga4')
+        processed_data: Dict[str, Dict[str, Any]] = {}
+        
+        return {
+            report_id: self._generate_report(report_id, format_type, plugin_service,
+                                             ga4_service, processed_data)
+            for report_id in report_ids
+        }
+    
+    def _processing_key(self, plugin_id: str, parameters: Dict[str, Any]) -> str:
+        """
+        Build the key identifying one plugin data fetch within a batch.
+        
+        Args:
+            plugin_id: ID of the plugin processing the data
+            parameters: Report parameters passed to the plugin
+            
+        Returns:
+            Canonical string for the plugin and its parameters
+        """
+        return json.dumps([plugin_id, parameters], sort_keys=True, default=str)
+    
+    def _generate_report(self, report_id: int, format_type: str, plugin_service: Any,
+                         ga4_service: Any, processed_data: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """
+        Generate one report using services resolved by the caller.
+        
+        Args:
+            report_id: ID of the report to generate
+            format_type: Format of the report ('pdf', 'html', or 'json')
+            plugin_service: The plugin service, or None if unavailable
+            ga4_service: The GA4 service, or None if unavailable
+            processed_data: Plugin results already computed in this batch, updated in place
+            
         Returns:
             Path to the generated report file, or None if generation failed
         """
@@ -98,11 +203,9 @@ class ReportService:
         
         try:
             # Parse parameters
-            parameters = json.loads(report.parameters) if report.parameters else {}
+            parameters = report.get_parameters()
             
             # Use plugin service to get the right plugin for the report type
-            from app.services import get_service
-            plugin_service = get_service('plugin')
             if not plugin_service:
                 logger.error("Plugin service not available")
                 self._update_report_status(report_id, 'failed', "Plugin service not available")
@@ -119,8 +222,6 @@ class ReportService:
                     plugin_id = report.report_type  # Use report type as plugin ID
             
             # Process data using the appropriate plugin
-            # get_service imported locally above
-            ga4_service = get_service('ga4')
             if not ga4_service or not ga4_service.is_available():
                 logger.error("GA4 service not available")
                 self._update_report_status(report_id, 'failed', "GA4 service not available")
@@ -133,23 +234,38 @@ class ReportService:
                 self._update_report_status(report_id, 'failed', f"Plugin '{plugin_id}' not found")
                 return None
             
-            # Process data using the plugin
-            data = plugin.process_data(parameters)
+            # Process data using the plugin; identical requests in a batch are fetched once
+            data_key = self._processing_key(plugin_id, parameters)
+            data = processed_data.get(data_key)
+            if data is None:
+                data = plugin.process_data(parameters)
+                processed_data[data_key] = data
             
             # Store the processed data
             self._store_report_data(report_id, data)
             
-            # Generate the report file in the requested format
-            if format_type == 'pdf':
-                if not REPORTLAB_AVAILABLE:
-                    logger.warning("PDF generation requested but ReportLab not available")
+            # Reuse a previously rendered file if identical content was already generated
+            cache_key = None
+            report_path = None
+            if format_type in REPORT_CACHE_FORMATS:
+                cache_key = self._report_cache_key(report, format_type, data)
+                report_path = self._copy_cached_report(cache_key, format_type, report_id, report.report_type)
+            
+            if report_path is None:
+                # Generate the report file in the requested format
+                if format_type == 'pdf':
+                    if not REPORTLAB_AVAILABLE:
+                        logger.warning("PDF generation requested but ReportLab not available")
+                        report_path = self._generate_json_report(report_id, data)
+                    else:
+                        report_path = self._generate_pdf_report(report_id, data)
+                elif format_type == 'html':
+                    report_path = self._generate_html_report(report_id, data)
+                else:  # Default to JSON
                     report_path = self._generate_json_report(report_id, data)
-                else:
-                    report_path = self._generate_pdf_report(report_id, data)
-            elif format_type == 'html':
-                report_path = self._generate_html_report(report_id, data)
-            else:  # Default to JSON
-                report_path = self._generate_json_report(report_id, data)
+                
+                if report_path and cache_key:
+                    self._store_cached_report(cache_key, format_type, report_path)
             
             # Update report status and file path
             if report_path:
@@ -200,8 +316,34 @@ class ReportService:
         Returns:
             List of dictionaries containing report data
         """
-        report_data = ReportData.find_by_report_id(report_id)
-        return [data.to_dict() for data in report_data]
+        return [data.to_dict() for data in ReportData.iter_by_report_id(current_app.database, report_id)]
+    
+    def get_report_time_series(self, report_id: int, metric_name: str) -> Dict[str, float]:
+        """
+        Get a per-date series of one metric from the stored report data.
+        
+        Args:
+            report_id: ID of the report
+            metric_name: Name of the metric (e.g., 'sessions')
+            
+        Returns:
+            Dictionary mapping dates (YYYY-MM-DD) to metric values, in date order
+        """
+        return ReportData.get_time_series(current_app.database, report_id, metric_name)
+    
+    def get_report_time_series_for_metrics(self, report_id: int,
+                                           metric_names: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-date series of several metrics from the stored report data in one query.
+        
+        Args:
+            report_id: ID of the report
+            metric_names: Names of the metrics (e.g., ['sessions', 'bounceRate'])
+            
+        Returns:
+            Dictionary mapping each metric name to a {date: value} series, in date order
+        """
+        return ReportData.get_time_series_for_metrics(current_app.database, report_id, metric_names)
     
     def delete_report(self, report_id: int) -> bool:
         """
@@ -255,6 +397,159 @@ class ReportService:
         
         return [report.to_dict() for report in reports]
     
+    def evict_report_cache(self, key: Optional[str] = None) -> int:
+        """
+        Remove rendered reports from the content cache.
+        
+        Args:
+            key: Cache key to evict, or None to clear the whole cache
+            
+        Returns:
+            Number of cached files removed
+        """
+        removed = 0
+        for filename in os.listdir(self.cache_dir):
+            if key is not None and os.path.splitext(filename)[0] != key:
+                continue
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove cached report {filename}: {e}")
+        
+        logger.info(f"Evicted {removed} cached report(s)")
+        return removed
+    
+    def _new_report_path(self, report_type: str, report_id: int, format_type: str) -> str:
+        """
+        Build a unique path for a new report file.
+        
+        The suffix is a full random UUID, so concurrent or repeated generations
+        of the same report never overwrite each other's files.
+        
+        Args:
+            report_type: Type of the report
+            report_id: ID of the report
+            format_type: Output format, used as the subdirectory and extension
+            
+        Returns:
+            Path of the report file to write
+        """
+        filename = f"{report_type}_{report_id}_{uuid.uuid4().hex}.{format_type}"
+        return os.path.join(self.reports_dir, format_type, filename)
+    
+    def _report_cache_key(self, report: Report, format_type: str, data: Dict[str, Any]) -> str:
+        """
+        Compute the content cache key for a rendered report.
+        
+        Volatile metadata (see REPORT_CACHE_VOLATILE_METADATA) is left out of the key,
+        so a cache hit serves the file as first rendered: its "Generated" time is when
+        the cached copy was rendered, at most REPORT_CACHE_TTL ago.
+        
+        Args:
+            report: The report being generated
+            format_type: Output format ('pdf' or 'html')
+            data: The processed data rendered into the report
+            
+        Returns:
+            Hex digest identifying the rendered output
+        """
+        metadata = data.get('metadata')
+        if isinstance(metadata, dict) and not REPORT_CACHE_VOLATILE_METADATA.isdisjoint(metadata):
+            data = dict(data, metadata={key: value for key, value in metadata.items()
+                                        if key not in REPORT_CACHE_VOLATILE_METADATA})
+        
+        payload = {
+            'format': format_type,
+            'report_name': report.report_name,
+            'report_type': report.report_type,
+            'data': data
+        }
+        if ORJSON_AVAILABLE:
+            encoded = orjson.dumps(payload, default=str,
+                                   option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _copy_cached_report(self, cache_key: str, format_type: str,
+                            report_id: int, report_type: str) -> Optional[str]:
+        """
+        Copy a fresh cached rendering to a new report file.
+        
+        Args:
+            cache_key: Content cache key of the report
+            format_type: Output format ('pdf' or 'html')
+            report_id: ID of the report being generated
+            report_type: Type of the report, used in the filename
+            
+        Returns:
+            Path to the copied report file, or None on a cache miss
+        """
+        cached_path = os.path.join(self.cache_dir, f"{cache_key}.{format_type}")
+        try:
+            age = time.time() - os.path.getmtime(cached_path)
+        except OSError:
+            return None
+        
+        if age > self.cache_ttl.total_seconds():
+            return None
+        
+        filepath = self._new_report_path(report_type, report_id, format_type)
+        try:
+            shutil.copyfile(cached_path, filepath)
+        except OSError as e:
+            logger.warning(f"Could not reuse cached report {cached_path}: {e}")
+            return None
+        
+        logger.info(f"Reused cached {format_type} report for report {report_id}")
+        return filepath
+    
+    def _store_cached_report(self, cache_key: str, format_type: str, report_path: str) -> None:
+        """
+        Save a freshly generated report in the content cache.
+        
+        Expired entries are evicted at the same time, so the cache directory only
+        holds renderings younger than the cache TTL.
+        
+        Args:
+            cache_key: Content cache key of the report
+            format_type: Requested output format
+            report_path: Path to the generated report file
+        """
+        # Skip fallbacks (e.g. JSON written when PDF was requested)
+        if not report_path.endswith(f".{format_type}"):
+            return
+        
+        try:
+            shutil.copyfile(report_path, os.path.join(self.cache_dir, f"{cache_key}.{format_type}"))
+        except OSError as e:
+            logger.warning(f"Could not cache report {report_path}: {e}")
+        
+        self._evict_expired_cached_reports()
+    
+    def _evict_expired_cached_reports(self) -> int:
+        """
+        Remove cached renderings older than the cache TTL.
+        
+        Returns:
+            Number of cached files removed
+        """
+        cutoff = time.time() - self.cache_ttl.total_seconds()
+        removed = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove expired cached report {entry.name}: {e}")
+        
+        if removed:
+            logger.info(f"Evicted {removed} expired cached report(s)")
+        return removed
+    
     def _update_report_status(self, report_id: int, status: str, 
                              message: Optional[str] = None, 
                              file_path: Optional[str] = None) -> None:
@@ -267,26 +562,11 @@ class ReportService:
             message: Optional status message or error information
             file_path: Optional path to the generated report file
         """
-        report = Report.find_by_id(report_id)
-        if not report:
+        if not Report.set_status(current_app.database, report_id, status,
+                                 message=message or None, file_path=file_path or None):
             logger.error(f"Report with ID {report_id} not found for status update")
             return
         
-        report.status = status
-        if file_path:
-            report.file_path = file_path
-        
-        # Store message in parameters if provided
-        if message:
-            try:
-                params = json.loads(report.parameters) if report.parameters else {}
-                params['status_message'] = message
-                report.parameters = json.dumps(params)
-            except json.JSONDecodeError:
-                # If parameters is not valid JSON, create a new one
-                report.parameters = json.dumps({'status_message': message})
-        
-        report.save()
         logger.debug(f"Updated report {report_id} status to '{status}'")
     
     def _store_report_data(self, report_id: int, data: Dict[str, Any]) -> None:
@@ -302,12 +582,18 @@ class ReportService:
         
         # Extract metrics and dimensions from the raw data
         raw_data = data.get('raw_data', [])
-        current_time = datetime.utcnow()
         
+        # Check if we have a property ID in the data
+        metadata = data.get('metadata', {})
+        property_id = metadata.get('property_id', '')
+        
+        # Columns the plugin declared as metrics or dimensions are classified up
+        # front; only undeclared columns need the per-value numeric probe below
+        column_is_metric = {name: True for name in metadata.get('metrics') or []}
+        column_is_metric.update((name, False) for name in metadata.get('dimensions') or [])
+        
+        records = []
         for item in raw_data:
-            # Check if we have a property ID in the data
-            property_id = data.get('metadata', {}).get('property_id', '')
-            
             # Extract date if available
             data_date = item.get('date', '')
             
@@ -317,33 +603,37 @@ class ReportService:
                     continue  # Skip date field as we already extracted it
                 
                 # Determine if this is a metric or dimension
-                # In GA4, dimensions are typically string values and metrics are numeric
-                try:
-                    float(value)  # Try to convert to float to see if it's a metric
-                    is_metric = True
-                except (ValueError, TypeError):
-                    is_metric = False
+                is_metric = column_is_metric.get(key)
+                if is_metric is None:
+                    # In GA4, dimensions are typically string values and metrics are numeric
+                    try:
+                        float(value)  # Try to convert to float to see if it's a metric
+                        is_metric = True
+                    except (ValueError, TypeError):
+                        is_metric = False
                 
                 if is_metric:
                     # Store as a metric
-                    report_data = ReportData(
+                    records.append(ReportData(
                         report_db_id=report_id,
                         property_ga4_id=property_id,
                         metric_name=key,
                         metric_value=value,
                         data_date=data_date
-                    )
+                    ))
                 else:
                     # Store as a dimension
-                    report_data = ReportData(
+                    records.append(ReportData(
                         report_db_id=report_id,
                         property_ga4_id=property_id,
                         dimension_name=key,
                         dimension_value=value,
                         data_date=data_date
-                    )
-                
-                report_data.save()
+                    ))
+        
+        # Insert all data points in one batched statement and a single commit;
+        # SQLite stamps each row's timestamp
+        ReportData.bulk_insert(current_app.database, records)
         
         logger.info(f"Stored {len(raw_data)} data points for report {report_id}")
     
@@ -370,12 +660,11 @@ class ReportService:
                 return None
             
             # Generate a unique filename
-            filename = f"{report.report_type}_{report_id}_{uuid.uuid4().hex[:8]}.pdf"
-            filepath = os.path.join(self.reports_dir, 'pdf', filename)
+            filepath = self._new_report_path(report.report_type, report_id, 'pdf')
             
             # Create the PDF document
             doc = SimpleDocTemplate(filepath, pagesize=letter)
-            styles = getSampleStyleSheet()
+            styles, table_style = _get_pdf_styles()
             elements = []
             
             # Add title
@@ -405,14 +694,7 @@ class ReportService:
                     summary_data.append([formatted_key, formatted_value])
                 
                 summary_table = Table(summary_data, colWidths=[300, 150])
-                summary_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                summary_table.setStyle(table_style)
                 elements.append(summary_table)
                 elements.append(Spacer(1, 12))
             
@@ -432,14 +714,7 @@ class ReportService:
                     trend_data.append([formatted_key, formatted_change, formatted_percent, direction])
                 
                 trend_table = Table(trend_data, colWidths=[150, 100, 100, 100])
-                trend_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                trend_table.setStyle(table_style)
                 elements.append(trend_table)
                 elements.append(Spacer(1, 12))
             
@@ -463,14 +738,7 @@ class ReportService:
                 col_widths = [min(w, 200) for w in col_widths]  # Limit max width
                 
                 data_table = Table(table_data, colWidths=col_widths)
-                data_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                data_table.setStyle(table_style)
                 elements.append(data_table)
             
             # Build the PDF
@@ -502,147 +770,157 @@ class ReportService:
                 return None
             
             # Generate a unique filename
-            filename = f"{report.report_type}_{report_id}_{uuid.uuid4().hex[:8]}.html"
-            filepath = os.path.join(self.reports_dir, 'html', filename)
+            filepath = self._new_report_path(report.report_type, report_id, 'html')
             
-            # Get metadata
-            metadata = data.get('metadata', {})
-            summary = data.get('summary', {})
-            trends = data.get('trends', {})
-            raw_data = data.get('raw_data', [])
+            # Stream fragments straight to disk through a large write buffer so
+            # the full document is never held in memory
+            with open(filepath, 'w', encoding='utf-8', buffering=HTML_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_html_report(report, data))
             
-            # Build HTML content
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{report.report_name}</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                    h1, h2, h3 {{ color: #333; }}
-                    table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-                    th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                    th {{ background-color: #f2f2f2; }}
-                    tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                    .metadata {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-bottom: 20px; }}
-                    .trend-up {{ color: green; }}
-                    .trend-down {{ color: red; }}
-                    .trend-flat {{ color: gray; }}
-                </style>
-            </head>
-            <body>
-                <h1>{report.report_name}</h1>
-                
-                <div class="metadata">
-                    <p><strong>Report Type:</strong> {report.report_type}</p>
-                    <p><strong>Property ID:</strong> {metadata.get('property_id', 'N/A')}</p>
-                    <p><strong>Date Range:</strong> {metadata.get('date_range', 'N/A')}</p>
-                    <p><strong>Generated:</strong> {metadata.get('generated_at', datetime.now().isoformat())}</p>
-                </div>
+            logger.info(f"Generated HTML report at {filepath}")
+            return filepath
+        
+        except Exception as e:
+            logger.error(f"Error generating HTML report: {str(e)}", exc_info=True)
+            return None
+    
+    def _iter_html_report(self, report: Report, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the HTML for a report as a sequence of fragments.
+        
+        Args:
+            report: The report being rendered
+            data: The processed data to include in the report
+            
+        Yields:
+            Consecutive fragments of the HTML document
+        """
+        # Get metadata
+        metadata = data.get('metadata', {})
+        summary = data.get('summary', {})
+        trends = data.get('trends', {})
+        raw_data = data.get('raw_data', [])
+        
+        yield f"""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>{report.report_name}</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                h1, h2, h3 {{ color: #333; }}
+                table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
+                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+                th {{ background-color: #f2f2f2; }}
+                tr:nth-child(even) {{ background-color: #f9f9f9; }}
+                .metadata {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin-bottom: 20px; }}
+                .trend-up {{ color: green; }}
+                .trend-down {{ color: red; }}
+                .trend-flat {{ color: gray; }}
+            </style>
+        </head>
+        <body>
+            <h1>{report.report_name}</h1>
+            
+            <div class="metadata">
+                <p><strong>Report Type:</strong> {report.report_type}</p>
+                <p><strong>Property ID:</strong> {metadata.get('property_id', 'N/A')}</p>
+                <p><strong>Date Range:</strong> {metadata.get('date_range', 'N/A')}</p>
+                <p><strong>Generated:</strong> {metadata.get('generated_at', datetime.now().isoformat())}</p>
+            </div>
+        """
+        
+        # Add summary section
+        if summary:
+            yield """
+            <h2>Summary</h2>
+            <table>
+                <tr>
+                    <th>Metric</th>
+                    <th>Value</th>
+                </tr>
             """
             
-            # Add summary section
-            if summary:
-                html_content += """
-                <h2>Summary</h2>
-                <table>
-                    <tr>
-                        <th>Metric</th>
-                        <th>Value</th>
-                    </tr>
+            for key, value in summary.items():
+                formatted_key = key.replace('_', ' ').replace('avg', 'Average').title()
+                formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
+                yield f"""
+                <tr>
+                    <td>{formatted_key}</td>
+                    <td>{formatted_value}</td>
+                </tr>
                 """
-                
-                for key, value in summary.items():
-                    formatted_key = key.replace('_', ' ').replace('avg', 'Average').title()
-                    formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
-                    html_content += f"""
-                    <tr>
-                        <td>{formatted_key}</td>
-                        <td>{formatted_value}</td>
-                    </tr>
-                    """
-                
-                html_content += "</table>"
             
-            # Add trends section
-            if trends:
-                html_content += """
-                <h2>Trends</h2>
-                <table>
-                    <tr>
-                        <th>Metric</th>
-                        <th>Change</th>
-                        <th>% Change</th>
-                        <th>Direction</th>
-                    </tr>
-                """
-                
-                for key, trend in trends.items():
-                    formatted_key = key.replace('_', ' ').title()
-                    formatted_change = f"{trend.get('change', 0):.2f}"
-                    formatted_percent = f"{trend.get('percent_change', 0):.2f}%"
-                    direction = trend.get('direction', 'neutral')
-                    
-                    trend_class = ""
-                    if direction == 'up':
-                        trend_class = "trend-up"
-                    elif direction == 'down':
-                        trend_class = "trend-down"
-                    else:
-                        trend_class = "trend-flat"
-                    
-                    html_content += f"""
-                    <tr>
-                        <td>{formatted_key}</td>
-                        <td>{formatted_change}</td>
-                        <td>{formatted_percent}</td>
-                        <td class="{trend_class}">{direction.title()}</td>
-                    </tr>
-                    """
-                
-                html_content += "</table>"
+            yield "</table>"
+        
+        # Add trends section
+        if trends:
+            yield """
+            <h2>Trends</h2>
+            <table>
+                <tr>
+                    <th>Metric</th>
+                    <th>Change</th>
+                    <th>% Change</th>
+                    <th>Direction</th>
+                </tr>
+            """
             
-            # Add raw data section
-            if raw_data and len(raw_data) > 0:
-                html_content += "<h2>Data Points</h2>"
-                
-                # Get column headers
-                headers = list(raw_data[0].keys())
+            for key, trend in trends.items():
+                formatted_key = key.replace('_', ' ').title()
+                formatted_change = f"{trend.get('change', 0):.2f}"
+                formatted_percent = f"{trend.get('percent_change', 0):.2f}%"
+                direction = trend.get('direction', 'neutral')
                 
-                html_content += "<table><tr>"
-                for header in headers:
-                    formatted_header = header.replace('_', ' ').title()
-                    html_content += f"<th>{formatted_header}</th>"
-                html_content += "</tr>"
-                
-                # Add data rows
-                for item in raw_data:
-                    html_content += "<tr>"
-                    for header in headers:
-                        value = item.get(header, '')
-                        html_content += f"<td>{value}</td>"
-                    html_content += "</tr>"
+                trend_class = ""
+                if direction == 'up':
+                    trend_class = "trend-up"
+                elif direction == 'down':
+                    trend_class = "trend-down"
+                else:
+                    trend_class = "trend-flat"
                 
-                html_content += "</table>"
+                yield f"""
+                <tr>
+                    <td>{formatted_key}</td>
+                    <td>{formatted_change}</td>
+                    <td>{formatted_percent}</td>
+                    <td class="{trend_class}">{direction.title()}</td>
+                </tr>
+                """
             
-            # Close HTML content
-            html_content += """
-            </body>
-            </html>
-            """
+            yield "</table>"
+        
+        # Add raw data section
+        if raw_data and len(raw_data) > 0:
+            yield "<h2>Data Points</h2>"
             
-            # Write HTML file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Get column headers
+            headers = list(raw_data[0].keys())
             
-            logger.info(f"Generated HTML report at {filepath}")
-            return filepath
+            yield "<table><tr>"
+            for header in headers:
+                formatted_header = header.replace('_', ' ').title()
+                yield f"<th>{formatted_header}</th>"
+            yield "</tr>"
+            
+            # Add data rows
+            for item in raw_data:
+                yield "<tr>"
+                for header in headers:
+                    value = item.get(header, '')
+                    yield f"<td>{value}</td>"
+                yield "</tr>"
+            
+            yield "</table>"
         
-        except Exception as e:
-            logger.error(f"Error generating HTML report: {str(e)}", exc_info=True)
-            return None
+        # Close HTML content
+        yield """
+        </body>
+        </html>
+        """
     
     def _generate_json_report(self, report_id: int, data: Dict[str, Any]) -> Optional[str]:
         """
@@ -663,8 +941,7 @@ class ReportService:
                 return None
             
             # Generate a unique filename
-            filename = f"{report.report_type}_{report_id}_{uuid.uuid4().hex[:8]}.json"
-            filepath = os.path.join(self.reports_dir, 'json', filename)
+            filepath = self._new_report_path(report.report_type, report_id, 'json')
             
             # Prepare report data with additional metadata
             report_data = {
@@ -676,8 +953,12 @@ class ReportService:
             }
             
             # Write JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, indent=2)
             
             logger.info(f"Generated JSON report at {filepath}")
             return filepath
@@ -65,7 +65,14 @@ from .formatters import (
     format_metric_name,
     data_to_csv,
     data_to_json,
-    format_ga4_report_data
+    format_ga4_report_data,
+    get_header_indexes,
+    group_rows_by_dimension,
+    get_top_items,
+    get_top_items_by_dimensions,
+    get_all_time_series,
+    is_percentage_metric,
+    is_average_metric
 )
 
 # Define __all__ to specify the public interface of the utils package.
@@ -105,6 +112,13 @@ __all__ = [
     'data_to_csv',
     'data_to_json',
     'format_ga4_report_data',
+    'get_header_indexes',
+    'group_rows_by_dimension',
+    'get_top_items',
+    'get_top_items_by_dimensions',
+    'get_all_time_series',
+    'is_percentage_metric',
+    'is_average_metric',
     
     # From logging_utils
     'configure_logging',
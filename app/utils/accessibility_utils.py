@@ -19,6 +19,20 @@ logger = logging.getLogger(__name__)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 
+# Patterns used by the HTML checks, compiled once at import
+_HTML_LANG_RE = re.compile(r'<html[^>]*lang=')
+_HTML_LANG_VALUE_RE = re.compile(r'<html([^>]*)lang=(["\']).*?\2')
+_HTML_OPEN_TAG_RE = re.compile(r'<html([^>]*?)>')
+_IMG_TAG_RE = re.compile(r'<img[^>]*>')
+_EMPTY_ALT_RE = re.compile(r'alt=(["\'])\1')
+_INPUT_TAG_RE = re.compile(r'<input[^>]*>')
+_ID_ATTR_RE = re.compile(r'id=(["\'])(.*?)\1')
+_FOR_ATTR_RE = re.compile(r'for=(["\'])(.*?)\1')
+_HEADING_RE = re.compile(r'<h([1-6])[^>]*>')
+_LINK_RE = re.compile(r'<a[^>]*>(.*?)</a>')
+_LANDMARK_RE = re.compile(r'<(header|nav|main|footer)[^>]*>|role=(["\'])(banner|navigation|main|contentinfo)\2')
+_TITLE_RE = re.compile(r'<title>[^<]+</title>')
+
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     """
     Convert RGB color to hex format.
@@ -408,12 +422,12 @@ def set_lang_attribute(html_content: str, lang: str = 'en') -> str:
     Returns:
         Updated HTML string
     """
-    if re.search(r'<html[^>]*lang=', html_content):
+    if _HTML_LANG_RE.search(html_content):
         # Replace existing lang attribute
-        return re.sub(r'<html([^>]*)lang=(["\']).*?\2', f'<html\\1lang=\\2{lang}\\2', html_content)
+        return _HTML_LANG_VALUE_RE.sub(f'<html\\1lang=\\2{lang}\\2', html_content)
     else:
         # Add lang attribute if missing
-        return re.sub(r'<html([^>]*?)>', f'<html\\1 lang="{lang}">', html_content)
+        return _HTML_OPEN_TAG_RE.sub(f'<html\\1 lang="{lang}">', html_content)
 
 def accessibility_audit(html_content: str) -> Dict[str, List[str]]:
     """
@@ -436,24 +450,26 @@ def accessibility_audit(html_content: str) -> Dict[str, List[str]]:
     }
     
     # Check for images without alt
-    img_tags = re.findall(r'<img[^>]*>', html_content)
+    img_tags = _IMG_TAG_RE.findall(html_content)
     for img in img_tags:
-        if not re.search(r'alt=', img):
+        if 'alt=' not in img:
             issues['images'].append("Image without alt attribute found")
-        elif re.search(r'alt=(["\'])\1', img):
+        elif _EMPTY_ALT_RE.search(img):
             issues['images'].append("Image with empty alt attribute (should be used only for decorative images)")
     
     # Check for form inputs without labels
-    input_tags = re.findall(r'<input[^>]*>', html_content)
+    # Collect every label target once instead of rescanning the document per input
+    input_tags = _INPUT_TAG_RE.findall(html_content)
+    label_targets = {match.group(2) for match in _FOR_ATTR_RE.finditer(html_content)} if input_tags else set()
     for input_tag in input_tags:
-        input_id = re.search(r'id=(["\'])(.*?)\1', input_tag)
+        input_id = _ID_ATTR_RE.search(input_tag)
         if input_id:
             input_id = input_id.group(2)
-            if not re.search(f'for=(["\']){input_id}\\1', html_content) and not re.search(r'aria-label=', input_tag):
+            if input_id not in label_targets and 'aria-label=' not in input_tag:
                 issues['forms'].append(f"Input field with id '{input_id}' has no associated label")
     
     # Check for heading hierarchy
-    headings = re.findall(r'<h([1-6])[^>]*>', html_content)
+    headings = set(_HEADING_RE.findall(html_content))
     if headings:
         # Check if H1 exists
         if '1' not in headings:
@@ -465,21 +481,21 @@ def accessibility_audit(html_content: str) -> Dict[str, List[str]]:
                 issues['headings'].append(f"Heading level H{i} is skipped (found H{i+1} without H{i})")
     
     # Check for empty links
-    links = re.findall(r'<a[^>]*>(.*?)</a>', html_content)
+    links = _LINK_RE.findall(html_content)
     for link_content in links:
-        if not link_content.strip() and not re.search(r'aria-label=', link_content):
+        if not link_content.strip() and 'aria-label=' not in link_content:
             issues['links'].append("Empty link found without accessible text")
     
     # Check for ARIA landmarks
-    if not re.search(r'<(header|nav|main|footer)[^>]*>|role=(["\'])(banner|navigation|main|contentinfo)\2', html_content):
+    if not _LANDMARK_RE.search(html_content):
         issues['landmarks'].append("Missing ARIA landmarks or HTML5 semantic elements")
     
     # Check for language attribute
-    if not re.search(r'<html[^>]*lang=', html_content):
+    if not _HTML_LANG_RE.search(html_content):
         issues['general'].append("Missing lang attribute on html element")
     
     # Check for page title
-    if not re.search(r'<title>[^<]+</title>', html_content):
+    if not _TITLE_RE.search(html_content):
         issues['general'].append("Missing page title")
     
     return issues
\ No newline at end of file
@@ -8,6 +8,13 @@ import datetime
 import logging
 from typing import Dict, List, Tuple, Union  # For type hinting
 
+# ciso8601 is an optional C parser for ISO 8601 timestamps; fall back to the stdlib without it
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 def parse_date_range(date_range_str: str, default_days: int = 30) -> Dict[str, str]:
@@ -213,7 +220,7 @@ def format_date_for_display(date_obj: Union[datetime.date, datetime.datetime, st
 
     Args:
         date_obj (Union[datetime.date, datetime.datetime, str]): The date or datetime object,
-            or a string in 'YYYY-MM-DD' or ISO 8601 datetime format.
+            or a string in 'YYYY-MM-DD', 'YYYYMMDD' or ISO 8601 datetime format.
         output_format (str, optional): The desired output format string (strftime codes).
                                        Defaults to "%B %d, %Y" (e.g., "May 13, 2025").
 
@@ -222,8 +229,17 @@ def format_date_for_display(date_obj: Union[datetime.date, datetime.datetime, st
     """
     if isinstance(date_obj, str):
         try:
-            # Attempt to parse as datetime first (more inclusive)
-            parsed_date = datetime.datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
+            if len(date_obj) == 10:
+                # Plain 'YYYY-MM-DD' date, the common case
+                parsed_date = datetime.date.fromisoformat(date_obj)
+            elif len(date_obj) == 8 and date_obj.isdigit():
+                # GA4 compact 'YYYYMMDD' date
+                parsed_date = datetime.date(int(date_obj[:4]), int(date_obj[4:6]), int(date_obj[6:]))
+            elif CISO8601_AVAILABLE:
+                parsed_date = ciso8601.parse_datetime(date_obj)
+            else:
+                # Attempt to parse as datetime (more inclusive)
+                parsed_date = datetime.datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
         except ValueError:
             try:
                 # Attempt to parse as date only
@@ -11,11 +11,48 @@ This module provides various formatters for:
 
 import json
 import csv
+import heapq
 import io
 import re
 import math
 import datetime
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Callable, Dict, List, Tuple, Union, Optional
+
+# Boundary between a lowercase and an uppercase letter in camelCase names
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+# Ratio metrics such as screenPageViewsPerSession or sessionsPerUser
+_PER_UNIT_METRIC_RE = re.compile(r'Per[A-Z]')
+
+def is_percentage_metric(metric_name: str) -> bool:
+    """
+    Whether a GA4 metric is a percentage or rate (e.g. bounceRate, percentNewUsers).
+    
+    Args:
+        metric_name: GA4 metric name
+        
+    Returns:
+        True for percentage and rate metrics
+    """
+    return metric_name.startswith('percent') or metric_name.endswith('Rate')
+
+def is_average_metric(metric_name: str) -> bool:
+    """
+    Whether a GA4 metric is an average or ratio rather than a count.
+    
+    Values of these metrics (rates, percentages, durations, averages and
+    per-session or per-user ratios) are averaged when rows are combined;
+    counts are summed.
+    
+    Args:
+        metric_name: GA4 metric name
+        
+    Returns:
+        True if values of the metric should be averaged rather than summed
+    """
+    return (is_percentage_metric(metric_name)
+            or metric_name.startswith('average')
+            or 'Duration' in metric_name
+            or _PER_UNIT_METRIC_RE.search(metric_name) is not None)
 
 def format_number(value: Union[int, float, str], 
                   precision: int = 0, 
@@ -90,6 +127,35 @@ def format_percentage(value: Union[float, str],
     
     return formatted
 
+def _parse_date_string(date_str: str) -> Union[datetime.date, str]:
+    """
+    Parse a date string in one of the supported input formats.
+    
+    GA4's compact YYYYMMDD and ISO YYYY-MM-DD forms are handled without
+    strptime, since they make up nearly all report dates.
+    
+    Args:
+        date_str: Date string to parse
+        
+    Returns:
+        The parsed date, or the original string if no format matches
+    """
+    try:
+        if len(date_str) == 8 and date_str.isdigit():  # YYYYMMDD
+            return datetime.date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':  # YYYY-MM-DD
+            return datetime.date.fromisoformat(date_str)
+    except ValueError:
+        pass
+    
+    # Fall back to the slower, more lenient formats
+    for fmt in ('%Y-%m-%d', '%Y%m%d', '%d/%m/%Y', '%m/%d/%Y'):
+        try:
+            return datetime.datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return date_str
+
 def format_date(date_value: Union[str, datetime.date, datetime.datetime],
                 format_str: str = '%Y-%m-%d',
                 localize: bool = False) -> str:
@@ -106,13 +172,7 @@ def format_date(date_value: Union[str, datetime.date, datetime.datetime],
     """
     # If it's already a string, try to parse it
     if isinstance(date_value, str):
-        # Try different formats
-        for fmt in ('%Y-%m-%d', '%Y%m%d', '%d/%m/%Y', '%m/%d/%Y'):
-            try:
-                date_value = datetime.datetime.strptime(date_value, fmt).date()
-                break
-            except ValueError:
-                continue
+        date_value = _parse_date_string(date_value)
         
         # If still a string, just return it
         if isinstance(date_value, str):
@@ -142,37 +202,39 @@ def format_duration(seconds: Union[int, float, str],
     Returns:
         Formatted duration string
     """
-    try:
-        seconds = float(seconds)
-    except (ValueError, TypeError):
-        return str(seconds)
+    if not isinstance(seconds, float):
+        try:
+            seconds = float(seconds)
+        except (ValueError, TypeError):
+            return str(seconds)
     
-    # Calculate components
+    # Calculate components once; the formats below only work with the integers
     hours, remainder = divmod(seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
+    minutes, secs = divmod(remainder, 60)
+    h, m, s = int(hours), int(minutes), int(secs)
     
     # Format based on type
     if format_type == 'clock':
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}"
+        return f"{h:02d}:{m:02d}:{s:02d}"
     
     if format_type == 'compact':
         parts = []
-        if hours:
-            parts.append(f"{int(hours)}h")
-        if minutes or (hours and seconds):
-            parts.append(f"{int(minutes)}m")
-        if seconds or not parts:
-            parts.append(f"{int(seconds)}s")
+        if h:
+            parts.append(f"{h}h")
+        if m or (h and secs):
+            parts.append(f"{m}m")
+        if secs or not parts:
+            parts.append(f"{s}s")
         return "".join(parts)
     
     # Default: human-readable
     parts = []
-    if hours:
-        parts.append(f"{int(hours)}h")
-    if minutes:
-        parts.append(f"{int(minutes)}m")
-    if seconds or not parts:
-        parts.append(f"{int(seconds)}s")
+    if h:
+        parts.append(f"{h}h")
+    if m:
+        parts.append(f"{m}m")
+    if secs or not parts:
+        parts.append(f"{s}s")
     return " ".join(parts)
 
 def format_file_size(size_bytes: Union[int, float, str], 
@@ -225,7 +287,7 @@ def format_metric_name(metric_name: str) -> str:
     
     # Handle camelCase
     # Insert a space before capital letters and then capitalize first letter
-    metric_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', metric_name)
+    metric_name = _CAMEL_CASE_BOUNDARY_RE.sub(r'\1 \2', metric_name)
     return metric_name[0].upper() + metric_name[1:]
 
 def data_to_csv(data: List[Dict[str, Any]], 
@@ -318,6 +380,26 @@ def format_dimension_value(dimension: str, value: str) -> str:
     # Default: just return the value
     return value
 
+def _metric_formatter(metric_name: str) -> Callable[[Any], str]:
+    """
+    Select the formatter for a metric column based on its name.
+    
+    Args:
+        metric_name: GA4 metric name
+        
+    Returns:
+        Function that formats a raw metric value for display
+    """
+    if is_percentage_metric(metric_name):
+        return format_percentage
+    if 'Duration' in metric_name:
+        return lambda value: format_duration(float(value))
+    lowered = metric_name.lower()
+    if any(name in lowered for name in ['revenue', 'value', 'arpu']):
+        return lambda value: f"${float(value):.2f}"
+    return format_number
+
+
 def format_ga4_report_data(report_data: Dict[str, Any]) -> List[Dict[str, str]]:
     """
     Format GA4 API report data into a more user-friendly format.
@@ -334,34 +416,207 @@ def format_ga4_report_data(report_data: Dict[str, Any]) -> List[Dict[str, str]]:
     dimension_headers = [h.get('name') for h in report_data.get('dimensionHeaders', [])]
     metric_headers = [h.get('name') for h in report_data.get('metricHeaders', [])]
     
+    # Resolve each metric column's formatter once per report rather than per cell
+    metric_columns = [(name, _metric_formatter(name)) for name in metric_headers]
+    
     # Process rows
     for row in report_data.get('rows', []):
         data_row = {}
         
         # Add dimensions with formatting
-        for i, dim in enumerate(row.get('dimensionValues', [])):
-            if i < len(dimension_headers):
-                dim_name = dimension_headers[i]
-                dim_value = dim.get('value')
-                data_row[dim_name] = format_dimension_value(dim_name, dim_value)
+        for dim_name, dim in zip(dimension_headers, row.get('dimensionValues', [])):
+            data_row[dim_name] = format_dimension_value(dim_name, dim.get('value'))
         
         # Add metrics with formatting
-        for i, metric in enumerate(row.get('metricValues', [])):
-            if i < len(metric_headers):
-                metric_name = metric_headers[i]
-                metric_value = metric.get('value')
-                
-                # Format based on metric type
-                if metric_name.startswith('percent') or metric_name.endswith('Rate'):
-                    data_row[metric_name] = format_percentage(metric_value)
-                elif 'Duration' in metric_name:
-                    data_row[metric_name] = format_duration(float(metric_value))
-                elif any(name in metric_name.lower() for name in ['revenue', 'value', 'arpu']):
-                    data_row[metric_name] = f"${float(metric_value):.2f}"
-                else:
-                    # Format as number
-                    data_row[metric_name] = format_number(metric_value)
+        for (metric_name, formatter), metric in zip(metric_columns, row.get('metricValues', [])):
+            data_row[metric_name] = formatter(metric.get('value'))
         
         formatted_data.append(data_row)
     
-    return formatted_data
\ No newline at end of file
+    return formatted_data
+
+def get_header_indexes(report_data: Dict[str, Any]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Map GA4 report dimension and metric names to their column positions.
+    
+    Build this once per report and pass it to helpers such as get_top_items
+    so each lookup is a dict access instead of a scan of the header lists.
+    
+    Args:
+        report_data: Report data from GA4 API
+        
+    Returns:
+        Tuple of ({dimension_name: index}, {metric_name: index})
+    """
+    dimension_indexes = {h.get('name'): i for i, h in enumerate(report_data.get('dimensionHeaders', []))}
+    metric_indexes = {h.get('name'): i for i, h in enumerate(report_data.get('metricHeaders', []))}
+    return dimension_indexes, metric_indexes
+
+def group_rows_by_dimension(report_data: Dict[str, Any], dimension: str,
+                            header_indexes: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None
+                            ) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group GA4 report rows by the value of one dimension in a single pass.
+    
+    Selecting the rows for many values (e.g. several page paths) then costs one
+    dict lookup each instead of a scan of every row per value.
+    
+    Args:
+        report_data: Report data from GA4 API
+        dimension: Name of the dimension to group by (e.g., 'pagePath')
+        header_indexes: Result of get_header_indexes for report_data, computed if omitted
+        
+    Returns:
+        Dictionary mapping each dimension value to its rows, in report order
+    """
+    dimension_indexes, _ = header_indexes or get_header_indexes(report_data)
+    dimension_index = dimension_indexes.get(dimension)
+    if dimension_index is None:
+        return {}
+    
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for row in report_data.get('rows', []):
+        dimension_values = row.get('dimensionValues', [])
+        if dimension_index >= len(dimension_values):
+            continue
+        groups.setdefault(dimension_values[dimension_index].get('value'), []).append(row)
+    return groups
+
+def get_top_items(report_data: Dict[str, Any], dimension: str, metric: str,
+                  limit: int = 10,
+                  header_indexes: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None) -> List[Dict[str, Any]]:
+    """
+    Get the dimension values with the highest values of a metric from GA4 report data.
+    
+    Uses a bounded heap, so only `limit` items are kept while scanning the rows
+    instead of sorting the whole report.
+    
+    Args:
+        report_data: Report data from GA4 API
+        dimension: Name of the dimension to rank (e.g., 'pagePath')
+        metric: Name of the metric to rank by (e.g., 'screenPageViews')
+        limit: Maximum number of items to return
+        header_indexes: Result of get_header_indexes for report_data, computed if omitted
+        
+    Returns:
+        List of {'dimension': value, 'metric': number} dictionaries, highest first
+    """
+    dimension_indexes, metric_indexes = header_indexes or get_header_indexes(report_data)
+    dimension_index = dimension_indexes.get(dimension)
+    metric_index = metric_indexes.get(metric)
+    if dimension_index is None or metric_index is None:
+        return []
+    
+    def _items():
+        for row in report_data.get('rows', []):
+            dimension_values = row.get('dimensionValues', [])
+            metric_values = row.get('metricValues', [])
+            if dimension_index >= len(dimension_values) or metric_index >= len(metric_values):
+                continue
+            try:
+                value = float(metric_values[metric_index].get('value'))
+            except (ValueError, TypeError):
+                value = 0.0
+            yield value, dimension_values[dimension_index].get('value')
+    
+    top = heapq.nlargest(limit, _items(), key=lambda item: item[0])
+    return [{'dimension': name, 'metric': value} for value, name in top]
+
+def get_top_items_by_dimensions(report_data: Dict[str, Any], dimensions: List[str], metric: str,
+                                limit: int = 10,
+                                header_indexes: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None
+                                ) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Rank the values of several dimensions by their metric totals in one pass over the rows.
+    
+    Rows sharing a dimension value (e.g. one row per source and device) are
+    summed before ranking, so each dimension gets a grouped top-N without a
+    separate scan of the report per dimension.
+    
+    Args:
+        report_data: Report data from GA4 API
+        dimensions: Names of the dimensions to rank (e.g., ['sessionSource', 'deviceCategory'])
+        metric: Name of the metric to rank by (e.g., 'sessions')
+        limit: Maximum number of items to return per dimension
+        header_indexes: Result of get_header_indexes for report_data, computed if omitted
+        
+    Returns:
+        Dictionary mapping each dimension present in the report to a list of
+        {'dimension': value, 'metric': total} dictionaries, highest first
+    """
+    dimension_indexes, metric_indexes = header_indexes or get_header_indexes(report_data)
+    metric_index = metric_indexes.get(metric)
+    if metric_index is None:
+        return {}
+    
+    # Dimensions missing from the report are skipped rather than ranked as empty
+    columns = [(name, dimension_indexes[name]) for name in dimensions if name in dimension_indexes]
+    totals: Dict[str, Dict[str, float]] = {name: {} for name, _ in columns}
+    
+    for row in report_data.get('rows', []):
+        dimension_values = row.get('dimensionValues', [])
+        metric_values = row.get('metricValues', [])
+        if metric_index >= len(metric_values):
+            continue
+        try:
+            value = float(metric_values[metric_index].get('value'))
+        except (ValueError, TypeError):
+            value = 0.0
+        for name, index in columns:
+            if index < len(dimension_values):
+                key = dimension_values[index].get('value')
+                column_totals = totals[name]
+                column_totals[key] = column_totals.get(key, 0.0) + value
+    
+    return {
+        name: [{'dimension': key, 'metric': total}
+               for key, total in heapq.nlargest(limit, column_totals.items(), key=lambda item: item[1])]
+        for name, column_totals in totals.items()
+    }
+
+def get_all_time_series(report_data: Dict[str, Any], metrics: List[str], date_dimension: str = 'date',
+                        header_indexes: Optional[Tuple[Dict[str, int], Dict[str, int]]] = None
+                        ) -> Dict[str, Dict[str, float]]:
+    """
+    Build per-date series for several metrics in one pass over the rows.
+    
+    Rows sharing a date (e.g. one row per date and page) are summed, so the
+    result matches building each metric's series separately without walking
+    the report once per metric.
+    
+    Args:
+        report_data: Report data from GA4 API
+        metrics: Names of the metrics to collect (e.g., ['activeUsers', 'sessions'])
+        date_dimension: Name of the date dimension
+        header_indexes: Result of get_header_indexes for report_data, computed if omitted
+        
+    Returns:
+        Dictionary mapping each metric present in the report to {date: total},
+        with dates in the order they first appear
+    """
+    dimension_indexes, metric_indexes = header_indexes or get_header_indexes(report_data)
+    date_index = dimension_indexes.get(date_dimension)
+    if date_index is None:
+        return {}
+    
+    # Metrics missing from the report are skipped rather than returned as empty series
+    columns = [(name, metric_indexes[name]) for name in metrics if name in metric_indexes]
+    series: Dict[str, Dict[str, float]] = {name: {} for name, _ in columns}
+    
+    for row in report_data.get('rows', []):
+        dimension_values = row.get('dimensionValues', [])
+        if date_index >= len(dimension_values):
+            continue
+        date = dimension_values[date_index].get('value')
+        metric_values = row.get('metricValues', [])
+        for name, index in columns:
+            if index >= len(metric_values):
+                continue
+            try:
+                value = float(metric_values[index].get('value'))
+            except (ValueError, TypeError):
+                value = 0.0
+            metric_series = series[name]
+            metric_series[date] = metric_series.get(date, 0.0) + value
+    
+    return series
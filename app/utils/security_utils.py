@@ -16,6 +16,7 @@ import hashlib
 import secrets  # For generating cryptographically strong random numbers
 import logging
 import base64
+from functools import lru_cache
 from typing import Tuple, Optional, Union  # For type hinting
 
 logger = logging.getLogger(__name__)
@@ -153,6 +154,27 @@ def verify_password(password_to_check: str, stored_hash: bytes, salt: bytes) ->
     return is_match
 
 
+@lru_cache(maxsize=16)
+def _get_fernet(fernet_key: bytes) -> 'Fernet':
+    """
+    Returns a Fernet instance for the given key, reusing it across calls.
+
+    Constructing Fernet decodes and splits the key into its signing and
+    encryption halves; the application encrypts everything with one key, so
+    that work is done once instead of on every encrypt/decrypt call.
+
+    Args:
+        fernet_key (bytes): The Fernet encryption key.
+
+    Returns:
+        Fernet: The cipher for this key.
+
+    Raises:
+        ValueError: If the key is not a valid Fernet key.
+    """
+    return Fernet(fernet_key)
+
+
 def encrypt_data(data: Union[str, bytes], fernet_key: bytes) -> Optional[bytes]:
     """
     Encrypts data using Fernet symmetric encryption.
@@ -176,7 +198,7 @@ def encrypt_data(data: Union[str, bytes], fernet_key: bytes) -> Optional[bytes]:
         return None
 
     try:
-        f = Fernet(fernet_key)
+        f = _get_fernet(fernet_key)
         data_bytes = data.encode('utf-8') if isinstance(data, str) else data
         encrypted_data = f.encrypt(data_bytes)
         logger.debug("Data encrypted successfully.")
@@ -212,7 +234,7 @@ def decrypt_data(encrypted_token: bytes, fernet_key: bytes, ttl: Optional[int] =
         return None
 
     try:
-        f = Fernet(fernet_key)
+        f = _get_fernet(fernet_key)
         if ttl is not None:
             decrypted_bytes = f.decrypt(encrypted_token, ttl=ttl)
         else:
@@ -64,14 +64,6 @@ def create_admin_user(app, email, password, first_name='Admin', last_name='User'
         # Create a combined string in the format used by auth_service.verify_password
         password_hash = f"{hash_base64}:{salt_base64}"
         
-        # Check if user already exists
-        query = "SELECT * FROM users WHERE email = ?"
-        result = database.execute(query, (email,), fetchone=True)
-        
-        if result:
-            logger.warning(f"User with email {email} already exists")
-            return None
-        
         # Get current timestamp in ISO format
         now = datetime.utcnow().isoformat()
             
@@ -92,9 +84,14 @@ def create_admin_user(app, email, password, first_name='Admin', last_name='User'
         placeholders = ", ".join(["?"] * len(user_data))
         values = tuple(user_data.values())
         
-        query = f"INSERT INTO users ({columns}) VALUES ({placeholders})"
+        # An existing email is detected by the insert itself, without a prior SELECT
+        query = f"INSERT INTO users ({columns}) VALUES ({placeholders}) ON CONFLICT(email) DO NOTHING"
         cursor = database.execute(query, values, commit=True)
         
+        if cursor.rowcount == 0:
+            logger.warning(f"User with email {email} already exists")
+            return None
+        
         user_id = cursor.lastrowid
         logger.info(f"Admin user created with ID: {user_id}")
         
@@ -4,13 +4,18 @@ GA4 Account Checker - Identify available GA4 accounts and provide detailed steps
 for setting up property access.
 """
 
+import io
 import os
-import json
+import sys
 import logging
-from google.oauth2.service_account import Credentials
+from contextlib import redirect_stdout
+from functools import lru_cache
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from ga4_auth import get_client_email, get_credentials
+from ga4_helper import normalize_accounts
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,24 +26,24 @@ logger = logging.getLogger(__name__)
 # Path to the credentials file
 CREDENTIALS_PATH = "credentials/ga4_credentials.json"
 
-def get_client_email():
-    """Get the service account email from credentials file"""
-    with open(CREDENTIALS_PATH) as f:
-        creds_data = json.load(f)
-        return creds_data.get('client_email', 'Unknown')
+# Maximum number of calls sent in one batch HTTP request
+BATCH_SIZE = 100
+
+# Keys holding the type-specific data of a GA4 data stream
+_STREAM_KEYS = ('webStreamData', 'androidAppStreamData', 'iosAppStreamData')
+
+@lru_cache(maxsize=1)
+def get_admin_service():
+    """Build the Admin API service once and share it across calls"""
+    credentials, _ = get_credentials(CREDENTIALS_PATH)
+    # Use the discovery document bundled with the client instead of fetching it
+    return build('analyticsadmin', 'v1beta', credentials=credentials, static_discovery=True)
 
 def check_ga4_accounts():
     """Check what GA4 accounts the service account has access to"""
     try:
-        # Initialize credentials
-        scopes = ['https://www.googleapis.com/auth/analytics.readonly']
-        credentials = Credentials.from_service_account_file(
-            CREDENTIALS_PATH, scopes=scopes
-        )
-        
         # Initialize Admin API service
-        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials)
-        admin = analytics_admin.accountSummaries()
+        admin = get_admin_service().accountSummaries()
         
         # Get account summaries
         logger.info("Fetching GA4 account summaries...")
@@ -46,19 +51,43 @@ def check_ga4_accounts():
         
         if 'accountSummaries' in response and response['accountSummaries']:
             accounts = response['accountSummaries']
-            logger.info(f"Found {len(accounts)} GA4 account(s)")
+            logger.info("Found %d GA4 account(s)", len(accounts))
             return accounts
         else:
             logger.warning("No GA4 accounts found. The service account has API access but no account permissions.")
             return []
             
     except HttpError as e:
-        logger.error(f"API error: {e.reason}")
+        logger.error("API error: %s", e.reason)
         return []
     except Exception as e:
-        logger.error(f"Error checking GA4 accounts: {str(e)}")
+        logger.error("Error checking GA4 accounts: %s", e)
         return []
 
+def fetch_data_streams(analytics_admin, property_ids):
+    """
+    List the data streams of several properties using batch HTTP requests.
+    
+    Returns a dict mapping each property ID to its dataStreams.list response,
+    or to the exception raised for that property.
+    """
+    results = {}
+    
+    def on_response(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+    
+    property_ids = list(dict.fromkeys(property_ids))
+    for start in range(0, len(property_ids), BATCH_SIZE):
+        batch = analytics_admin.new_batch_http_request(callback=on_response)
+        for property_id in property_ids[start:start + BATCH_SIZE]:
+            batch.add(
+                analytics_admin.properties().dataStreams().list(parent=f"properties/{property_id}"),
+                request_id=property_id
+            )
+        batch.execute()
+    
+    return results
+
 def list_empty_accounts():
     """List accounts without properties or access to properties"""
     accounts = check_ga4_accounts()
@@ -72,74 +101,77 @@ def list_empty_accounts():
     accounts_with_properties = []
     
     # Check each account for properties
-    for account in accounts:
-        account_id = account['account'].split('/')[-1]
-        account_name = account.get('displayName', 'Unnamed Account')
-        
-        if 'propertySummaries' not in account or not account['propertySummaries']:
-            empty_accounts.append((account_id, account_name))
+    for account in normalize_accounts(accounts):
+        if account.properties:
+            accounts_with_properties.append(account)
         else:
-            accounts_with_properties.append((account_id, account_name, len(account['propertySummaries'])))
+            empty_accounts.append(account)
+    
+    client_email = get_client_email(CREDENTIALS_PATH) or 'Unknown'
     
     # Print results
     print("\n" + "="*80)
     print("GA4 ACCOUNTS ACCESS SUMMARY".center(80))
     print("="*80 + "\n")
     
-    print(f"Service Account: {get_client_email()}")
+    print(f"Service Account: {client_email}")
     print(f"Total GA4 Accounts with access: {len(accounts)}")
     
     if accounts_with_properties:
         print("\nAccounts WITH properties access:")
-        for account_id, account_name, prop_count in accounts_with_properties:
-            print(f"✅ {account_name} (ID: {account_id}) - {prop_count} properties")
-            
-            # Try to list properties for this account
-            try:
-                # Re-initialize credentials and service
-                scopes = ['https://www.googleapis.com/auth/analytics.readonly']
-                credentials = Credentials.from_service_account_file(
-                    CREDENTIALS_PATH, scopes=scopes
-                )
-                analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials)
+        # Fetch the data streams of every property up front in batched requests,
+        # reusing the service (and its HTTP connection) built for the account listing
+        try:
+            streams_by_property = fetch_data_streams(get_admin_service(), [
+                prop.id
+                for account in accounts_with_properties
+                for prop in account.properties
+            ])
+        except Exception as e:
+            print(f"   ⚠️ Error getting streams: {str(e)}")
+            streams_by_property = {}
+        
+        # Collect the per-property lines and write them to stdout at once
+        with redirect_stdout(io.StringIO()) as buf:
+            for account in accounts_with_properties:
+                print(f"✅ {account.name} (ID: {account.id}) - {len(account.properties)} properties")
                 
-                # Get a specific account
-                for account in accounts:
-                    if account['account'].split('/')[-1] == account_id:
-                        # List properties
-                        for prop in account.get('propertySummaries', []):
-                            property_id = prop['property'].split('/')[-1]
-                            property_name = prop.get('displayName', 'Unnamed Property')
-                            print(f"   - Property: {property_name} (ID: {property_id})")
+                # Try to list properties for this account
+                try:
+                    for prop in account.properties:
+                        property_id = prop.id
+                        print(f"   - Property: {prop.name} (ID: {property_id})")
+                        
+                        # Show the data streams fetched for this property
+                        streams_response = streams_by_property.get(property_id)
+                        if isinstance(streams_response, HttpError):
+                            if streams_response.resp.status == 403:
+                                print(f"      ⚠️ Cannot access streams - insufficient permissions")
+                            else:
+                                print(f"      ⚠️ Error getting streams: {streams_response.reason}")
+                            continue
+                        if isinstance(streams_response, Exception):
+                            print(f"      ⚠️ Error getting streams: {str(streams_response)}")
+                            continue
+                        
+                        for stream in (streams_response or {}).get('dataStreams', []):
+                            stream_id = stream['name'].rsplit('/', 1)[-1]
+                            stream_type = next((k for k in _STREAM_KEYS if k in stream), None)
                             
-                            # Try to get data streams
-                            try:
-                                streams_response = analytics_admin.properties().dataStreams().list(
-                                    parent=f"properties/{property_id}"
-                                ).execute()
-                                
-                                for stream in streams_response.get('dataStreams', []):
-                                    stream_id = stream['name'].split('/')[-1]
-                                    stream_type = next((k for k in stream if k.endswith('StreamData')), None)
-                                    
-                                    if stream_type == 'webStreamData':
-                                        uri = stream.get('webStreamData', {}).get('defaultUri', 'Unknown')
-                                        print(f"      - Website: {uri} (ID: {stream_id})")
-                                    else:
-                                        name = stream.get('displayName', 'Unnamed Stream')
-                                        print(f"      - Stream: {name} (ID: {stream_id}, Type: {stream_type})")
-                            except HttpError as e:
-                                if e.resp.status == 403:
-                                    print(f"      ⚠️ Cannot access streams - insufficient permissions")
-                                else:
-                                    print(f"      ⚠️ Error getting streams: {e.reason}")
-            except Exception as e:
-                print(f"   ⚠️ Error listing properties: {str(e)}")
+                            if stream_type == 'webStreamData':
+                                uri = stream.get('webStreamData', {}).get('defaultUri', 'Unknown')
+                                print(f"      - Website: {uri} (ID: {stream_id})")
+                            else:
+                                name = stream.get('displayName', 'Unnamed Stream')
+                                print(f"      - Stream: {name} (ID: {stream_id}, Type: {stream_type})")
+                except Exception as e:
+                    print(f"   ⚠️ Error listing properties: {str(e)}")
+        sys.stdout.write(buf.getvalue())
     
     if empty_accounts:
         print("\nAccounts WITHOUT properties access:")
-        for account_id, account_name in empty_accounts:
-            print(f"❌ {account_name} (ID: {account_id}) - No properties or no access to properties")
+        for account in empty_accounts:
+            print(f"❌ {account.name} (ID: {account.id}) - No properties or no access to properties")
     
     print("\n" + "="*80)
     print("NEXT STEPS".center(80))
@@ -151,19 +183,19 @@ def list_empty_accounts():
         if accounts:
             print(f"1. Go to GA4 Admin > Property Access Management for your property")
             print(f"2. Add the service account email as a user:")
-            print(f"   {get_client_email()}")
+            print(f"   {client_email}")
             print(f"3. Grant at least 'Viewer' role")
         else:
             print(f"1. Go to GA4 Admin > Account Access Management")
             print(f"2. Add the service account email as a user:")
-            print(f"   {get_client_email()}")
+            print(f"   {client_email}")
             print(f"3. Grant at least 'Viewer' role")
             print(f"4. Then add access to specific properties")
     else:
         print("To access any properties marked with ⚠️, you need to:")
         print(f"1. Go to GA4 Admin > Property Access Management for that property")
         print(f"2. Add the service account email as a user:")
-        print(f"   {get_client_email()}")
+        print(f"   {client_email}")
         print(f"3. Grant at least 'Viewer' role")
     
     print("\nAfter adding permissions, wait a few minutes and run this script again to verify access.")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+GA4 Auth - Shared service account credential loading for the GA4 scripts.
+
+Parsing the credentials file and its private key is the slowest part of a
+script's start-up, so the result is cached per file, modification time and
+scopes. Also provides a retrying execute for Admin API requests.
+"""
+
+import os
+import json
+import time
+import random
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from google.oauth2.service_account import Credentials
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Path to the credentials file
+CREDENTIALS_PATH = "credentials/ga4_credentials.json"
+
+# Default scopes for read-only GA4 access
+READONLY_SCOPES = ('https://www.googleapis.com/auth/analytics.readonly',)
+
+# HTTP statuses worth retrying; 403 only when it is a rate limit (see is_retriable_error)
+RETRY_STATUSES = (403, 429, 500, 503)
+MAX_RETRY_DELAY = 60  # Seconds
+
+@lru_cache(maxsize=4)
+def _load_creds_dict(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse the credentials file; mtime only keys the cache"""
+    with open(path) as f:
+        return json.load(f)
+
+@lru_cache(maxsize=4)
+def _load_credentials(path: str, mtime: float, scopes: Tuple[str, ...]) -> Tuple[Credentials, Dict[str, Any]]:
+    """Build the credentials from the parsed credentials file; mtime only keys the cache"""
+    creds_data = _load_creds_dict(path, mtime)
+    credentials = Credentials.from_service_account_info(creds_data, scopes=list(scopes))
+    return credentials, creds_data
+
+def get_credentials(path: str = CREDENTIALS_PATH,
+                    scopes: Iterable[str] = READONLY_SCOPES) -> Tuple[Credentials, Dict[str, Any]]:
+    """
+    Get service account credentials and the parsed credentials file.
+
+    Repeated calls for an unchanged file and the same scopes return the
+    cached objects; editing the file loads it again.
+
+    Args:
+        path: Path to the service account credentials file
+        scopes: OAuth scopes for the credentials
+
+    Returns:
+        Tuple of (credentials, credentials file contents)
+    """
+    return _load_credentials(path, os.path.getmtime(path), tuple(scopes))
+
+def get_client_email(path: str = CREDENTIALS_PATH) -> Optional[str]:
+    """
+    Get the service account email from the credentials file.
+
+    Reads the cached file contents without building credentials, so the
+    private key is not parsed.
+
+    Args:
+        path: Path to the service account credentials file
+
+    Returns:
+        The client email, or None if the file has none
+    """
+    return _load_creds_dict(path, os.path.getmtime(path)).get('client_email')
+
+def is_retriable_error(error: HttpError) -> bool:
+    """
+    Whether an API error is a rate limit or transient server error.
+
+    Args:
+        error: The error raised for an API request
+
+    Returns:
+        True if the request is worth retrying
+    """
+    status = error.resp.status
+    if status not in RETRY_STATUSES:
+        return False
+    if status == 403:
+        # A 403 is usually a missing permission; only rate limits are worth retrying
+        return b'ratelimitexceeded' in (error.content or b'').lower()
+    return True
+
+def execute_with_retry(request, max_attempts: int = 5) -> Any:
+    """
+    Execute an API request, retrying rate limits and transient server errors.
+
+    Waits for the Retry-After header when the response has one, otherwise
+    backs off exponentially with jitter, capped at MAX_RETRY_DELAY seconds.
+
+    Args:
+        request: googleapiclient HttpRequest to execute
+        max_attempts: Total number of attempts before giving up
+
+    Returns:
+        The parsed JSON response
+
+    Raises:
+        HttpError: If the error is not retriable or every attempt failed
+    """
+    for attempt in range(max_attempts):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == max_attempts - 1 or not is_retriable_error(e):
+                raise
+            try:
+                delay = float(e.resp.get('retry-after'))
+            except (TypeError, ValueError):
+                delay = 2 ** attempt + random.random()
+            delay = min(delay, MAX_RETRY_DELAY)
+            logger.warning("API request failed with HTTP %s, retrying in %.1fs (attempt %d of %d)",
+                           e.resp.status, delay, attempt + 1, max_attempts)
+            time.sleep(delay)
@@ -9,16 +9,30 @@ This script provides utility functions to:
 4. Output in a structured format for integration with the dashboard
 """
 
+import io
 import os
+import sys
 import json
 import logging
 import datetime
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# orjson is optional; it speeds up writing the property export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
-    from google.oauth2.service_account import Credentials
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from ga4_auth import get_client_email, get_credentials
     GA4_LIBRARIES_AVAILABLE = True
 except ImportError:
     GA4_LIBRARIES_AVAILABLE = False
@@ -33,6 +47,65 @@ logger = logging.getLogger(__name__)
 # Path to the credentials file
 CREDENTIALS_PATH = "credentials/ga4_credentials.json"
 
+# Maximum number of calls sent in one batch HTTP request
+BATCH_SIZE = 100
+
+# Page size when listing the properties of a single account
+ACCOUNT_PROPERTIES_PAGE_SIZE = 200
+
+# Maximum number of concurrent per-property report requests
+MAX_WORKERS = 8
+
+@dataclass
+class PropertySummary:
+    """A GA4 property from an account summary, with its ID already extracted"""
+    __slots__ = ('id', 'name', 'create_time')
+    id: str
+    name: str
+    create_time: str
+
+@dataclass
+class AccountSummary:
+    """A GA4 account summary, with its ID and its properties' IDs already extracted"""
+    __slots__ = ('id', 'name', 'properties')
+    id: str
+    name: str
+    properties: List[PropertySummary]
+
+def normalize_accounts(accounts: List[Dict[str, Any]]) -> List[AccountSummary]:
+    """
+    Convert raw accountSummaries.list results into AccountSummary objects in one pass.
+    
+    Resource names such as 'accounts/123' and 'properties/456' are parsed once
+    here instead of wherever an ID is needed.
+    
+    Args:
+        accounts: Account summaries from the Admin API
+        
+    Returns:
+        List of AccountSummary objects in the same order
+    """
+    return [
+        AccountSummary(
+            id=account['account'].rsplit('/', 1)[-1],
+            name=account.get('displayName', 'Unnamed Account'),
+            properties=[
+                PropertySummary(
+                    id=prop['property'].rsplit('/', 1)[-1],
+                    name=prop.get('displayName', 'Unnamed Property'),
+                    create_time=prop.get('createTime', '')
+                )
+                for prop in account.get('propertySummaries', [])
+            ]
+        )
+        for account in accounts
+    ]
+
+@lru_cache(maxsize=32)
+def _date_range(days: int, today: datetime.date) -> Tuple[str, str]:
+    """Return the (start, end) ISO dates covering the last `days` days up to `today`"""
+    return (today - datetime.timedelta(days=days)).isoformat(), today.isoformat()
+
 class GA4Helper:
     """Helper class for GA4 operations"""
     
@@ -40,48 +113,67 @@ class GA4Helper:
         """Initialize the GA4 Helper"""
         self.credentials_path = credentials_path
         self.scopes = ['https://www.googleapis.com/auth/analytics.readonly']
-        self._analytics_admin = None
-        self._analytics_data = None
+        self._thread_local = threading.local()
         
         # Check if GA4 libraries are available
         if not GA4_LIBRARIES_AVAILABLE:
             logger.error("Google libraries not installed. Run: pip install google-api-python-client google-auth")
-            return
             
         # Check if credentials file exists
-        if not os.path.exists(self.credentials_path):
-            logger.error(f"Credentials file not found at {self.credentials_path}")
-            return
-            
-        # Initialize services
+        elif not os.path.exists(self.credentials_path):
+            logger.error("Credentials file not found at %s", self.credentials_path)
+    
+    @cached_property
+    def _credentials(self):
+        """Service account credentials, loaded on first use"""
+        if not GA4_LIBRARIES_AVAILABLE or not os.path.exists(self.credentials_path):
+            return None
         try:
-            # Load service account credentials
-            credentials = Credentials.from_service_account_file(
-                self.credentials_path, scopes=self.scopes
-            )
-            
-            # Initialize analytics admin API (for account and property info)
-            self._analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials)
-            
-            # Initialize analytics data API (for report data)
-            self._analytics_data = build('analyticsdata', 'v1beta', credentials=credentials)
-            
-            logger.info("GA4 services initialized successfully")
+            credentials, _ = get_credentials(self.credentials_path, self.scopes)
+            return credentials
         except Exception as e:
-            logger.error(f"Failed to initialize GA4 services: {str(e)}")
+            logger.error("Failed to load GA4 credentials: %s", e)
+            return None
+    
+    @cached_property
+    def _analytics_admin(self):
+        """Analytics admin API (for account and property info), built on first use"""
+        # Use the discovery document bundled with the client instead of fetching it
+        return build('analyticsadmin', 'v1beta', credentials=self._credentials,
+                     static_discovery=True)
+    
+    @cached_property
+    def _analytics_data(self):
+        """Analytics data API (for report data), built on first use"""
+        return build('analyticsdata', 'v1beta', credentials=self._credentials,
+                     static_discovery=True)
     
     def is_available(self) -> bool:
         """Check if GA4 services are available"""
-        return self._analytics_admin is not None and self._analytics_data is not None
+        return self._credentials is not None
+    
+    def _get_data_service(self):
+        """
+        Get the analytics data API service for the calling thread.
+        
+        The HTTP client behind a service is not thread-safe, so worker threads
+        build their own service while the main thread uses the shared one.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self._analytics_data
+        service = getattr(self._thread_local, 'analytics_data', None)
+        if service is None:
+            service = build('analyticsdata', 'v1beta', credentials=self._credentials,
+                            static_discovery=True)
+            self._thread_local.analytics_data = service
+        return service
     
     def get_service_account_email(self) -> Optional[str]:
         """Get the service account email from credentials file"""
         try:
-            with open(self.credentials_path) as f:
-                creds_data = json.load(f)
-                return creds_data.get('client_email')
+            return get_client_email(self.credentials_path)
         except Exception as e:
-            logger.error(f"Error reading credentials file: {str(e)}")
+            logger.error("Error reading credentials file: %s", e)
             return None
     
     def list_accounts(self) -> List[Dict[str, Any]]:
@@ -93,76 +185,211 @@ class GA4Helper:
         try:
             response = self._analytics_admin.accountSummaries().list().execute()
             accounts = response.get('accountSummaries', [])
-            logger.info(f"Found {len(accounts)} GA4 account(s)")
+            logger.info("Found %d GA4 account(s)", len(accounts))
             return accounts
         except HttpError as e:
-            logger.error(f"API error: {e.reason}")
+            logger.error("API error: %s", e.reason)
             return []
         except Exception as e:
-            logger.error(f"Error listing accounts: {str(e)}")
+            logger.error("Error listing accounts: %s", e)
             return []
     
-    def list_properties(self, account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_account_summary(self, account_id: str) -> Optional[AccountSummary]:
         """
-        List properties, optionally filtered by account ID.
+        Get one GA4 account and its properties without listing all accounts.
         
         Args:
-            account_id: Optional GA4 account ID to filter properties
+            account_id: GA4 account ID
             
         Returns:
-            List of property dictionaries
+            AccountSummary for the account, or None if it could not be fetched
         """
         if not self.is_available():
             logger.error("GA4 services not available")
-            return []
-            
+            return None
+        
         try:
-            accounts = self.list_accounts()
+            account = self._analytics_admin.accounts().get(name=f"accounts/{account_id}").execute()
+            
             properties = []
+            request = self._analytics_admin.properties().list(
+                filter=f"parent:accounts/{account_id}", pageSize=ACCOUNT_PROPERTIES_PAGE_SIZE
+            )
+            while request is not None:
+                response = request.execute()
+                for prop in response.get('properties', []):
+                    properties.append(PropertySummary(
+                        id=prop['name'].rsplit('/', 1)[-1],
+                        name=prop.get('displayName', 'Unnamed Property'),
+                        create_time=prop.get('createTime', '')
+                    ))
+                request = self._analytics_admin.properties().list_next(request, response)
+            
+            return AccountSummary(
+                id=account_id,
+                name=account.get('displayName', 'Unnamed Account'),
+                properties=properties
+            )
+        except HttpError as e:
+            logger.error("API error: %s", e.reason)
+            return None
+        except Exception as e:
+            logger.error("Error getting account %s: %s", account_id, e)
+            return None
+    
+    def iter_properties(self, account_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield properties, optionally filtered by account ID.
+        
+        Website information is fetched in batched requests of up to BATCH_SIZE
+        properties, and each batch is yielded before the next one is fetched.
+        
+        Args:
+            account_id: Optional GA4 account ID to filter properties
+            
+        Yields:
+            Property dictionaries
+        """
+        if not self.is_available():
+            logger.error("GA4 services not available")
+            return
+        
+        try:
+            if account_id:
+                # Look up just the requested account instead of listing every account
+                account = self.get_account_summary(account_id)
+                accounts = [account] if account else []
+            else:
+                accounts = normalize_accounts(self.list_accounts())
             
+            pending = []
             for account in accounts:
-                # Skip if account_id is specified and doesn't match
-                if account_id and account['account'].split('/')[-1] != account_id:
-                    continue
-                    
-                account_name = account.get('displayName', 'Unnamed Account')
-                account_id = account['account'].split('/')[-1]
-                
                 # Get properties from account summary
-                for prop in account.get('propertySummaries', []):
-                    property_id = prop['property'].split('/')[-1]
-                    property_name = prop.get('displayName', 'Unnamed Property')
-                    
-                    # Get property details
-                    property_details = {
-                        'account_id': account_id,
-                        'account_name': account_name,
-                        'property_id': property_id,
-                        'property_name': property_name,
-                        'create_time': prop.get('createTime', ''),
+                for prop in account.properties:
+                    pending.append({
+                        'account_id': account.id,
+                        'account_name': account.name,
+                        'property_id': prop.id,
+                        'property_name': prop.name,
+                        'create_time': prop.create_time,
                         'websites': []
-                    }
-                    
-                    # Try to get website information
-                    try:
-                        streams = self._analytics_admin.properties().dataStreams().list(
-                            parent=f"properties/{property_id}"
-                        ).execute()
-                        
-                        for stream in streams.get('dataStreams', []):
-                            if stream.get('webStreamData'):
-                                website_url = stream.get('webStreamData', {}).get('defaultUri', '')
-                                if website_url:
-                                    property_details['websites'].append(website_url)
-                    except Exception as e:
-                        logger.warning(f"Could not fetch website info for property {property_id}: {str(e)}")
-                    
-                    properties.append(property_details)
+                    })
+                    if len(pending) == BATCH_SIZE:
+                        yield from self._add_websites(pending)
+                        pending = []
             
-            return properties
+            if pending:
+                yield from self._add_websites(pending)
         except Exception as e:
-            logger.error(f"Error listing properties: {str(e)}")
-            return []
+            logger.error("Error listing properties: %s", e)
+    
+    def list_properties(self, account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List properties, optionally filtered by account ID.
+        
+        Args:
+            account_id: Optional GA4 account ID to filter properties
+            
+        Returns:
+            List of property dictionaries
+        """
+        return list(self.iter_properties(account_id))
+    
+    def _add_websites(self, properties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in the website URLs of a batch of property dictionaries"""
+        streams_by_property = self.list_data_streams([p['property_id'] for p in properties])
+        for property_details in properties:
+            for stream in streams_by_property.get(property_details['property_id'], ()):
+                web_stream_data = stream.get('webStreamData')
+                if web_stream_data and (website_url := web_stream_data.get('defaultUri')):
+                    property_details['websites'].append(website_url)
+        return properties
+    
+    def list_data_streams(self, property_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the data streams of several properties using batch HTTP requests.
+        
+        Args:
+            property_ids: GA4 property IDs
+            
+        Returns:
+            Dictionary mapping each property ID to its data streams. Properties
+            whose streams could not be fetched are omitted.
+        """
+        if not self.is_available():
+            logger.error("GA4 services not available")
+            return {}
+        
+        property_ids = list(dict.fromkeys(property_ids))
+        streams_by_property = {}
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Could not fetch website info for property %s: %s", request_id, exception)
+                return
+            streams_by_property[request_id] = response.get('dataStreams', [])
+        
+        for start in range(0, len(property_ids), BATCH_SIZE):
+            batch = self._analytics_admin.new_batch_http_request(callback=on_response)
+            for property_id in property_ids[start:start + BATCH_SIZE]:
+                batch.add(
+                    self._analytics_admin.properties().dataStreams().list(
+                        parent=f"properties/{property_id}"
+                    ),
+                    request_id=property_id
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning("Batch request for data streams failed: %s", e)
+        
+        return streams_by_property
+    
+    def _realtime_users_request(self, property_id: str):
+        """Build the realtime active users request for a property"""
+        return self._get_data_service().properties().runRealtimeReport(
+            property=f"properties/{property_id}",
+            body={
+                "metrics": [{"name": "activeUsers"}]
+            }
+        )
+    
+    def _traffic_metrics_request(self, property_id: str, days: int):
+        """Build the traffic metrics report request for a property"""
+        # Calculate date range
+        start_date, end_date = _date_range(days, datetime.date.today())
+        
+        return self._get_data_service().properties().runReport(
+            property=f"properties/{property_id}",
+            body={
+                "dateRanges": [{"startDate": start_date, "endDate": end_date}],
+                "metrics": [
+                    {"name": "sessions"},
+                    {"name": "totalUsers"},
+                    {"name": "newUsers"},
+                    {"name": "screenPageViews"},
+                    {"name": "averageSessionDuration"}
+                ]
+            }
+        )
+    
+    @staticmethod
+    def _parse_active_users(report: Dict[str, Any]) -> int:
+        """Extract the active users count from a realtime report"""
+        if 'rows' in report and len(report['rows']) > 0:
+            return int(report['rows'][0]['metricValues'][0]['value'])
+        return 0
+    
+    @staticmethod
+    def _parse_traffic_metrics(report: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the metric values from a traffic metrics report"""
+        metrics = {}
+        if 'rows' in report and len(report['rows']) > 0:
+            for i, header in enumerate(report.get('metricHeaders', [])):
+                metric_name = header.get('name', f'metric_{i}')
+                metric_value = report['rows'][0]['metricValues'][i]['value']
+                metrics[metric_name] = metric_value
+        return metrics
     
     def get_real_time_users(self, property_id: str) -> int:
         """
@@ -179,18 +406,10 @@ class GA4Helper:
             return 0
             
         try:
-            report = self._analytics_data.properties().runRealtimeReport(
-                property=f"properties/{property_id}",
-                body={
-                    "metrics": [{"name": "activeUsers"}]
-                }
-            ).execute()
-            
-            if 'rows' in report and len(report['rows']) > 0:
-                return int(report['rows'][0]['metricValues'][0]['value'])
-            return 0
+            report = self._realtime_users_request(property_id).execute()
+            return self._parse_active_users(report)
         except Exception as e:
-            logger.error(f"Error getting real-time users: {str(e)}")
+            logger.error("Error getting real-time users: %s", e)
             return 0
     
     def get_traffic_metrics(self, property_id: str, days: int = 30) -> Dict[str, Any]:
@@ -209,37 +428,115 @@ class GA4Helper:
             return {}
             
         try:
-            # Calculate date range
-            end_date = datetime.datetime.now().strftime('%Y-%m-%d')
-            start_date = (datetime.datetime.now() - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
-            
-            # Run report
-            report = self._analytics_data.properties().runReport(
-                property=f"properties/{property_id}",
-                body={
-                    "dateRanges": [{"startDate": start_date, "endDate": end_date}],
-                    "metrics": [
-                        {"name": "sessions"},
-                        {"name": "totalUsers"},
-                        {"name": "newUsers"},
-                        {"name": "screenPageViews"},
-                        {"name": "averageSessionDuration"}
-                    ]
-                }
-            ).execute()
-            
-            # Process results
-            metrics = {}
-            if 'rows' in report and len(report['rows']) > 0:
-                for i, header in enumerate(report.get('metricHeaders', [])):
-                    metric_name = header.get('name', f'metric_{i}')
-                    metric_value = report['rows'][0]['metricValues'][i]['value']
-                    metrics[metric_name] = metric_value
-            
-            return metrics
+            report = self._traffic_metrics_request(property_id, days).execute()
+            return self._parse_traffic_metrics(report)
         except Exception as e:
-            logger.error(f"Error getting traffic metrics: {str(e)}")
+            logger.error("Error getting traffic metrics: %s", e)
             return {}
+    
+    def get_property_snapshot(self, property_id: str, days: int = 30) -> Dict[str, Any]:
+        """
+        Get real-time active users and traffic metrics for a GA4 property in one batch request.
+        
+        Args:
+            property_id: GA4 property ID
+            days: Number of days of traffic data to retrieve
+            
+        Returns:
+            Dictionary with 'active_users' (int) and 'metrics' (dict). A part whose
+            request failed keeps its default of 0 or an empty dict.
+        """
+        snapshot = {'active_users': 0, 'metrics': {}}
+        if not self.is_available():
+            logger.error("GA4 services not available")
+            return snapshot
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.error("Error getting %s for property %s: %s", request_id.replace('_', ' '), property_id, exception)
+            elif request_id == 'active_users':
+                snapshot['active_users'] = self._parse_active_users(response)
+            else:
+                snapshot['metrics'] = self._parse_traffic_metrics(response)
+        
+        try:
+            batch = self._get_data_service().new_batch_http_request(callback=on_response)
+            batch.add(self._realtime_users_request(property_id), request_id='active_users')
+            batch.add(self._traffic_metrics_request(property_id, days), request_id='traffic_metrics')
+            batch.execute()
+        except Exception as e:
+            logger.error("Error getting property snapshot: %s", e)
+        
+        return snapshot
+
+class NullHelper:
+    """Stand-in for GA4Helper when the Google libraries or credentials are missing"""
+    
+    def is_available(self) -> bool:
+        """GA4 services are never available"""
+        return False
+    
+    def get_service_account_email(self) -> Optional[str]:
+        return None
+    
+    def list_accounts(self) -> List[Dict[str, Any]]:
+        return []
+    
+    def get_account_summary(self, account_id: str) -> Optional[AccountSummary]:
+        return None
+    
+    def iter_properties(self, account_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        return iter(())
+    
+    def list_properties(self, account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return []
+    
+    def list_data_streams(self, property_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return {}
+    
+    def get_real_time_users(self, property_id: str) -> int:
+        return 0
+    
+    def get_traffic_metrics(self, property_id: str, days: int = 30) -> Dict[str, Any]:
+        return {}
+    
+    def get_property_snapshot(self, property_id: str, days: int = 30) -> Dict[str, Any]:
+        return {'active_users': 0, 'metrics': {}}
+
+def make_helper(credentials_path: str = CREDENTIALS_PATH) -> Union[GA4Helper, NullHelper]:
+    """
+    Create a GA4Helper, or a NullHelper when it could never be available.
+    
+    Args:
+        credentials_path: Path to the service account credentials file
+        
+    Returns:
+        GA4Helper if the Google libraries are installed and the credentials
+        file exists, otherwise a NullHelper with the same interface
+    """
+    if not GA4_LIBRARIES_AVAILABLE:
+        logger.error("Google libraries not installed. Run: pip install google-api-python-client google-auth")
+        return NullHelper()
+    if not os.path.exists(credentials_path):
+        logger.error("Credentials file not found at %s", credentials_path)
+        return NullHelper()
+    return GA4Helper(credentials_path)
+
+@lru_cache(maxsize=4)
+def get_helper(credentials_path: str = CREDENTIALS_PATH) -> Union[GA4Helper, NullHelper]:
+    """
+    Get a shared helper for a credentials file.
+    
+    Repeated callers reuse the same instance, so its credentials and API
+    services are loaded and built only once per process.
+    
+    Args:
+        credentials_path: Path to the service account credentials file
+        
+    Returns:
+        The cached helper from make_helper
+    """
+    return make_helper(credentials_path)
 
 def print_setup_instructions(email: str):
     """Print GA4 setup instructions"""
@@ -271,8 +568,8 @@ def print_setup_instructions(email: str):
 
 def check_permissions_and_print_results():
     """Check GA4 permissions and print results"""
-    # Create helper
-    helper = GA4Helper()
+    # Get the shared helper
+    helper = get_helper()
     
     if not helper.is_available():
         print("\nGA4 services not available. Check that required libraries are installed.")
@@ -285,7 +582,7 @@ def check_permissions_and_print_results():
         return
     
     # List accounts
-    accounts = helper.list_accounts()
+    accounts = normalize_accounts(helper.list_accounts())
     
     print("\n" + "="*80)
     print("GA4 PERMISSIONS CHECK".center(80))
@@ -298,55 +595,75 @@ def check_permissions_and_print_results():
         print_setup_instructions(email)
         return
     
-    print(f"\nFound {len(accounts)} accessible GA4 account(s):")
-    for account in accounts:
-        account_id = account['account'].split('/')[-1]
-        account_name = account.get('displayName', 'Unnamed Account')
-        property_count = len(account.get('propertySummaries', []))
-        
-        print(f"\n- Account: {account_name} (ID: {account_id})")
-        print(f"  Properties: {property_count}")
+    account_property_ids = {prop.id for account in accounts for prop in account.properties}
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # List all properties (with their websites) once and index them by ID. Real-time
+        # users and 7-day metrics are requested concurrently, one batch request per
+        # property, only for listed properties of an account, since only those are
+        # printed; results are printed below in account and property order
+        props_by_id = {}
+        property_futures = {}
+        for p in helper.iter_properties():
+            property_id = p['property_id']
+            props_by_id[property_id] = p
+            if property_id in account_property_ids and property_id not in property_futures:
+                property_futures[property_id] = executor.submit(helper.get_property_snapshot, property_id, 7)
         
-        # List properties for this account
-        if property_count > 0:
-            for prop in account.get('propertySummaries', []):
-                property_id = prop['property'].split('/')[-1]
-                property_name = prop.get('displayName', 'Unnamed Property')
+        print(f"\nFound {len(accounts)} accessible GA4 account(s):")
+        for account in accounts:
+            # Collect each account's lines and write them to stdout at once
+            with redirect_stdout(io.StringIO()) as buf:
+                property_count = len(account.properties)
                 
-                print(f"  - Property: {property_name} (ID: {property_id})")
+                print(f"\n- Account: {account.name} (ID: {account.id})")
+                print(f"  Properties: {property_count}")
                 
-                # Try to get website info and real-time users
-                try:
-                    # Get websites
-                    properties = helper.list_properties(account_id)
-                    for p in properties:
-                        if p['property_id'] == property_id:
-                            websites = p.get('websites', [])
-                            if websites:
-                                print(f"    Websites: {', '.join(websites)}")
-                            
-                            # Get real-time users
-                            active_users = helper.get_real_time_users(property_id)
-                            print(f"    Active Users (now): {active_users}")
-                            
-                            # Get basic metrics
-                            metrics = helper.get_traffic_metrics(property_id, 7)
-                            if metrics:
-                                print(f"    Last 7 days:")
-                                print(f"      Sessions: {metrics.get('sessions', 'N/A')}")
-                                print(f"      Users: {metrics.get('totalUsers', 'N/A')}")
-                                print(f"      New Users: {metrics.get('newUsers', 'N/A')}")
-                                print(f"      Page Views: {metrics.get('screenPageViews', 'N/A')}")
-                except Exception as e:
-                    print(f"    Error getting details: {str(e)}")
-        
+                # List properties for this account
+                if property_count > 0:
+                    for prop in account.properties:
+                        property_id = prop.id
+                        
+                        print(f"  - Property: {prop.name} (ID: {property_id})")
+                        
+                        # Try to get website info and real-time users
+                        try:
+                            # Get websites
+                            p = props_by_id.get(property_id)
+                            if p is not None:
+                                websites = p.get('websites', [])
+                                if websites:
+                                    print(f"    Websites: {', '.join(websites)}")
+                                
+                                snapshot = property_futures[property_id].result()
+                                
+                                # Get real-time users
+                                active_users = snapshot['active_users']
+                                print(f"    Active Users (now): {active_users}")
+                                
+                                # Get basic metrics
+                                metrics = snapshot['metrics']
+                                if metrics:
+                                    print(f"    Last 7 days:")
+                                    print(f"      Sessions: {metrics.get('sessions', 'N/A')}")
+                                    print(f"      Users: {metrics.get('totalUsers', 'N/A')}")
+                                    print(f"      New Users: {metrics.get('newUsers', 'N/A')}")
+                                    print(f"      Page Views: {metrics.get('screenPageViews', 'N/A')}")
+                        except Exception as e:
+                            print(f"    Error getting details: {str(e)}")
+            sys.stdout.write(buf.getvalue())
+    
     print("\n" + "="*80)
     
     # Save property info to file
-    properties = helper.list_properties()
+    properties = list(props_by_id.values())
     if properties:
-        with open('ga4_properties.json', 'w') as f:
-            json.dump(properties, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open('ga4_properties.json', 'wb') as f:
+                f.write(orjson.dumps(properties, option=orjson.OPT_INDENT_2))
+        else:
+            with open('ga4_properties.json', 'w', encoding='utf-8') as f:
+                f.write(json.dumps(properties, indent=2, ensure_ascii=False))
         print(f"\nProperty information saved to ga4_properties.json")
         print("You can use this file with the GA4 Analytics Dashboard")
     
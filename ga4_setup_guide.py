@@ -4,13 +4,17 @@ GA4 Setup Guide - Testing credentials and explaining required permissions
 """
 
 import os
-import json
 import logging
 import datetime
-from google.oauth2.service_account import Credentials
+from typing import Optional, Tuple
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from ga4_auth import CREDENTIALS_PATH, execute_with_retry, get_credentials
+
+# API maximum for accountSummaries.list
+ACCOUNT_SUMMARIES_PAGE_SIZE = 200
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,10 +22,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Path to the credentials file
-CREDENTIALS_PATH = "credentials/ga4_credentials.json"
-
-def print_setup_instructions():
+def print_setup_instructions(email: Optional[str] = None):
     """Print instructions for setting up GA4 permissions"""
     print("\n" + "="*80)
     print("GA4 PERMISSIONS SETUP GUIDE".center(80))
@@ -36,10 +37,7 @@ def print_setup_instructions():
     print("2. Grant access to your service account")
     print("   - Go to Admin > Account Access Management")
     print("   - Click the '+' button to add a new user")
-    with open(CREDENTIALS_PATH) as f:
-        creds_data = json.load(f)
-        email = creds_data.get('client_email', 'YOUR_SERVICE_ACCOUNT_EMAIL')
-        print(f"   - Enter the service account email: {email}")
+    print(f"   - Enter the service account email: {email or 'YOUR_SERVICE_ACCOUNT_EMAIL'}")
     print("   - Select 'Viewer' role at minimum (or higher if needed)")
     print("   - Click 'Add'\n")
     
@@ -57,60 +55,70 @@ def print_setup_instructions():
     
     print("="*80)
 
-def test_ga4_credentials():
-    """Test if the GA4 credentials are valid and have correct permissions."""
+def test_ga4_credentials() -> Tuple[bool, Optional[str]]:
+    """
+    Test if the GA4 credentials are valid and have correct permissions.
+    
+    Returns:
+        Tuple of (whether any GA4 account is accessible, service account email
+        or None if the credentials could not be read)
+    """
+    email = None
     try:
         # Check if credentials file exists
         if not os.path.exists(CREDENTIALS_PATH):
             logger.error(f"Credentials file not found at {CREDENTIALS_PATH}")
-            return False
+            return False, email
         
         logger.info(f"Found credentials file at {CREDENTIALS_PATH}")
         
-        # Display service account email
-        with open(CREDENTIALS_PATH) as f:
-            creds_data = json.load(f)
-            email = creds_data.get('client_email')
-            if email:
-                logger.info(f"Using service account: {email}")
-        
         # Initialize credentials
-        scopes = ['https://www.googleapis.com/auth/analytics.readonly']
-        credentials = Credentials.from_service_account_file(
-            CREDENTIALS_PATH, scopes=scopes
-        )
+        credentials, creds_data = get_credentials(CREDENTIALS_PATH)
+        
+        # Display service account email
+        email = creds_data.get('client_email')
+        if email:
+            logger.info(f"Using service account: {email}")
         
         # Initialize Admin API service
-        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials)
+        # Load the discovery document bundled with the client library rather than
+        # downloading it; there is then nothing for the discovery file cache to do
+        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
         admin = analytics_admin.accountSummaries()
         
-        # Test API access by listing account summaries
+        # Test API access by listing account summaries, using the maximum page size
         logger.info("Testing API access by listing account summaries...")
-        response = admin.list().execute()
+        accounts = []
+        request = admin.list(pageSize=ACCOUNT_SUMMARIES_PAGE_SIZE)
+        while request is not None:
+            response = execute_with_retry(request)
+            accounts.extend(response.get('accountSummaries', []))
+            request = admin.list_next(request, response)
         
-        if 'accountSummaries' in response and response['accountSummaries']:
-            account_count = len(response['accountSummaries'])
+        if accounts:
+            account_count = len(accounts)
             logger.info(f"SUCCESS: Retrieved {account_count} account(s)")
             
             # Show account details
-            for account in response['accountSummaries']:
+            for account in accounts:
                 account_id = account['account'].split('/')[-1]
                 account_name = account.get('displayName', 'Unnamed Account')
                 property_count = len(account.get('propertySummaries', []))
                 
                 logger.info(f"Account: {account_name} (ID: {account_id}) - {property_count} properties")
             
-            return True
+            return True, email
         else:
             logger.warning("No accounts found. The service account doesn't have access to any GA4 accounts.")
-            return False
+            return False, email
             
     except HttpError as e:
         logger.error(f"API error: {e.reason}")
-        return False
+        return False, email
     except Exception as e:
         logger.error(f"Error testing credentials: {str(e)}")
-        return False
+        return False, email
 
 if __name__ == "__main__":
     try:
@@ -124,11 +132,11 @@ if __name__ == "__main__":
     print("\nTesting GA4 credentials...\n")
     
     # First test if credentials are valid
-    success = test_ga4_credentials()
+    success, email = test_ga4_credentials()
     
     if not success:
         # Print setup instructions
-        print_setup_instructions()
+        print_setup_instructions(email)
     else:
         print("\n" + "="*80)
         print("GA4 CREDENTIALS TEST SUCCESSFUL".center(80))
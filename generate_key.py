@@ -23,18 +23,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-try:
-    from cryptography.fernet import Fernet
-    FERNET_AVAILABLE = True
-except ImportError:
-    logger.warning("Cryptography package not installed. Please install with: pip install cryptography")
-    FERNET_AVAILABLE = False
-
 
 def generate_encryption_key():
     """Generate a new Fernet encryption key."""
-    if not FERNET_AVAILABLE:
-        logger.error("Cannot generate key: cryptography package not available")
+    # Imported here so the cryptography extension is only loaded when a key is generated
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        logger.error("Cannot generate key: cryptography package not available. "
+                     "Please install with: pip install cryptography")
         return None
         
     try:
@@ -53,17 +50,21 @@ def save_key_to_file(key, file_path):
         file_path: Path where to save the key
     """
     try:
+        path = Path(file_path)
+        
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write the key to the file
-        with open(file_path, 'wb') as f:
+        # Create the file readable only by the owner (0600), so the key is
+        # never briefly readable by others; this is crucial for security
+        # on Unix-like systems
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+        with os.fdopen(fd, 'wb') as f:
             f.write(key)
         
-        # Set file permissions to be readable only by the owner (0600)
-        # This is crucial for security on Unix-like systems
+        # The mode above only applies to new files; tighten an existing one too
         try:
-            os.chmod(file_path, stat.S_IRUSR | stat.S_IWUSR)
+            os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
         except Exception as e:
             logger.warning(f"Could not set file permissions: {e}")
             
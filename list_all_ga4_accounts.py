@@ -6,46 +6,397 @@ List all GA4 accounts and properties the service account has access to
 import os
 import json
 import csv
-from datetime import datetime
-from google.oauth2.service_account import Credentials
+import time
+import random
+import hashlib
+import operator
+import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from ga4_auth import (CREDENTIALS_PATH, MAX_RETRY_DELAY, execute_with_retry, get_credentials,
+                      is_retriable_error)
+
+# orjson is optional; it speeds up writing the JSON export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # Constants
-CREDENTIALS_PATH = "credentials/ga4_credentials.json"
 OUTPUT_CSV = "all_ga4_properties.csv"
 OUTPUT_JSON = "all_ga4_properties.json"
+ACCOUNT_SUMMARIES_PAGE_SIZE = 200  # API maximum for accountSummaries.list
+# Partial responses with only the fields the scripts read
+ACCOUNT_SUMMARIES_FIELDS = 'accountSummaries(account,displayName,propertySummaries(property,displayName)),nextPageToken'
+PROPERTIES_FIELDS = 'properties(name,displayName,createTime,updateTime),nextPageToken'
+DATA_STREAMS_FIELDS = 'dataStreams(webStreamData/defaultUri)'
+STREAM_BATCH_SIZE = 50  # dataStreams.list calls per batch HTTP request
+STREAM_MAX_ATTEMPTS = 5  # Attempts per property when stream lookups are rate limited
+RESPONSE_CACHE_DIR = os.path.join("cache", "ga4")
+RESPONSE_CACHE_TTL = 3600  # Seconds an Admin API listing response is reused
+MAX_CONCURRENT_ACCOUNTS = 4  # Accounts whose properties are listed at the same time
+
+# Per-thread Admin API services for the account workers
+_thread_local = threading.local()
+
+def cached_execute(request, key, ttl=RESPONSE_CACHE_TTL, refresh=False):
+    """
+    Execute an API request, reusing a response saved on disk within the last `ttl` seconds.
+    
+    Args:
+        request: googleapiclient HttpRequest to execute on a cache miss
+        key: JSON-serializable value identifying the request (e.g. service account,
+             account ID, page token and page size)
+        ttl: Maximum age in seconds of a reusable cached response
+        refresh: Ignore any cached response and overwrite it
+        
+    Returns:
+        The parsed JSON response
+    """
+    if not refresh:
+        response = _read_cached_response(key, ttl)
+        if response is not None:
+            return response
+    
+    response = execute_with_retry(request)
+    _write_cached_response(key, response)
+    return response
+
+def _response_cache_path(key):
+    """Path of the cache entry for a request key"""
+    digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(RESPONSE_CACHE_DIR, f"{digest}.json")
+
+def _read_cached_response(key, ttl=RESPONSE_CACHE_TTL):
+    """Return the cached response for a key if it is younger than `ttl` seconds, else None"""
+    cache_path = _response_cache_path(key)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache entry; fetch it again
+    return None
+
+def _write_cached_response(key, response):
+    """Save a response in the cache"""
+    cache_path = _response_cache_path(key)
+    try:
+        os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so a concurrent run never reads a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(response, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Warning: Could not cache API response: %s", e)
+
+def fetch_websites(analytics_admin, property_infos, service_account_email, refresh=False):
+    """
+    Fill in the websites of each property from their data streams.
+    
+    Data streams listed within the last RESPONSE_CACHE_TTL seconds are read from
+    the response cache; the others are fetched in batch requests and cached.
+    Lookups that hit a rate limit or transient server error are sent again in
+    a later batch, after an exponential backoff.
+    
+    Args:
+        analytics_admin: Admin API service
+        property_infos: Property dicts whose 'websites' lists are filled in
+        service_account_email: Service account email, used in the response cache keys
+        refresh: Ignore cached data streams and fetch them again
+    """
+    infos_by_id = {property_info['property_id']: property_info for property_info in property_infos}
+    
+    def cache_key(property_id):
+        return ['dataStreams', service_account_email, property_id, DATA_STREAMS_FIELDS]
+    
+    def add_websites(property_id, response):
+        websites = infos_by_id[property_id]['websites']
+        for stream in response.get('dataStreams', ()):
+            web_stream_data = stream.get('webStreamData')
+            if not web_stream_data:
+                continue
+            website_url = web_stream_data.get('defaultUri')
+            if website_url:
+                websites.append(website_url)
+    
+    def on_streams(request_id, response, exception):
+        if exception is not None:
+            if isinstance(exception, HttpError) and is_retriable_error(exception):
+                retry_ids.append(request_id)
+            else:
+                logger.warning("    Warning: Could not fetch streams for property %s: %s", request_id, exception)
+            return
+        _write_cached_response(cache_key(request_id), response)
+        add_websites(request_id, response)
+    
+    property_ids = []
+    for property_id in infos_by_id:
+        response = None if refresh else _read_cached_response(cache_key(property_id))
+        if response is None:
+            property_ids.append(property_id)
+        else:
+            add_websites(property_id, response)
+    
+    for attempt in range(STREAM_MAX_ATTEMPTS):
+        retry_ids = []
+        for start in range(0, len(property_ids), STREAM_BATCH_SIZE):
+            batch_ids = property_ids[start:start + STREAM_BATCH_SIZE]
+            batch = analytics_admin.new_batch_http_request(callback=on_streams)
+            for property_id in batch_ids:
+                batch.add(
+                    analytics_admin.properties().dataStreams().list(
+                        parent=f"properties/{property_id}",
+                        fields=DATA_STREAMS_FIELDS
+                    ),
+                    request_id=property_id
+                )
+            try:
+                batch.execute()
+            except HttpError as e:
+                if not is_retriable_error(e):
+                    logger.warning("    Warning: Batch request for data streams failed: %s", e)
+                    continue
+                retry_ids.extend(batch_ids)
+            except Exception as e:
+                logger.warning("    Warning: Batch request for data streams failed: %s", e)
+        
+        if not retry_ids:
+            return
+        if attempt == STREAM_MAX_ATTEMPTS - 1:
+            logger.warning("    Warning: Could not fetch streams for %d properties: rate limited or unavailable",
+                           len(retry_ids))
+            return
+        
+        delay = min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+        logger.warning("    Stream lookups for %d properties failed, retrying in %.1fs (attempt %d of %d)",
+                       len(retry_ids), delay, attempt + 1, STREAM_MAX_ATTEMPTS)
+        time.sleep(delay)
+        property_ids = list(dict.fromkeys(retry_ids))
+
+def _dump_json(obj):
+    """Serialize a value to UTF-8 encoded JSON indented by 2 spaces, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def get_thread_admin_service(credentials):
+    """Get this thread's Admin API service; the underlying HTTP client is not thread-safe"""
+    analytics_admin = getattr(_thread_local, 'analytics_admin', None)
+    if analytics_admin is None:
+        # Load the discovery document bundled with the client library rather than
+        # downloading it; there is then nothing for the discovery file cache to do
+        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
+        _thread_local.analytics_admin = analytics_admin
+    return analytics_admin
+
+def fetch_account_properties(credentials, account, service_account_email, refresh=False):
+    """
+    List all properties of an account with their websites.
+    
+    Runs in a worker thread, so it uses its own Admin API service.
+    
+    Args:
+        credentials: Service account credentials
+        account: Account summary from accountSummaries.list
+        service_account_email: Service account email, used in the response cache keys
+        refresh: Ignore cached Admin API listings and fetch them again
+        
+    Returns:
+        List of property dicts; the properties from the account summary if listing fails
+    """
+    analytics_admin = get_thread_admin_service(credentials)
+    account_id = account['account'].rsplit('/', 1)[-1]
+    account_name = account.get('displayName', 'Unnamed Account')
+    properties_in_summary = account.get('propertySummaries', [])
+    
+    logger.info("Account: %s (ID: %s) - %d properties in account summary",
+                account_name, account_id, len(properties_in_summary))
+    
+    # Try to list ALL properties in the account using properties().list() method
+    try:
+        logger.debug("Fetching complete property details for account %s...", account_id)
+        
+        # Use pagination to get all properties
+        page_token = None
+        page_num = 1
+        account_properties = []
+        
+        while True:
+            # Get page of properties
+            request = analytics_admin.properties().list(
+                filter=f"parent:accounts/{account_id}",
+                pageSize=200,
+                pageToken=page_token,
+                fields=PROPERTIES_FIELDS
+            )
+            response = cached_execute(
+                request,
+                key=['properties', service_account_email, account_id, page_token, 200, PROPERTIES_FIELDS],
+                refresh=refresh
+            )
+            properties = response.get('properties', [])
+            
+            # Process properties
+            logger.debug("  Account %s, page %d: %d properties found", account_id, page_num, len(properties))
+            
+            page_properties = [{
+                'property_id': prop.get('name', '').rsplit('/', 1)[-1],
+                'property_name': prop.get('displayName', 'Unnamed Property'),
+                'account_id': account_id,
+                'account_name': account_name,
+                'create_time': prop.get('createTime', ''),
+                'update_time': prop.get('updateTime', ''),
+                'websites': []
+            } for prop in properties]
+            
+            # Get data streams (websites) for the properties on this page
+            fetch_websites(analytics_admin, page_properties, service_account_email, refresh)
+            account_properties.extend(page_properties)
+            
+            # Check for next page
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+                
+            page_num += 1
+        
+        logger.info("  ✅ Account %s: successfully fetched %d property details", account_id, len(account_properties))
+        
+        # If counts don't match, show warning
+        if len(account_properties) != len(properties_in_summary):
+            logger.warning("  ⚠️ Warning: Account %s: found %d properties but account summary showed %d",
+                           account_id, len(account_properties), len(properties_in_summary))
+        return account_properties
+    
+    except HttpError as e:
+        logger.error("  ❌ Account %s: API error listing properties: %s", account_id, e.reason)
+        
+        # Fall back to using properties from account summary
+        logger.info("  Account %s: falling back to properties from account summary...", account_id)
+        
+        # Times are not available in the summary
+        summary_properties = [{
+            'property_id': prop_summary['property'].rsplit('/', 1)[-1],
+            'property_name': prop_summary.get('displayName', 'Unnamed Property'),
+            'account_id': account_id,
+            'account_name': account_name,
+            'create_time': '',
+            'update_time': '',
+            'websites': []
+        } for prop_summary in properties_in_summary]
+        
+        # Get streams with the same batched requests as the main path
+        fetch_websites(analytics_admin, summary_properties, service_account_email, refresh)
+        
+        logger.info("  ✅ Account %s: successfully processed %d properties from account summary",
+                    account_id, len(summary_properties))
+        return summary_properties
+    
+    except Exception as e:
+        logger.error("  ❌ Account %s: error processing account properties: %s", account_id, e)
+        # Continue with next account
+        return []
+
+class PropertyExporter:
+    """
+    Writes properties to the CSV and JSON exports as soon as they are fetched.
+    
+    Use it as a context manager so the JSON array is terminated and both files
+    are closed even if fetching fails part way.
+    """
+    
+    CSV_FIELDNAMES = ['property_id', 'property_name', 'account_id', 'account_name', 'websites', 'create_time', 'update_time']
+    SAMPLE_SIZE = 10
+    
+    def __init__(self, csv_path, json_path, fieldnames=CSV_FIELDNAMES):
+        self._csvfile = open(csv_path, 'w', newline='')
+        try:
+            self._jsonfile = open(json_path, 'wb')
+        except OSError:
+            self._csvfile.close()
+            raise
+        self._writer = csv.writer(self._csvfile)
+        self._writer.writerow(fieldnames)
+        # Pick the CSV columns without building a dict per row
+        self._get_row = operator.itemgetter(*fieldnames)
+        self._websites_column = fieldnames.index('websites')
+        self._jsonfile.write(b'[')
+        self.count = 0
+        self.sample = []  # First properties, kept for the summary printout
+    
+    def write(self, properties):
+        """Append properties to both exports"""
+        for prop in properties:
+            # Columns in fieldnames order, with the websites list joined into one field
+            row = list(self._get_row(prop))
+            row[self._websites_column] = ', '.join(row[self._websites_column])
+            self._writer.writerow(row)
+            
+            # Each object is indented one level inside the array; JSON strings
+            # never contain a raw newline, so every newline starts a nested line
+            self._jsonfile.write(b',\n  ' if self.count else b'\n  ')
+            self._jsonfile.write(_dump_json(prop).replace(b'\n', b'\n  '))
+            
+            self.count += 1
+            if len(self.sample) < self.SAMPLE_SIZE:
+                self.sample.append(prop)
+    
+    def close(self):
+        """Terminate the JSON array and close both files"""
+        if self._jsonfile.closed:
+            return
+        try:
+            self._jsonfile.write(b'\n]\n' if self.count else b']\n')
+        finally:
+            self._csvfile.close()
+            self._jsonfile.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-def main():
-    """List all GA4 accounts and properties the service account has access to"""
+def main(refresh=False, account_ids=None):
+    """
+    List all GA4 accounts and properties the service account has access to
+    
+    Args:
+        refresh: Ignore cached Admin API listings and fetch them again
+        account_ids: Only list the properties of these account IDs (all accounts if empty)
+    """
     print("\n=== GA4 Accounts and Properties Listing ===\n")
     
     # Initialize credentials
     try:
         print("Initializing credentials...")
-        credentials = Credentials.from_service_account_file(
-            CREDENTIALS_PATH, 
-            scopes=['https://www.googleapis.com/auth/analytics.readonly']
-        )
+        credentials, creds_data = get_credentials(CREDENTIALS_PATH)
         print("✅ Credentials initialized successfully")
     except Exception as e:
         print(f"❌ Error initializing credentials: {str(e)}")
         return False
     
-    # Load service account email from credentials
-    try:
-        with open(CREDENTIALS_PATH) as f:
-            creds_data = json.load(f)
-            service_account_email = creds_data.get('client_email', 'Unknown')
-            print(f"Service Account: {service_account_email}")
-    except Exception as e:
-        print(f"Warning: Could not read service account email: {str(e)}")
-        service_account_email = "Unknown"
+    # Service account email from the same parsed credentials file
+    service_account_email = creds_data.get('client_email', 'Unknown')
+    print(f"Service Account: {service_account_email}")
     
     # Initialize Admin API
     try:
         print("\nInitializing Admin API...")
-        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials)
+        # Load the discovery document bundled with the client library rather than
+        # downloading it; there is then nothing for the discovery file cache to do
+        analytics_admin = build('analyticsadmin', 'v1beta', credentials=credentials,
+                                static_discovery=True, cache_discovery=False)
         print("✅ Admin API initialized successfully")
     except Exception as e:
         print(f"❌ Error initializing Admin API: {str(e)}")
@@ -54,14 +405,41 @@ def main():
     # List all accounts the service account has access to
     try:
         print("\nListing all accessible GA4 accounts...")
-        accounts_response = analytics_admin.accountSummaries().list().execute()
-        accounts = accounts_response.get('accountSummaries', [])
+        # Request the maximum page size; most service accounts fit in one page
+        accounts = []
+        page_token = None
+        while True:
+            accounts_response = cached_execute(
+                analytics_admin.accountSummaries().list(
+                    pageSize=ACCOUNT_SUMMARIES_PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=ACCOUNT_SUMMARIES_FIELDS
+                ),
+                key=['accountSummaries', service_account_email, page_token, ACCOUNT_SUMMARIES_PAGE_SIZE,
+                     ACCOUNT_SUMMARIES_FIELDS],
+                refresh=refresh
+            )
+            accounts.extend(accounts_response.get('accountSummaries', []))
+            
+            # Check for next page
+            page_token = accounts_response.get('nextPageToken')
+            if not page_token:
+                break
         
         if not accounts:
             print("❌ No accounts found or accessible!")
             return False
             
         print(f"✅ Found {len(accounts)} accessible account(s)")
+        
+        # Skip the accounts that were not asked for before any of their properties are fetched
+        if account_ids:
+            wanted = set(account_ids)
+            accounts = [account for account in accounts if account['account'].rsplit('/', 1)[-1] in wanted]
+            if not accounts:
+                print(f"❌ None of the requested accounts are accessible: {', '.join(sorted(wanted))}")
+                return False
+            print(f"Listing {len(accounts)} selected account(s)")
     except HttpError as e:
         print(f"❌ API error listing accounts: {e.reason}")
         return False
@@ -69,180 +447,65 @@ def main():
         print(f"❌ Error listing accounts: {str(e)}")
         return False
     
-    # Process each account and gather all properties
-    all_properties = []
+    # Open the exports up front; each property is written as soon as it is fetched
+    try:
+        exporter = PropertyExporter(OUTPUT_CSV, OUTPUT_JSON)
+    except Exception as e:
+        print(f"❌ Error opening export files: {str(e)}")
+        return False
+    
+    # Walk the accounts concurrently; each account's properties are written
+    # in account order as soon as that account and the ones before it are done
     total_properties = 0
     
-    for account in accounts:
-        account_id = account['account'].split('/')[-1]
-        account_name = account.get('displayName', 'Unnamed Account')
-        properties_in_summary = account.get('propertySummaries', [])
-        
-        print(f"\nAccount: {account_name} (ID: {account_id})")
-        print(f"Found {len(properties_in_summary)} properties in account summary")
-        
-        # Try to list ALL properties in the account using properties().list() method
-        try:
-            print(f"Fetching complete property details for account {account_id}...")
-            
-            # Use pagination to get all properties
-            page_token = None
-            page_num = 1
-            account_properties = []
-            
-            while True:
-                # Get page of properties
-                request = analytics_admin.properties().list(
-                    filter=f"parent:accounts/{account_id}",
-                    pageSize=200,
-                    pageToken=page_token
-                )
-                response = request.execute()
-                properties = response.get('properties', [])
-                
-                # Process properties
-                total_on_page = len(properties)
-                print(f"  Processing page {page_num}: {total_on_page} properties found")
-                
-                # Process each property
-                for prop in properties:
-                    property_id = prop.get('name', '').split('/')[-1]
-                    property_name = prop.get('displayName', 'Unnamed Property')
-                    
-                    property_info = {
-                        'property_id': property_id,
-                        'property_name': property_name,
-                        'account_id': account_id,
-                        'account_name': account_name,
-                        'create_time': prop.get('createTime', ''),
-                        'update_time': prop.get('updateTime', ''),
-                        'websites': []
-                    }
-                    
-                    # Get data streams (websites) for this property
-                    try:
-                        streams = analytics_admin.properties().dataStreams().list(
-                            parent=f"properties/{property_id}"
-                        ).execute()
-                        
-                        for stream in streams.get('dataStreams', []):
-                            if stream.get('webStreamData'):
-                                website_url = stream.get('webStreamData', {}).get('defaultUri', '')
-                                if website_url:
-                                    property_info['websites'].append(website_url)
-                    except Exception as e:
-                        print(f"    Warning: Could not fetch streams for property {property_id}: {str(e)}")
-                    
-                    # Add to lists
-                    account_properties.append(property_info)
-                    all_properties.append(property_info)
-                
-                # Check for next page
-                page_token = response.get('nextPageToken')
-                if not page_token:
-                    break
-                    
-                page_num += 1
-            
-            # Update count
+    # Leaving the block terminates the JSON array and closes the exports, even if
+    # fetching an account fails
+    with exporter, ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ACCOUNTS) as executor:
+        account_results = executor.map(
+            lambda account: fetch_account_properties(credentials, account, service_account_email, refresh),
+            accounts
+        )
+        for account_properties in account_results:
+            exporter.write(account_properties)
             total_properties += len(account_properties)
-            print(f"  ✅ Successfully fetched {len(account_properties)} property details")
-            
-            # If counts don't match, show warning
-            if len(account_properties) != len(properties_in_summary):
-                print(f"  ⚠️ Warning: Found {len(account_properties)} properties but account summary showed {len(properties_in_summary)}")
-        
-        except HttpError as e:
-            print(f"  ❌ API error listing properties: {e.reason}")
-            
-            # Fall back to using properties from account summary
-            print(f"  Falling back to properties from account summary...")
-            
-            for prop_summary in properties_in_summary:
-                property_id = prop_summary['property'].split('/')[-1]
-                property_name = prop_summary.get('displayName', 'Unnamed Property')
-                
-                property_info = {
-                    'property_id': property_id,
-                    'property_name': property_name,
-                    'account_id': account_id,
-                    'account_name': account_name,
-                    'create_time': '',  # Not available in summary
-                    'update_time': '',  # Not available in summary
-                    'websites': []
-                }
-                
-                # Try to get streams
-                try:
-                    streams = analytics_admin.properties().dataStreams().list(
-                        parent=f"properties/{property_id}"
-                    ).execute()
-                    
-                    for stream in streams.get('dataStreams', []):
-                        if stream.get('webStreamData'):
-                            website_url = stream.get('webStreamData', {}).get('defaultUri', '')
-                            if website_url:
-                                property_info['websites'].append(website_url)
-                except Exception as e:
-                    print(f"    Warning: Could not fetch streams for property {property_id}: {str(e)}")
-                
-                # Add to lists
-                all_properties.append(property_info)
-            
-            # Update count
-            total_properties += len(properties_in_summary)
-            print(f"  ✅ Successfully processed {len(properties_in_summary)} properties from account summary")
-        
-        except Exception as e:
-            print(f"  ❌ Error processing account properties: {str(e)}")
-            # Continue with next account
     
     # Summarize results
     print(f"\n=== SUMMARY ===")
     print(f"Total accounts: {len(accounts)}")
     print(f"Total properties: {total_properties}")
     
-    # Save properties to CSV
-    try:
-        with open(OUTPUT_CSV, 'w', newline='') as csvfile:
-            fieldnames = ['property_id', 'property_name', 'account_id', 'account_name', 'websites', 'create_time', 'update_time']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for prop in all_properties:
-                # Convert websites list to string
-                prop_csv = prop.copy()
-                prop_csv['websites'] = ', '.join(prop['websites'])
-                writer.writerow(prop_csv)
-                
-        print(f"\n✅ All properties exported to {OUTPUT_CSV}")
-    except Exception as e:
-        print(f"\n❌ Error exporting to CSV: {str(e)}")
-    
-    # Save properties to JSON
-    try:
-        with open(OUTPUT_JSON, 'w') as jsonfile:
-            json.dump(all_properties, jsonfile, indent=2)
-            
-        print(f"✅ All properties exported to {OUTPUT_JSON}")
-    except Exception as e:
-        print(f"❌ Error exporting to JSON: {str(e)}")
+    print(f"\n✅ All properties exported to {OUTPUT_CSV}")
+    print(f"✅ All properties exported to {OUTPUT_JSON}")
     
     # Print sample properties
-    if all_properties:
+    if exporter.sample:
         print("\nSample of properties:")
         print("-" * 100)
         print(f"{'Property ID':<12} | {'Property Name':<35} | {'Account Name':<25} | {'Website'}")
         print("-" * 100)
         
-        for prop in all_properties[:10]:  # Show first 10
+        for prop in exporter.sample:  # Show first 10
             website = prop['websites'][0] if prop['websites'] else 'No website'
             print(f"{prop['property_id']:<12} | {prop['property_name'][:35]:<35} | {prop['account_name'][:25]:<25} | {website}")
             
-        if len(all_properties) > 10:
-            print(f"... and {len(all_properties) - 10} more properties")
+        if exporter.count > len(exporter.sample):
+            print(f"... and {exporter.count - len(exporter.sample)} more properties")
     
     return True
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Configure logging only when run as a script, so importing the module leaves the
+    # root logger alone; set LOGLEVEL=WARNING to silence the per-account progress
+    logging.basicConfig(
+        level=os.environ.get('LOGLEVEL', 'INFO').upper(),
+        format='%(message)s'
+    )
+    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--refresh', action='store_true',
+                        help='ignore cached account and property listings and fetch them again')
+    parser.add_argument('--account-id', action='append', dest='account_ids', metavar='ID',
+                        help='only list the properties of this account (can be repeated)')
+    args = parser.parse_args()
+    
+    main(refresh=args.refresh, account_ids=args.account_ids)
\ No newline at end of file
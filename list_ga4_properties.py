@@ -6,19 +6,33 @@ List all GA4 properties with their IDs, names, and associated websites
 import os
 import json
 import csv
+import argparse
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from ga4_auth import execute_with_retry
+from list_all_ga4_accounts import (PROPERTIES_FIELDS, PropertyExporter, cached_execute, fetch_websites,
+                                   get_thread_admin_service)
+
 # Constants
 CREDENTIALS_PATH = "credentials/ga4_credentials.json"
 ACCOUNT_ID = "169438601"  # House Learning Center account ID
 OUTPUT_CSV = "ga4_properties_list.csv"
 OUTPUT_JSON = "ga4_properties_list.json"
+STREAM_WORKERS = 4  # Pages whose data streams are fetched at the same time
+ACCOUNT_FIELDS = 'displayName'  # Partial response mask for the account lookup
 
-def main():
-    """List all GA4 properties in the account"""
+def main(refresh=False):
+    """
+    List all GA4 properties in the account
+    
+    Args:
+        refresh: Ignore cached account details and data streams and fetch them again
+    """
     print("\n=== GA4 Properties Listing ===\n")
     
     # Initialize credentials
@@ -45,30 +59,52 @@ def main():
     # Get account info
     try:
         print(f"\nFetching account details for ID: {ACCOUNT_ID}...")
-        account = analytics_admin.accounts().get(name=f"accounts/{ACCOUNT_ID}").execute()
+        account = cached_execute(
+            analytics_admin.accounts().get(name=f"accounts/{ACCOUNT_ID}", fields=ACCOUNT_FIELDS),
+            key=['account', credentials.service_account_email, ACCOUNT_ID, ACCOUNT_FIELDS],
+            refresh=refresh
+        )
         account_name = account.get('displayName', 'Unknown Account')
         print(f"Account: {account_name} (ID: {ACCOUNT_ID})")
     except Exception as e:
         print(f"Warning: Could not fetch account details: {str(e)}")
         account_name = "Unknown Account"
         
+    # Open the exports up front; each page is written as soon as its websites are fetched
+    try:
+        exporter = PropertyExporter(OUTPUT_CSV, OUTPUT_JSON)
+    except Exception as e:
+        print(f"❌ Error opening export files: {str(e)}")
+        return False
+    
+    def write_page(stream_future, page_properties):
+        # exception() waits for the page's data streams
+        if stream_future.exception() is not None:
+            print(f"  Warning: Could not fetch data streams: {str(stream_future.exception())}")
+        exporter.write(page_properties)
+    
     # List properties directly using the properties() method
-    all_properties = []
     page_token = None
     page_num = 1
     total_properties = 0
     
     print("\nFetching properties (this may take some time for accounts with many properties)...")
     
+    # Data streams are fetched on worker threads, each with its own Admin API
+    # service, while the next page of properties is listed
+    executor = ThreadPoolExecutor(max_workers=STREAM_WORKERS)
+    pending_pages = deque()  # (stream future, page properties) in page order
+    
     try:
         while True:
             # Get page of properties
             request = analytics_admin.properties().list(
                 filter=f"parent:accounts/{ACCOUNT_ID}",
                 pageSize=200,
-                pageToken=page_token
+                pageToken=page_token,
+                fields=PROPERTIES_FIELDS
             )
-            response = request.execute()
+            response = execute_with_retry(request)
             properties = response.get('properties', [])
             
             # Process properties
@@ -77,11 +113,12 @@ def main():
             print(f"Processing page {page_num}: {total_on_page} properties found")
             
             # Process each property
+            page_properties = []
             for prop in properties:
                 property_id = prop.get('name', '').split('/')[-1]
                 property_name = prop.get('displayName', 'Unnamed Property')
                 
-                property_info = {
+                page_properties.append({
                     'property_id': property_id,
                     'property_name': property_name,
                     'account_id': ACCOUNT_ID,
@@ -89,24 +126,18 @@ def main():
                     'create_time': prop.get('createTime', ''),
                     'update_time': prop.get('updateTime', ''),
                     'websites': []
-                }
-                
-                # Get data streams (websites) for this property
-                try:
-                    streams = analytics_admin.properties().dataStreams().list(
-                        parent=f"properties/{property_id}"
-                    ).execute()
-                    
-                    for stream in streams.get('dataStreams', []):
-                        if stream.get('webStreamData'):
-                            website_url = stream.get('webStreamData', {}).get('defaultUri', '')
-                            if website_url:
-                                property_info['websites'].append(website_url)
-                except Exception as e:
-                    print(f"  Warning: Could not fetch streams for property {property_id}: {str(e)}")
-                
-                # Add to list
-                all_properties.append(property_info)
+                })
+            
+            # Get data streams (websites) for the properties on this page, in batch requests
+            pending_pages.append((executor.submit(
+                lambda infos: fetch_websites(get_thread_admin_service(credentials), infos,
+                                             credentials.service_account_email, refresh),
+                page_properties
+            ), page_properties))
+            
+            # Write the pages whose websites are ready, keeping page order
+            while pending_pages and pending_pages[0][0].done():
+                write_page(*pending_pages.popleft())
                 
             # Check for next page
             page_token = response.get('nextPageToken')
@@ -121,50 +152,38 @@ def main():
         print(f"❌ Error listing properties: {str(e)}")
         # Continue with what we've got
     
+    # Write the remaining pages once their websites are fetched
+    while pending_pages:
+        write_page(*pending_pages.popleft())
+    executor.shutdown()
+    exporter.close()
+    
     # Summarize results
     print(f"\n✅ Found {total_properties} properties in account {account_name}")
     
-    # Save properties to CSV
-    try:
-        with open(OUTPUT_CSV, 'w', newline='') as csvfile:
-            fieldnames = ['property_id', 'property_name', 'account_id', 'account_name', 'websites', 'create_time', 'update_time']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for prop in all_properties:
-                # Convert websites list to string
-                prop_csv = prop.copy()
-                prop_csv['websites'] = ', '.join(prop['websites'])
-                writer.writerow(prop_csv)
-                
-        print(f"✅ Properties exported to {OUTPUT_CSV}")
-    except Exception as e:
-        print(f"❌ Error exporting to CSV: {str(e)}")
-    
-    # Save properties to JSON
-    try:
-        with open(OUTPUT_JSON, 'w') as jsonfile:
-            json.dump(all_properties, jsonfile, indent=2)
-            
-        print(f"✅ Properties exported to {OUTPUT_JSON}")
-    except Exception as e:
-        print(f"❌ Error exporting to JSON: {str(e)}")
+    print(f"✅ Properties exported to {OUTPUT_CSV}")
+    print(f"✅ Properties exported to {OUTPUT_JSON}")
     
     # Print summary of first few properties
-    if all_properties:
+    if exporter.sample:
         print("\nSample of properties:")
         print("-" * 80)
         print(f"{'ID':<12} | {'Name':<35} | {'Website'}")
         print("-" * 80)
         
-        for prop in all_properties[:10]:  # Show first 10
+        for prop in exporter.sample:  # Show first 10
             website = prop['websites'][0] if prop['websites'] else 'No website'
             print(f"{prop['property_id']:<12} | {prop['property_name'][:35]:<35} | {website}")
             
-        if len(all_properties) > 10:
-            print(f"... and {len(all_properties) - 10} more properties")
+        if exporter.count > len(exporter.sample):
+            print(f"... and {exporter.count - len(exporter.sample)} more properties")
     
     return True
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--refresh', action='store_true',
+                        help='ignore cached account details and data streams and fetch them again')
+    args = parser.parse_args()
+    
+    main(refresh=args.refresh)
\ No newline at end of file
@@ -109,9 +109,10 @@ def get_property_information():
                     ).execute()
                     
                     websites = []
-                    for stream in streams_response.get('dataStreams', []):
-                        if stream.get('webStreamData'):
-                            websites.append(stream.get('webStreamData', {}).get('defaultUri', 'Unknown'))
+                    for stream in streams_response.get('dataStreams', ()):
+                        web_stream_data = stream.get('webStreamData')
+                        if web_stream_data:
+                            websites.append(web_stream_data.get('defaultUri', 'Unknown'))
                     
                     logger.info(f"    Found {len(websites)} website(s) for this property")
                     
@@ -0,0 +1,72 @@
+"""
+Tests for the property export of the GA4 account listing script.
+"""
+
+import csv
+import json
+
+import pytest
+
+import list_all_ga4_accounts
+from list_all_ga4_accounts import PropertyExporter
+
+
+def _sample_property():
+    return {
+        'property_id': '123',
+        'property_name': 'Example Property',
+        'account_id': '456',
+        'account_name': 'Example Account',
+        'websites': ['https://example.com', 'https://example.org'],
+        'create_time': '2023-01-01T00:00:00Z',
+        'update_time': '2023-01-02T00:00:00Z'
+    }
+
+
+def test_property_exporter_writes_csv_and_json(tmp_path):
+    """Test that a property written through the exporter ends up in both files."""
+    csv_path = tmp_path / 'properties.csv'
+    json_path = tmp_path / 'properties.json'
+
+    exporter = PropertyExporter(str(csv_path), str(json_path))
+    exporter.write([_sample_property()])
+    exporter.close()
+
+    assert exporter.count == 1
+    assert exporter.sample == [_sample_property()]
+
+    with open(csv_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]['property_id'] == '123'
+    assert rows[0]['websites'] == 'https://example.com, https://example.org'
+
+    with open(json_path, encoding='utf-8') as f:
+        assert f.read() == json.dumps([_sample_property()], indent=2) + '\n'
+
+
+def test_property_exporter_without_orjson(tmp_path, monkeypatch):
+    """Test that the JSON export falls back to the standard library."""
+    monkeypatch.setattr(list_all_ga4_accounts, 'ORJSON_AVAILABLE', False)
+    json_path = tmp_path / 'properties.json'
+
+    exporter = PropertyExporter(str(tmp_path / 'properties.csv'), str(json_path))
+    exporter.write([_sample_property(), _sample_property()])
+    exporter.close()
+
+    with open(json_path, encoding='utf-8') as f:
+        assert f.read() == json.dumps([_sample_property(), _sample_property()], indent=2) + '\n'
+
+
+def test_property_exporter_context_manager_closes_on_error(tmp_path):
+    """Test that leaving the exporter's block on an error still writes valid JSON."""
+    json_path = tmp_path / 'properties.json'
+
+    with pytest.raises(RuntimeError):
+        with PropertyExporter(str(tmp_path / 'properties.csv'), str(json_path)) as exporter:
+            exporter.write([_sample_property()])
+            raise RuntimeError('account fetch failed')
+
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f) == [_sample_property()]
+    exporter.close()  # Closing again is a no-op
@@ -62,6 +62,57 @@ def test_database_schema_initialization():
         assert table in tables
 
 
+def test_database_schema_indexes():
+    """Test that initialize() creates the report data lookup indexes."""
+    # Setup
+    db = Database(':memory:')
+    db.initialize()
+    
+    # Execute
+    indexes = db.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='report_data';",
+        fetchall=True
+    )
+    
+    # Assert
+    index_names = [row['name'] for row in indexes]
+    assert 'idx_report_data_property_date' in index_names
+    assert 'idx_report_data_report' in index_names
+    assert 'idx_report_data_report_metric' in index_names
+    
+    # The property/date lookup should be served by the composite index
+    plan = db.execute(
+        "EXPLAIN QUERY PLAN SELECT metric_name, metric_value FROM report_data "
+        "WHERE property_ga4_id = ? AND data_date = ?;",
+        ('123', '2024-01-01'),
+        fetchall=True
+    )
+    assert any('COVERING INDEX idx_report_data_property_date' in row['detail'] for row in plan)
+
+
+def test_database_lookup_indexes():
+    """Test that property and website lookups are served by indexes."""
+    # Setup
+    db = Database(':memory:')
+    db.initialize()
+    
+    # Execute
+    account_plan = db.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM properties WHERE account_id = ?;",
+        ('123',),
+        fetchall=True
+    )
+    website_plan = db.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM websites WHERE property_db_id = ?;",
+        (1,),
+        fetchall=True
+    )
+    
+    # Assert
+    assert any('idx_properties_account_id' in row['detail'] for row in account_plan)
+    assert any('idx_websites_property_db_id' in row['detail'] for row in website_plan)
+
+
 def test_database_execute_query():
     """Test executing queries with various options."""
     # Setup
@@ -101,6 +152,57 @@ def test_database_execute_query():
     assert result is None
 
 
+def test_database_executemany():
+    """Test executing a statement for many parameter tuples at once."""
+    # Setup
+    db = Database(':memory:')
+    db.initialize()
+    
+    # Execute
+    rowcount = db.executemany(
+        "INSERT INTO properties (property_id, property_name) VALUES (?, ?);",
+        [('property-1', 'Property 1'), ('property-2', 'Property 2'), ('property-3', 'Property 3')],
+        commit=True
+    )
+    
+    # Assert
+    assert rowcount == 3
+    results = db.execute("SELECT property_id FROM properties ORDER BY property_id;", fetchall=True)
+    assert [row['property_id'] for row in results] == ['property-1', 'property-2', 'property-3']
+    
+    # A failing row rolls back the whole batch when committing
+    with pytest.raises(sqlite3.Error):
+        db.executemany(
+            "INSERT INTO properties (property_id, property_name) VALUES (?, ?);",
+            [('property-4', 'Property 4'), ('property-1', 'Duplicate Property')],
+            commit=True
+        )
+    results = db.execute("SELECT * FROM properties;", fetchall=True)
+    assert len(results) == 3
+
+
+def test_database_iterate():
+    """Test streaming query results in batches."""
+    # Setup
+    db = Database(':memory:')
+    db.initialize()
+    db.executemany(
+        "INSERT INTO properties (property_id, property_name) VALUES (?, ?);",
+        [(f'property-{i}', f'Property {i}') for i in range(5)],
+        commit=True
+    )
+    
+    # Execute
+    rows = db.iterate("SELECT * FROM properties ORDER BY id;", batch_size=2)
+    
+    # Assert
+    assert not isinstance(rows, list)  # Results are produced lazily
+    rows = list(rows)
+    assert len(rows) == 5
+    assert rows[0]['property_id'] == 'property-0'
+    assert rows[-1]['property_name'] == 'Property 4'
+
+
 def test_transaction_context():
     """Test the transaction context manager."""
     # Setup
@@ -184,4 +184,75 @@ def test_property_repr():
     assert "id=1" in repr_str
     assert "property_id='properties/12345'" in repr_str
     assert "name='Test Property'" in repr_str
-    assert "account_id='accounts/67890'" in repr_str
\ No newline at end of file
+    assert "account_id='accounts/67890'" in repr_str
+
+def test_property_upsert_many():
+    """Test batch inserting and updating properties with upsert_many()."""
+    # Setup
+    from app.models.database import Database
+    db = Database(':memory:')
+    db.initialize()
+    
+    create_time = datetime.datetime(2023, 1, 1, 12, 0, 0)
+    properties = [
+        Property(database=db, property_id="properties/1", property_name="One",
+                 account_id="10", create_time=create_time),
+        Property(database=db, property_id="properties/2", property_name="Two", account_id="10")
+    ]
+    
+    # Execute - initial insert
+    Property.upsert_many(db, properties)
+    id_map = Property.get_id_map(db)
+    
+    # Assert
+    assert set(id_map) == {"properties/1", "properties/2"}
+    
+    # Execute - update existing, keeping the original create time
+    Property.upsert_many(db, [
+        Property(database=db, property_id="properties/1", property_name="One Renamed", account_id="20")
+    ])
+    row = db.execute("SELECT * FROM properties WHERE property_id = ?;", ("properties/1",), fetchone=True)
+    
+    # Assert
+    assert row['id'] == id_map["properties/1"]
+    assert row['property_name'] == "One Renamed"
+    assert row['account_id'] == "20"
+    assert row['create_time'] == create_time.isoformat()
+    
+    # Execute - existing rows are left untouched when update_existing is False
+    Property.upsert_many(db, [
+        Property(database=db, property_id="properties/2", property_name="Ignored")
+    ], update_existing=False)
+    row = db.execute("SELECT * FROM properties WHERE property_id = ?;", ("properties/2",), fetchone=True)
+    
+    # Assert
+    assert row['property_name'] == "Two"
+
+def test_property_find_by_ids_and_delete_many():
+    """Test loading and deleting several properties with find_by_ids() and delete_many()."""
+    # Setup
+    from app.models.database import Database
+    db = Database(':memory:')
+    db.initialize()
+    Property.upsert_many(db, [
+        Property(database=db, property_id=f"properties/{i}", property_name=f"Property {i}")
+        for i in range(1, 4)
+    ])
+    id_map = Property.get_id_map(db)
+    first_id, second_id = id_map["properties/1"], id_map["properties/2"]
+    
+    # Execute
+    found = Property.find_by_ids(db, [first_id, second_id, first_id, 999])
+    
+    # Assert
+    assert set(found) == {first_id, second_id}
+    assert found[first_id].property_name == "Property 1"
+    assert Property.find_by_ids(db, []) == {}
+    
+    # Execute - delete in one statement
+    deleted = Property.delete_many(db, [first_id, second_id])
+    
+    # Assert
+    assert deleted == 2
+    assert set(Property.get_id_map(db)) == {"properties/3"}
+    assert Property.delete_many(db, []) == 0
@@ -232,4 +232,33 @@ def test_report_repr():
     assert "name='Test Report'" in repr_str
     assert "type='traffic_analysis'" in repr_str
     assert "status='pending'" in repr_str
-    assert "created='2023-01-01 12:00'" in repr_str
\ No newline at end of file
+    assert "created='2023-01-01 12:00'" in repr_str
+
+def test_report_set_status(db):
+    """Test updating status, file path and status message with set_status()."""
+    # Setup
+    db.executemany(
+        "INSERT INTO reports (report_name, report_type, parameters, create_time, status) VALUES (?, ?, ?, ?, ?);",
+        [
+            ('JSON Report', 'traffic', '{"date_range": "last-7-days"}', '2023-01-01T00:00:00', 'pending'),
+            ('Plain Report', 'traffic', 'not json', '2023-01-01T00:00:00', 'pending'),
+        ],
+        commit=True
+    )
+    
+    # Execute
+    assert Report.set_status(db, 1, 'completed', message='Done', file_path='/path/to/report.pdf') == 1
+    assert Report.set_status(db, 2, 'failed', message='Boom') == 1
+    assert Report.set_status(db, 1, 'generating') == 1
+    assert Report.set_status(db, 99, 'failed', message='Missing') == 0
+    
+    # Assert
+    json_row = db.execute("SELECT * FROM reports WHERE id = 1", fetchone=True)
+    assert json_row['status'] == 'generating'
+    assert json_row['file_path'] == '/path/to/report.pdf'
+    assert json.loads(json_row['parameters']) == {'date_range': 'last-7-days', 'status_message': 'Done'}
+    
+    plain_row = db.execute("SELECT * FROM reports WHERE id = 2", fetchone=True)
+    assert plain_row['status'] == 'failed'
+    assert plain_row['file_path'] is None
+    assert json.loads(plain_row['parameters']) == {'status_message': 'Boom'}
@@ -224,4 +224,71 @@ def test_report_data_repr():
     assert "report_db_id=1" in repr_str
     assert "metric='pageviews'" in repr_str
     assert "'1000'" in repr_str
-    assert "date='2023-01-01'" in repr_str
\ No newline at end of file
+    assert "date='2023-01-01'" in repr_str
+
+def test_report_data_get_time_series_for_metrics(db):
+    """Test building several metric series with sums for counts and means for rates."""
+    # Setup
+    db.execute(
+        "INSERT INTO reports (report_name, report_type, create_time, status) VALUES (?, ?, ?, ?);",
+        ('Test Report', 'traffic', '2023-01-01T00:00:00', 'completed'),
+        commit=True
+    )
+    rows = [
+        ('sessions', '10', '2023-01-02'),
+        ('sessions', '5', '2023-01-01'),
+        ('sessions', '7', '2023-01-01'),
+        ('bounceRate', '0.2', '2023-01-01'),
+        ('bounceRate', '0.4', '2023-01-01'),
+        ('pageviews', '3', None),
+    ]
+    db.executemany(
+        "INSERT INTO report_data (report_db_id, metric_name, metric_value, data_date) VALUES (1, ?, ?, ?);",
+        rows,
+        commit=True
+    )
+    
+    # Execute
+    series = ReportData.get_time_series_for_metrics(db, 1, ['sessions', 'bounceRate', 'pageviews'])
+    
+    # Assert
+    assert series['sessions'] == {'2023-01-01': 12.0, '2023-01-02': 10.0}
+    assert list(series['sessions']) == ['2023-01-01', '2023-01-02']
+    assert series['bounceRate'] == {'2023-01-01': pytest.approx(0.3)}
+    assert 'pageviews' not in series
+    assert ReportData.get_time_series(db, 1, 'sessions') == series['sessions']
+
+def test_report_data_get_time_series_for_metrics_averages_by_metric_kind(db):
+    """Test that rate, percentage and duration metrics outside the common rates are averaged."""
+    # Setup
+    db.execute(
+        "INSERT INTO reports (report_name, report_type, create_time, status) VALUES (?, ?, ?, ?);",
+        ('Test Report', 'engagement', '2023-01-01T00:00:00', 'completed'),
+        commit=True
+    )
+    rows = [
+        ('averageSessionDuration', '60', '2023-01-01'),
+        ('averageSessionDuration', '120', '2023-01-01'),
+        ('userEngagementRate', '0.5', '2023-01-01'),
+        ('userEngagementRate', '0.7', '2023-01-01'),
+        ('percentNewUsers', '20', '2023-01-01'),
+        ('percentNewUsers', '40', '2023-01-01'),
+        ('newUsers', '4', '2023-01-01'),
+        ('newUsers', '6', '2023-01-01'),
+    ]
+    db.executemany(
+        "INSERT INTO report_data (report_db_id, metric_name, metric_value, data_date) VALUES (1, ?, ?, ?);",
+        rows,
+        commit=True
+    )
+    
+    # Execute
+    series = ReportData.get_time_series_for_metrics(
+        db, 1, ['averageSessionDuration', 'userEngagementRate', 'percentNewUsers', 'newUsers']
+    )
+    
+    # Assert
+    assert series['averageSessionDuration'] == {'2023-01-01': pytest.approx(90.0)}
+    assert series['userEngagementRate'] == {'2023-01-01': pytest.approx(0.6)}
+    assert series['percentNewUsers'] == {'2023-01-01': pytest.approx(30.0)}
+    assert series['newUsers'] == {'2023-01-01': 10.0}
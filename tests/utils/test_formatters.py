@@ -3,7 +3,9 @@ import datetime
 from app.utils.formatters import (
     format_number, format_percentage, format_date, format_duration,
     format_file_size, format_metric_name, data_to_csv, data_to_json,
-    format_dimension_value, format_ga4_report_data
+    format_dimension_value, format_ga4_report_data, get_all_time_series, get_header_indexes,
+    get_top_items, get_top_items_by_dimensions, group_rows_by_dimension,
+    is_average_metric, is_percentage_metric
 )
 
 class TestFormatters(unittest.TestCase):
@@ -192,5 +194,131 @@ class TestFormatters(unittest.TestCase):
         self.assertEqual(formatted_data[0]['averageSessionDuration'], '2m 0s')  # Should be formatted as duration
 
 
+    def test_get_top_items(self):
+        """Test selecting the top dimension values by a metric."""
+        report_data = {
+            'dimensionHeaders': [{'name': 'pagePath'}],
+            'metricHeaders': [{'name': 'sessions'}, {'name': 'screenPageViews'}],
+            'rows': [
+                {'dimensionValues': [{'value': '/a'}], 'metricValues': [{'value': '5'}, {'value': '10'}]},
+                {'dimensionValues': [{'value': '/b'}], 'metricValues': [{'value': '1'}, {'value': '30'}]},
+                {'dimensionValues': [{'value': '/c'}], 'metricValues': [{'value': '3'}, {'value': 'n/a'}]},
+                {'dimensionValues': [{'value': '/d'}], 'metricValues': [{'value': '9'}, {'value': '20'}]}
+            ]
+        }
+        
+        top = get_top_items(report_data, 'pagePath', 'screenPageViews', limit=2)
+        self.assertEqual(top, [
+            {'dimension': '/b', 'metric': 30.0},
+            {'dimension': '/d', 'metric': 20.0}
+        ])
+        
+        # Unparseable values rank as zero
+        self.assertEqual(get_top_items(report_data, 'pagePath', 'screenPageViews')[-1],
+                         {'dimension': '/c', 'metric': 0.0})
+        
+        # Unknown dimension or metric
+        self.assertEqual(get_top_items(report_data, 'country', 'sessions'), [])
+        self.assertEqual(get_top_items(report_data, 'pagePath', 'totalUsers'), [])
+
+    def test_get_header_indexes(self):
+        """Test mapping header names to column positions."""
+        report_data = {
+            'dimensionHeaders': [{'name': 'date'}, {'name': 'pagePath'}],
+            'metricHeaders': [{'name': 'sessions'}],
+            'rows': [
+                {'dimensionValues': [{'value': '20230101'}, {'value': '/a'}], 'metricValues': [{'value': '4'}]}
+            ]
+        }
+        
+        indexes = get_header_indexes(report_data)
+        self.assertEqual(indexes, ({'date': 0, 'pagePath': 1}, {'sessions': 0}))
+        self.assertEqual(get_header_indexes({}), ({}, {}))
+        
+        # Precomputed indexes give the same result as computing them on the fly
+        self.assertEqual(get_top_items(report_data, 'pagePath', 'sessions', header_indexes=indexes),
+                         [{'dimension': '/a', 'metric': 4.0}])
+
+    def test_group_rows_by_dimension(self):
+        """Test grouping report rows by a dimension value."""
+        rows = [
+            {'dimensionValues': [{'value': '/a'}, {'value': 'mobile'}], 'metricValues': [{'value': '1'}]},
+            {'dimensionValues': [{'value': '/b'}, {'value': 'mobile'}], 'metricValues': [{'value': '2'}]},
+            {'dimensionValues': [{'value': '/a'}, {'value': 'desktop'}], 'metricValues': [{'value': '3'}]}
+        ]
+        report_data = {
+            'dimensionHeaders': [{'name': 'pagePath'}, {'name': 'deviceCategory'}],
+            'metricHeaders': [{'name': 'sessions'}],
+            'rows': rows
+        }
+        
+        groups = group_rows_by_dimension(report_data, 'pagePath')
+        self.assertEqual(list(groups), ['/a', '/b'])
+        self.assertEqual(groups['/a'], [rows[0], rows[2]])
+        self.assertEqual(groups['/b'], [rows[1]])
+        
+        # Unknown dimension
+        self.assertEqual(group_rows_by_dimension(report_data, 'country'), {})
+
+    def test_get_top_items_by_dimensions(self):
+        """Test ranking several dimensions by summed metric values."""
+        report_data = {
+            'dimensionHeaders': [{'name': 'sessionSource'}, {'name': 'deviceCategory'}],
+            'metricHeaders': [{'name': 'sessions'}],
+            'rows': [
+                {'dimensionValues': [{'value': 'google'}, {'value': 'mobile'}], 'metricValues': [{'value': '5'}]},
+                {'dimensionValues': [{'value': 'bing'}, {'value': 'desktop'}], 'metricValues': [{'value': '8'}]},
+                {'dimensionValues': [{'value': 'google'}, {'value': 'desktop'}], 'metricValues': [{'value': '4'}]},
+                {'dimensionValues': [{'value': 'direct'}, {'value': 'mobile'}], 'metricValues': [{'value': 'n/a'}]}
+            ]
+        }
+        
+        top = get_top_items_by_dimensions(report_data, ['sessionSource', 'deviceCategory', 'country'],
+                                          'sessions', limit=2)
+        self.assertEqual(top, {
+            'sessionSource': [{'dimension': 'google', 'metric': 9.0}, {'dimension': 'bing', 'metric': 8.0}],
+            'deviceCategory': [{'dimension': 'desktop', 'metric': 12.0}, {'dimension': 'mobile', 'metric': 5.0}]
+        })
+        
+        # Unknown metric
+        self.assertEqual(get_top_items_by_dimensions(report_data, ['sessionSource'], 'totalUsers'), {})
+    
+    def test_get_all_time_series(self):
+        """Test building per-date series for several metrics in one pass."""
+        report_data = {
+            'dimensionHeaders': [{'name': 'date'}, {'name': 'pagePath'}],
+            'metricHeaders': [{'name': 'activeUsers'}, {'name': 'sessions'}],
+            'rows': [
+                {'dimensionValues': [{'value': '20230915'}, {'value': '/'}],
+                 'metricValues': [{'value': '10'}, {'value': '12'}]},
+                {'dimensionValues': [{'value': '20230916'}, {'value': '/'}],
+                 'metricValues': [{'value': '7'}, {'value': 'n/a'}]},
+                {'dimensionValues': [{'value': '20230915'}, {'value': '/pricing'}],
+                 'metricValues': [{'value': '3'}, {'value': '4'}]}
+            ]
+        }
+        
+        series = get_all_time_series(report_data, ['activeUsers', 'sessions', 'totalUsers'])
+        self.assertEqual(series, {
+            'activeUsers': {'20230915': 13.0, '20230916': 7.0},
+            'sessions': {'20230915': 16.0, '20230916': 0.0}
+        })
+        
+        # No date dimension
+        self.assertEqual(get_all_time_series(report_data, ['sessions'], date_dimension='dateHour'), {})
+    
+    def test_metric_kind_predicates(self):
+        """Test classifying metrics as percentages or averages."""
+        self.assertTrue(is_percentage_metric('bounceRate'))
+        self.assertTrue(is_percentage_metric('percentNewUsers'))
+        self.assertFalse(is_percentage_metric('averageSessionDuration'))
+        
+        for name in ('userEngagementRate', 'percentNewUsers', 'averageSessionDuration',
+                     'userEngagementDuration', 'screenPageViewsPerSession', 'sessionsPerUser'):
+            self.assertTrue(is_average_metric(name), name)
+        for name in ('sessions', 'activeUsers', 'screenPageViews', 'conversions'):
+            self.assertFalse(is_average_metric(name), name)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
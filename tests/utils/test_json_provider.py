@@ -0,0 +1,49 @@
+"""
+Unit tests for the orjson-backed Flask JSON provider.
+"""
+
+import datetime
+import decimal
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.utils.json_provider import ORJSON_AVAILABLE, OrjsonJSONProvider, init_json_provider
+
+pytestmark = pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+
+
+class TestOrjsonJSONProvider:
+    """Tests for the OrjsonJSONProvider class."""
+
+    def test_dumps_matches_default_provider(self):
+        """Test that values round-trip the same way as Flask's default provider."""
+        app = Flask(__name__)
+        provider = OrjsonJSONProvider(app)
+        default = DefaultJSONProvider(app)
+        data = {
+            'b': 1,
+            'a': [1.5, None, True],
+            'date': datetime.date(2023, 1, 15),
+            'amount': decimal.Decimal('12.50')
+        }
+
+        assert provider.loads(provider.dumps(data)) == default.loads(default.dumps(data))
+        assert provider.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+    def test_loads_accepts_text_and_bytes(self):
+        """Test parsing JSON from str and bytes."""
+        provider = OrjsonJSONProvider(Flask(__name__))
+
+        assert provider.loads('{"a": [1, 2]}') == {'a': [1, 2]}
+        assert provider.loads(b'{"a": "\xc3\xa9"}') == {'a': 'é'}
+
+    def test_init_json_provider(self):
+        """Test installing the provider and serving jsonify responses."""
+        app = Flask(__name__)
+        init_json_provider(app)
+
+        assert isinstance(app.json, OrjsonJSONProvider)
+        with app.app_context():
+            response = app.json.response({'sessions': 10})
+        assert response.get_json() == {'sessions': 10}